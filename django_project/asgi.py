@@ -12,5 +12,8 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "django_project.settings")
+# Serve the read-heavy pages with the async views (ASYNC_VIEWS=0 keeps the sync
+# ones, which Django then runs in a worker thread per request).
+os.environ.setdefault("ASYNC_VIEWS", "1")
 
 application = get_asgi_application()
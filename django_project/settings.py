@@ -63,15 +63,21 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "inventory",
-    "crispy_forms"
+    "crispy_forms",
+    "rest_framework",
+    "django_filters",
 ]
 
 MIDDLEWARE = [
+    "inventory.middleware.RequestMetricsMiddleware",
+    "inventory.middleware.SlowQueryLogMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "inventory.middleware.ProfilingMiddleware",
+    "inventory.middleware.ReplicaRoutingMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -84,13 +90,24 @@ TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [os.path.join(BASE_DIR, 'templates')],
-        "APP_DIRS": True,
         "OPTIONS": {
             "context_processors": [
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
+                "inventory.context_processors.user_role",
+            ],
+            # Templates are parsed once per process and reused. In development
+            # the autoreloader clears the cache when a template changes.
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
             ],
         },
     },
@@ -101,13 +118,199 @@ WSGI_APPLICATION = "django_project.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
-DATABASES = {
+# Configured from the environment. DB_ENGINE is "sqlite" (the default) or
+# "postgresql"; any other value is used as a backend path. inventory.db.sqlite3
+# is Django's SQLite backend with WAL, tuned pragmas and BEGIN IMMEDIATE
+# transactions; see inventory/db/sqlite3/base.py.
+#   DB_NAME, DB_USER, DB_PASSWORD, DB_HOST, DB_PORT: connection parameters.
+#   DB_CONN_MAX_AGE: seconds to keep a connection open between requests.
+#   DB_CONN_HEALTH_CHECKS: "1" to check persistent connections before reuse.
+#   DB_POOL: "1" for psycopg 3 connection pooling (Django 5.1+), sized by
+#     DB_POOL_MIN_SIZE/DB_POOL_MAX_SIZE; persistent connections are then off.
+#   DB_DISABLE_SERVER_SIDE_CURSORS: "1" behind a transaction-mode pooler
+#     such as PgBouncer, which cannot hold the cursors used by exports.
+
+DB_ENGINES = {
+    "sqlite": "inventory.db.sqlite3",
+    "postgresql": "django.db.backends.postgresql",
+}
+
+DB_ENGINE = DB_ENGINES.get(
+    os.environ.get("DB_ENGINE", "sqlite"), os.environ.get("DB_ENGINE")
+)
+
+if DB_ENGINE == DB_ENGINES["sqlite"]:
+    DATABASES = {
+        "default": {
+            "ENGINE": DB_ENGINE,
+            "NAME": os.environ.get("DB_NAME", BASE_DIR / "db.sqlite3"),
+        }
+    }
+else:
+    DATABASES = {
+        "default": {
+            "ENGINE": DB_ENGINE,
+            "NAME": os.environ.get("DB_NAME", "inventory"),
+            "USER": os.environ.get("DB_USER", ""),
+            "PASSWORD": os.environ.get("DB_PASSWORD", ""),
+            "HOST": os.environ.get("DB_HOST", ""),
+            "PORT": os.environ.get("DB_PORT", ""),
+            "CONN_MAX_AGE": int(os.environ.get("DB_CONN_MAX_AGE", 60)),
+            "CONN_HEALTH_CHECKS": os.environ.get("DB_CONN_HEALTH_CHECKS", "1") == "1",
+            "DISABLE_SERVER_SIDE_CURSORS": (
+                os.environ.get("DB_DISABLE_SERVER_SIDE_CURSORS") == "1"
+            ),
+            "OPTIONS": {},
+        }
+    }
+    if os.environ.get("DB_POOL") == "1":
+        DATABASES["default"]["CONN_MAX_AGE"] = 0
+        DATABASES["default"]["OPTIONS"]["pool"] = {
+            "min_size": int(os.environ.get("DB_POOL_MIN_SIZE", 2)),
+            "max_size": int(os.environ.get("DB_POOL_MAX_SIZE", 10)),
+        }
+
+# A read replica, configured with DB_REPLICA_NAME and/or DB_REPLICA_HOST and
+# otherwise sharing the primary's settings. With SQLite, DB_REPLICA_NAME is a
+# second database file, which is enough to exercise the routing locally.
+# ReplicaRouter sends the reads of the views matched by INVENTORY_REPLICA_VIEWS
+# (URL name patterns) to it; a client that has just written reads from the
+# primary for INVENTORY_REPLICA_STICKY_SECONDS.
+
+if os.environ.get("DB_REPLICA_NAME") or os.environ.get("DB_REPLICA_HOST"):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "NAME": os.environ.get("DB_REPLICA_NAME", DATABASES["default"]["NAME"]),
+        "HOST": os.environ.get(
+            "DB_REPLICA_HOST", DATABASES["default"].get("HOST", "")
+        ),
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_ROUTERS = ["inventory.routers.ReplicaRouter"]
+
+INVENTORY_REPLICA_DATABASE = "replica"
+
+INVENTORY_REPLICA_VIEWS = [r"_list$", r"^search_", r"^export_rows$", r"-list$"]
+
+INVENTORY_REPLICA_STICKY_SECONDS = 5
+
+# DB_TEST_CLUSTER=1 runs the test suite on a throwaway PostgreSQL cluster.
+
+TEST_RUNNER = "inventory.testing.TestRunner"
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+
+# CACHE_BACKEND is "locmem" (the default, per process) or "file", which shares
+# the cache between processes through the CACHE_LOCATION directory. The
+# list/search pages are cached until a write bumps their model's version; see
+# inventory/caching.py.
+
+CACHE_BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+}
+
+CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "locmem")
+
+CACHES = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+        "BACKEND": CACHE_BACKENDS.get(CACHE_BACKEND, CACHE_BACKEND),
+        "LOCATION": os.environ.get(
+            "CACHE_LOCATION",
+            str(BASE_DIR / "cache") if CACHE_BACKEND == "file" else "inventory",
+        ),
+        "OPTIONS": {"MAX_ENTRIES": int(os.environ.get("CACHE_MAX_ENTRIES", 10000))},
     }
 }
 
+INVENTORY_VIEW_CACHE = "default"
+
+INVENTORY_VIEW_CACHE_TIMEOUT = 24 * 60 * 60
+
+# Per-view request metrics, reported to superusers at /metrics/. A statement
+# repeated INVENTORY_METRICS_DUPLICATE_THRESHOLD times in one request is
+# reported as a likely N+1 query.
+
+INVENTORY_METRICS_ENABLED = True
+
+INVENTORY_METRICS_SAMPLES = 1024
+
+INVENTORY_METRICS_DUPLICATE_THRESHOLD = 5
+
+# Request profiling: superusers add ?__profile=1 (INVENTORY_PROFILER),
+# ?__profile=cprofile or ?__profile=sample to any URL, and
+# INVENTORY_PROFILE_SAMPLE_RATE profiles that fraction of all requests.
+# Profiles are listed to superusers at /profiles/.
+
+INVENTORY_PROFILER = "cprofile"
+
+INVENTORY_PROFILE_SAMPLE_RATE = float(os.environ.get("PROFILE_SAMPLE_RATE", 0))
+
+INVENTORY_PROFILE_INTERVAL = 0.005
+
+INVENTORY_PROFILE_DIR = os.environ.get("PROFILE_DIR", str(BASE_DIR / "profiles"))
+
+INVENTORY_PROFILE_KEEP = 200
+
+# Statements slower than INVENTORY_SLOW_QUERY_MS (None disables the check) are
+# logged with their view, stack frame and query plan as JSON lines to
+# SLOW_QUERY_LOG, rotated at 10 MB. Summarise with manage.py slow_query_report.
+# SLOW_QUERY_MS set to "off" or to an empty value turns the log off.
+
+SLOW_QUERY_MS = os.environ.get("SLOW_QUERY_MS", "200").strip()
+INVENTORY_SLOW_QUERY_MS = (
+    None if SLOW_QUERY_MS.lower() in ("", "off") else float(SLOW_QUERY_MS)
+)
+
+INVENTORY_SLOW_QUERY_LOG = os.environ.get(
+    "SLOW_QUERY_LOG", str(BASE_DIR / "slow_queries.jsonl")
+)
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {"message": {"format": "%(message)s"}},
+    "handlers": {
+        "slow_queries": {
+            "class": "logging.handlers.RotatingFileHandler",
+            "filename": INVENTORY_SLOW_QUERY_LOG,
+            "maxBytes": 10 * 1024 * 1024,
+            "backupCount": 5,
+            "delay": True,
+            "formatter": "message",
+        },
+    },
+    "loggers": {
+        "inventory.slow_queries": {
+            "handlers": ["slow_queries"],
+            "level": "WARNING",
+            "propagate": False,
+        },
+    },
+}
+
+# run_benchmarks writes one JSON file per run here, named after the time and
+# commit; compare two runs with run_benchmarks --compare <earlier file>.
+
+INVENTORY_BENCHMARK_DIR = os.environ.get(
+    "BENCHMARK_DIR", str(BASE_DIR / "benchmarks" / "results")
+)
+
+# The list, search and detail URLs route to the async views in
+# inventory/async_views.py when ASYNC_VIEWS=1, which asgi.py sets by default;
+# under WSGI they stay on the sync views in inventory/views.py.
+
+INVENTORY_ASYNC_VIEWS = os.environ.get("ASYNC_VIEWS") == "1"
+
+# Live stock feed (inventory/stockfeed.py): the broker class, and how long a
+# stream lets a burst of committed changes settle before sending one delta.
+
+INVENTORY_STOCK_FEED_BACKEND = "inventory.stockfeed.LocalBroker"
+
+INVENTORY_STOCK_FEED_COALESCE = 0.25
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -150,3 +353,34 @@ STATICFILES_DIRS = [
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+# Keyset pagination for the list views
+# Default rows per page and the upper bound accepted from ?page_size=
+
+INVENTORY_PAGE_SIZE = int(os.environ.get("INVENTORY_PAGE_SIZE", 50))
+
+INVENTORY_MAX_PAGE_SIZE = 500
+
+# Search
+# Maximum number of ranked rows returned by the search_* views. The backend is
+# picked from the database vendor unless INVENTORY_SEARCH_BACKEND names a class.
+
+INVENTORY_SEARCH_LIMIT = 100
+
+# REST API
+# Session auth serves the browser UI; basic auth serves scripted integrations.
+
+REST_FRAMEWORK = {
+    "DEFAULT_AUTHENTICATION_CLASSES": [
+        "rest_framework.authentication.SessionAuthentication",
+        "rest_framework.authentication.BasicAuthentication",
+    ],
+    "DEFAULT_PERMISSION_CLASSES": [
+        "rest_framework.permissions.IsAuthenticated",
+    ],
+    "LIST_SERIALIZER_ERRORS_AS_DICT": True,
+}
+
+# Largest array accepted by the /bulk/ endpoints of the line-item models.
+
+INVENTORY_BULK_MAX_ITEMS = 1000
@@ -15,16 +15,94 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
+from django.conf import settings
 from django.contrib import admin
-from django.urls import path
-from inventory import views
+from django.urls import include, path
+from inventory import async_views, views
+from inventory.api import router
 from inventory.views import user_login
 
+# The read-heavy list, search and detail pages, sync or async.
+pages = async_views if settings.INVENTORY_ASYNC_VIEWS else views
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path('login/', user_login, name="login"),
     path("product/add_product", views.add_product, name="add_product"),
-    path("product/<int:pk>/update/", views.update_product, name="update_product"),
-    path("product/search_product", views.search_product, name="search_product"),
+    path(
+        "product/<int:product_id>/update/",
+        views.update_product,
+        name="update_product",
+    ),
+    path("product/search_product", pages.search_product, name="search_product"),
+    path("supplier/search_supplier", pages.search_supplier, name="search_supplier"),
+    path("warehouse/search_warehouse", pages.search_warehouse, name="search_warehouse"),
+    path("inventory/search_inventory", pages.search_inventory, name="search_inventory"),
+    path("order/search_order", pages.search_order, name="search_order"),
+    path(
+        "order_detail/search_order_detail",
+        pages.search_order_detail,
+        name="search_order_detail",
+    ),
+    path(
+        "product_supplier/search_product_supplier",
+        pages.search_product_supplier,
+        name="search_product_supplier",
+    ),
+    path("customer/search_customer", pages.search_customer, name="search_customer"),
+    path(
+        "customer_order/search_customer_order",
+        pages.search_customer_order,
+        name="search_customer_order",
+    ),
+    path("shipment/search_shipment", pages.search_shipment, name="search_shipment"),
+    path(
+        "shipment_detail/search_shipment_detail",
+        pages.search_shipment_detail,
+        name="search_shipment_detail",
+    ),
+    path(
+        "customer_order_detail/search_customer_order_detail",
+        pages.search_customer_order_detail,
+        name="search_customer_order_detail",
+    ),
     path("supplier/add_supplier/", views.add_supplier, name="add_supplier"),
+    path("product/", pages.product_list, name="product_list"),
+    path("supplier/", pages.supplier_list, name="supplier_list"),
+    path("product_supplier/", pages.product_supplier_list, name="product_supplier_list"),
+    path("warehouse/", pages.warehouse_list, name="warehouse_list"),
+    path("inventory/", pages.inventory_list, name="inventory_list"),
+    path("order/", pages.order_list, name="order_list"),
+    path("order_detail/", pages.order_detail_list, name="order_detail_list"),
+    path("customer/", pages.customer_list, name="customer_list"),
+    path("customer_order/", pages.customer_order_list, name="customer_order_list"),
+    path("shipment/", pages.shipment_list, name="shipment_list"),
+    path("shipment_detail/", pages.shipment_detail_list, name="shipment_detail_list"),
+    path("stock_adjustment/", pages.stock_adjustment_list, name="stock_adjustment_list"),
+    path(
+        "inventory_transaction/",
+        pages.inventory_transaction_list,
+        name="inventory_transaction_list",
+    ),
+    path("task/", pages.task_list, name="task_list"),
+    path("task/<int:pk>/", pages.task_detail, name="task_detail"),
+    path("event/", pages.event_list, name="event_list"),
+    path("event/<int:pk>/", pages.event_details, name="event_details"),
+    path(
+        "warehouse/<int:warehouse_id>/stock/events/",
+        async_views.stock_events,
+        name="stock_events",
+    ),
+    path(
+        "warehouse/<int:warehouse_id>/stock/poll/",
+        async_views.stock_poll,
+        name="stock_poll",
+    ),
+    path("email/compose/", views.admin_compose_email, name="admin_compose_email"),
+    path("import/", views.import_data_upload, name="import_data_upload"),
+    path("export/<str:name>/", views.export_rows, name="export_rows"),
+    path("metrics/", views.metrics_report, name="metrics_report"),
+    path("profiles/", views.profile_list, name="profile_list"),
+    path("profiles/<str:name>", views.profile_download, name="profile_download"),
+    path("api/", include(router.urls)),
 ]
@@ -29,7 +29,8 @@ from .models import (
     Event,
     EmailAttachment,
     SalesTransaction,
-    Accountant
+    Accountant,
+    StockLevel
 )
 
 from .forms import (
@@ -68,6 +69,7 @@ admin.site.register(InventoryTransaction)
 admin.site.register(EmailAttachment)
 admin.site.register(Accountant)
 admin.site.register(SalesTransaction)
+admin.site.register(StockLevel)
 
 
 @admin.register(Task)
@@ -0,0 +1,463 @@
+"""
+@Description: REST API for the inventory models, built on the serializers in serializers.py.
+Every list endpoint is cursor paginated in the same order as the HTML list views, filterable with django-filter on foreign keys, choice, boolean and date fields, searchable with ?query= through the search backends, and accepts ?fields= to return only some fields.
+The line-item endpoints also accept whole arrays at <endpoint>/bulk/, validated together and written with one bulk_create/bulk_update in one transaction.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+from django.conf import settings
+from django.db import models, router as db_router, transaction
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import permissions, serializers, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+from rest_framework.routers import DefaultRouter
+
+from .models import (
+    User,
+    Product,
+    Supplier,
+    ProductSupplier,
+    Warehouse,
+    Inventory,
+    Order,
+    OrderDetail,
+    Customer,
+    CustomerOrder,
+    CustomerOrderDetail,
+    Shipment,
+    ShipmentDetail,
+    StockAdjustment,
+    InventoryTransaction,
+    StockLevel,
+    Task,
+    Event,
+    SalesTransaction,
+)
+from .caching import bump_version
+from .pagination import get_page_size
+from .relations import RELATIONS
+from .search import SEARCH_FIELDS, filter_queryset
+from .serializers import (
+    UserSerializer,
+    ProductSerializer,
+    SupplierSerializer,
+    ProductSupplierSerializer,
+    WarehouseSerializer,
+    InventorySerializer,
+    OrderSerializer,
+    OrderDetailSerializer,
+    CustomerSerializer,
+    CustomerOrderSerializer,
+    CustomerOrderDetailSerializer,
+    ShipmentSerializer,
+    ShipmentDetailSerializer,
+    StockAdjustmentSerializer,
+    InventoryTransactionSerializer,
+    StockLevelSerializer,
+    TaskSerializer,
+    EventSerializer,
+    SalesTransactionSerializer,
+)
+
+
+def filter_fields(model):
+    """
+    @Description: Picks the fields of model that are useful to filter on exactly or by range.
+    @Param: model (Model): The model behind a viewset.
+    @Return: dict: A django-filter filterset_fields mapping.
+    """
+    fields = {}
+    for field in model._meta.concrete_fields:
+        if field.is_relation:
+            fields[field.name] = ["exact", "in"]
+        elif field.choices or isinstance(field, models.BooleanField):
+            fields[field.name] = ["exact"]
+        elif isinstance(field, models.DateField):
+            fields[field.name] = ["exact", "gte", "lte"]
+    return fields
+
+
+class InventoryCursorPagination(CursorPagination):
+    """
+    @Description: Cursor pagination ordered by the viewset's ordering, with the page size rules of the HTML list views.
+    """
+
+    page_size_query_param = "page_size"
+
+    def get_page_size(self, request):
+        return get_page_size(request)
+
+    def get_ordering(self, request, queryset, view):
+        return view.ordering
+
+
+class QuerySearchFilter(BaseFilterBackend):
+    """
+    @Description: Applies ?query= with the same matching as the search_* views.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get("query")
+        via = getattr(view, "search_via", None)
+        if not query or (via is None and queryset.model not in SEARCH_FIELDS):
+            return queryset
+        return filter_queryset(queryset, query, via=via)
+
+
+class SparseFieldsMixin:
+    """
+    @Description: Drops every serializer field not named in ?fields= (comma separated) from read responses.
+    """
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        requested = self.request.query_params.get("fields") if self.request else None
+        if requested and self.request.method in permissions.SAFE_METHODS:
+            keep = {name.strip() for name in requested.split(",")}
+            fields = getattr(serializer, "child", serializer).fields
+            for name in set(fields) - keep:
+                fields.pop(name)
+        return serializer
+
+
+DEFAULT_BULK_MAX_ITEMS = 1000
+
+
+class CachedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    @Description: A PrimaryKeyRelatedField that resolves ids from objects BulkListSerializer loaded for the whole request instead of querying per item.
+    """
+
+    cache = None
+
+    def to_internal_value(self, data):
+        if self.cache is None:
+            return super().to_internal_value(data)
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            return self.cache[int(data)]
+        except KeyError:
+            self.fail("does_not_exist", pk_value=data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+
+def _item_id(item):
+    try:
+        return int(item["id"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class BulkListSerializer(serializers.ListSerializer):
+    """
+    @Description: Validates an array of items against one child serializer and writes them with a single bulk_create or bulk_update.
+    For updates the instance is a dictionary of the existing rows keyed by id, and every item must carry its id.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            self.preload(data)
+        self.targets = []
+        return super().to_internal_value(data)
+
+    def preload(self, items):
+        for name, field in self.child.fields.items():
+            if not isinstance(field, CachedPrimaryKeyRelatedField) or field.read_only:
+                continue
+            ids = set()
+            for item in items:
+                try:
+                    ids.add(int(item[name]))
+                except (KeyError, TypeError, ValueError):
+                    pass
+            field.cache = field.get_queryset().in_bulk(ids)
+
+    def run_child_validation(self, data):
+        if self.instance is not None:
+            target = self.instance.get(_item_id(data))
+            if target is None:
+                raise serializers.ValidationError({"id": ["No row with this id."]})
+            self.child.instance = target
+            self.child.initial_data = data
+        validated = super().run_child_validation(data)
+        if self.instance is not None:
+            self.targets.append(target)
+        return validated
+
+    def create(self, validated_data):
+        model = self.child.Meta.model
+        return model._default_manager.bulk_create(
+            [model(**attrs) for attrs in validated_data]
+        )
+
+    def update(self, instance, validated_data):
+        fields = set()
+        for target, attrs in zip(self.targets, validated_data):
+            for name, value in attrs.items():
+                setattr(target, name, value)
+            fields.update(attrs)
+        if fields:
+            self.child.Meta.model._default_manager.bulk_update(
+                self.targets, sorted(fields)
+            )
+        return self.targets
+
+
+_bulk_serializers = {}
+
+
+def bulk_serializer(serializer_class):
+    """
+    @Description: Derives the bulk variant of a ModelSerializer: the same fields and validation, with related ids resolved per request and BulkListSerializer for many=True.
+    @Param: serializer_class (ModelSerializer): The serializer of a line-item model.
+    @Return: ModelSerializer: The derived serializer class.
+    """
+    if serializer_class not in _bulk_serializers:
+        meta = type(
+            "Meta",
+            (serializer_class.Meta,),
+            {"list_serializer_class": BulkListSerializer},
+        )
+        _bulk_serializers[serializer_class] = type(
+            f"Bulk{serializer_class.__name__}",
+            (serializer_class,),
+            {"Meta": meta, "serializer_related_field": CachedPrimaryKeyRelatedField},
+        )
+    return _bulk_serializers[serializer_class]
+
+
+class BulkMixin:
+    """
+    @Description: Adds <endpoint>/bulk/ to a viewset.
+    POST creates an array of items, PUT and PATCH update an array of items identified by their "id", and DELETE removes the rows listed in "ids". Nothing is written unless every item is valid; errors are returned keyed by the item's index.
+    """
+
+    def get_serializer_class(self):
+        if self.action == "bulk":
+            return bulk_serializer(super().get_serializer_class())
+        return super().get_serializer_class()
+
+    @action(
+        detail=False, methods=["post", "put", "patch", "delete"], url_path="bulk"
+    )
+    def bulk(self, request):
+        model = self.queryset.model
+        using = db_router.db_for_write(model)
+        if request.method == "DELETE":
+            return self.bulk_delete(request, using)
+
+        instances = None
+        if request.method in ("PUT", "PATCH") and isinstance(request.data, list):
+            ids = {_item_id(item) for item in request.data} - {None}
+            instances = self.get_queryset().using(using).in_bulk(ids)
+        serializer = self.get_serializer(
+            instances,
+            data=request.data,
+            many=True,
+            partial=request.method == "PATCH",
+            max_length=getattr(
+                settings, "INVENTORY_BULK_MAX_ITEMS", DEFAULT_BULK_MAX_ITEMS
+            ),
+        )
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        with transaction.atomic(using=using):
+            serializer.save()
+            bump_version(self.queryset.model, using=using)
+        return Response(
+            serializer.data,
+            status=status.HTTP_201_CREATED if instances is None else status.HTTP_200_OK,
+        )
+
+    def bulk_delete(self, request, using):
+        ids = request.data.get("ids") if isinstance(request.data, dict) else None
+        try:
+            ids = [int(pk) for pk in ids]
+        except (TypeError, ValueError):
+            return Response(
+                {"ids": ["A list of ids is required."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        with transaction.atomic(using=using):
+            deleted, counts = self.get_queryset().using(using).filter(pk__in=ids).delete()
+        return Response({"deleted": counts.get(self.queryset.model._meta.label, 0)})
+
+
+class InventoryViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
+    """
+    @Description: Base viewset for the inventory models.
+    @Attributes:
+        - ordering (tuple): The cursor ordering; matches the list view's keyset key.
+        - search_via (str): The foreign key ?query= searches through, as in the matching search view.
+    """
+
+    pagination_class = InventoryCursorPagination
+    filter_backends = [DjangoFilterBackend, QuerySearchFilter]
+    ordering = ("-created_at", "-id")
+    search_via = None
+
+    @property
+    def filterset_fields(self):
+        return filter_fields(self.queryset.model)
+
+    def get_queryset(self):
+        queryset = self.queryset.all()
+        # Serializers render foreign keys as ids, so only many-valued relations
+        # need loading; one query per relation keeps a page at O(1) queries.
+        relations = RELATIONS.get(queryset.model)
+        if relations and relations.prefetch:
+            queryset = queryset.prefetch_related(*relations.prefetch)
+        return queryset
+
+
+class ProductViewSet(InventoryViewSet):
+    queryset = Product.objects.all()
+    serializer_class = ProductSerializer
+
+
+class SupplierViewSet(InventoryViewSet):
+    queryset = Supplier.objects.all()
+    serializer_class = SupplierSerializer
+
+
+class ProductSupplierViewSet(InventoryViewSet):
+    queryset = ProductSupplier.objects.all()
+    serializer_class = ProductSupplierSerializer
+    ordering = ("-id",)
+    search_via = "product"
+
+
+class WarehouseViewSet(InventoryViewSet):
+    queryset = Warehouse.objects.all()
+    serializer_class = WarehouseSerializer
+
+
+class InventoryItemViewSet(InventoryViewSet):
+    queryset = Inventory.objects.all()
+    serializer_class = InventorySerializer
+    ordering = ("-id",)
+    search_via = "product"
+
+
+class OrderViewSet(InventoryViewSet):
+    queryset = Order.objects.all()
+    serializer_class = OrderSerializer
+    search_via = "supplier"
+
+
+class OrderDetailViewSet(BulkMixin, InventoryViewSet):
+    queryset = OrderDetail.objects.all()
+    serializer_class = OrderDetailSerializer
+    ordering = ("-id",)
+    search_via = "product"
+
+
+class CustomerViewSet(InventoryViewSet):
+    queryset = Customer.objects.all()
+    serializer_class = CustomerSerializer
+
+
+class CustomerOrderViewSet(InventoryViewSet):
+    queryset = CustomerOrder.objects.all()
+    serializer_class = CustomerOrderSerializer
+    search_via = "customer"
+
+
+class CustomerOrderDetailViewSet(BulkMixin, InventoryViewSet):
+    queryset = CustomerOrderDetail.objects.all()
+    serializer_class = CustomerOrderDetailSerializer
+    ordering = ("-id",)
+    search_via = "product"
+
+
+class ShipmentViewSet(InventoryViewSet):
+    queryset = Shipment.objects.all()
+    serializer_class = ShipmentSerializer
+
+
+class ShipmentDetailViewSet(BulkMixin, InventoryViewSet):
+    queryset = ShipmentDetail.objects.all()
+    serializer_class = ShipmentDetailSerializer
+    ordering = ("-id",)
+    search_via = "shipment"
+
+
+class StockAdjustmentViewSet(InventoryViewSet):
+    queryset = StockAdjustment.objects.all()
+    serializer_class = StockAdjustmentSerializer
+    ordering = ("-adjustment_date", "-id")
+
+
+class InventoryTransactionViewSet(InventoryViewSet):
+    queryset = InventoryTransaction.objects.all()
+    serializer_class = InventoryTransactionSerializer
+    ordering = ("-transaction_date", "-id")
+
+
+class StockLevelViewSet(SparseFieldsMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = StockLevel.objects.all()
+    serializer_class = StockLevelSerializer
+    pagination_class = InventoryCursorPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = filter_fields(StockLevel)
+    ordering = ("-id",)
+
+
+class TaskViewSet(InventoryViewSet):
+    queryset = Task.objects.all()
+    serializer_class = TaskSerializer
+    ordering = ("-id",)
+
+
+class EventViewSet(InventoryViewSet):
+    queryset = Event.objects.all()
+    serializer_class = EventSerializer
+    ordering = ("-start_time", "-id")
+
+
+class SalesTransactionViewSet(InventoryViewSet):
+    queryset = SalesTransaction.objects.all()
+    serializer_class = SalesTransactionSerializer
+    ordering = ("-transaction_date", "-transaction_id")
+
+
+class UserViewSet(SparseFieldsMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = User.objects.all()
+    serializer_class = UserSerializer
+    permission_classes = [permissions.IsAdminUser]
+    pagination_class = InventoryCursorPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ["role", "is_active"]
+    ordering = ("-id",)
+
+
+router = DefaultRouter()
+router.register("products", ProductViewSet)
+router.register("suppliers", SupplierViewSet)
+router.register("product-suppliers", ProductSupplierViewSet)
+router.register("warehouses", WarehouseViewSet)
+router.register("inventory", InventoryItemViewSet)
+router.register("orders", OrderViewSet)
+router.register("order-details", OrderDetailViewSet)
+router.register("customers", CustomerViewSet)
+router.register("customer-orders", CustomerOrderViewSet)
+router.register("customer-order-details", CustomerOrderDetailViewSet)
+router.register("shipments", ShipmentViewSet)
+router.register("shipment-details", ShipmentDetailViewSet)
+router.register("stock-adjustments", StockAdjustmentViewSet)
+router.register("inventory-transactions", InventoryTransactionViewSet)
+router.register("stock-levels", StockLevelViewSet)
+router.register("tasks", TaskViewSet)
+router.register("events", EventViewSet)
+router.register("sales-transactions", SalesTransactionViewSet)
+router.register("users", UserViewSet)
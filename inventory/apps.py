@@ -14,3 +14,11 @@ from django.apps import AppConfig
 class InventoryConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "inventory"
+
+    def ready(self):
+        from . import caching, search, slowlog, stockfeed
+
+        search.connect_signals()
+        caching.connect_signals()
+        slowlog.connect_signals()
+        stockfeed.connect_signals()
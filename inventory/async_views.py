@@ -0,0 +1,550 @@
+"""
+@Description: Async versions of the read-heavy views: the list, search and detail pages, and the live stock feed.
+Each view has the same name, template and context as its counterpart in views.py, so django_project/urls.py can route to either module (settings.INVENTORY_ASYNC_VIEWS, which asgi.py turns on). Rows are read with aiterator()/aget() and pages with apaginate(), but Django's async ORM still runs every query through sync_to_async in a thread bound to the request, so under ASGI the number of threads still follows the number of requests in flight. These views do not stop slow clients from tying up threads. With a 0.2 s client delay on one CPU and SQLite, they served 32/60/55 req/s at 8/32/128 concurrent requests against 31/69/80 req/s for the sync views under ASGI; with no delay, 91 against 78 req/s at 8 concurrent (manage.py load_test). Measure with load_test on the production database before relying on them; ASYNC_VIEWS=0 in the environment turns them off under asgi.py.
+stock_events and stock_poll serve the per-warehouse stock feed (see stockfeed.py) as Server-Sent Events or as long-poll JSON. They are async under WSGI too, but there a waiting poll holds a worker thread and an event stream only sends what it has and lets the browser reconnect, so serve them through asgi.py.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+import asyncio
+import functools
+
+from django.contrib.auth.views import redirect_to_login
+from django.http import (
+    Http404,
+    HttpResponse,
+    HttpResponseBadRequest,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from django.shortcuts import aget_object_or_404, render
+from django.views.decorators.http import require_GET
+
+from .caching import cache_page_versioned
+from .models import (
+    Customer,
+    CustomerOrder,
+    CustomerOrderDetail,
+    Event,
+    Inventory,
+    InventoryTransaction,
+    Order,
+    OrderDetail,
+    Product,
+    ProductSupplier,
+    Shipment,
+    ShipmentDetail,
+    StockAdjustment,
+    Supplier,
+    Task,
+    Warehouse,
+)
+from .pagination import apaginate
+from .relations import load_relations
+from .search import asearch
+from .stockfeed import (
+    RETRY_MS,
+    catch_up,
+    coalesce_seconds,
+    get_broker,
+    merge,
+    sse,
+    stream,
+)
+
+DEFAULT_POLL_SECONDS = 25
+MAX_POLL_SECONDS = 60
+
+
+def login_required(view):
+    """
+    @Description: login_required for the async views in this module.
+    django.contrib.auth's decorator only wraps coroutine functions from Django 5.1 on, and the project still supports 5.0. Anonymous users are redirected to settings.LOGIN_URL with ?next=, as they are by Django's decorator.
+    @Param: view (callable): An async view.
+    @Return: callable: The wrapped view.
+    """
+
+    @functools.wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        user = await request.auser()
+        if not user.is_authenticated:
+            return redirect_to_login(request.get_full_path())
+        return await view(request, *args, **kwargs)
+
+    return wrapper
+
+
+async def arender(request, template, context=None):
+    """
+    @Description: Renders a template from an async view.
+    The user is loaded first, so the templates' {{ user }} does not query the database from the event loop.
+    @Param: request (HttpRequest): The HTTP request object.
+    @Param: template (str): The template name.
+    @Param: context (dict): The template context.
+    @Return: HttpResponse: The rendered page.
+    """
+    request.user = await request.auser()
+    return render(request, template, context)
+
+
+async def list_page(request, queryset, template, name, keys=("created_at", "id")):
+    """
+    @Description: Renders one keyset page of queryset, as the sync list views do.
+    @Param: request (HttpRequest): The HTTP request object.
+    @Param: queryset (QuerySet): The rows to list.
+    @Param: template (str): The list template.
+    @Param: name (str): The context name of the rows.
+    @Param: keys (tuple): The keyset ordering, as for paginate().
+    @Return: HttpResponse: The rendered list page.
+    """
+    page = await apaginate(request, queryset, keys)
+    return await arender(request, template, {name: page.object_list, "page": page})
+
+
+async def search_page(request, queryset, template, name, via=None):
+    """
+    @Description: Renders the results of ?query= against queryset, or the empty search form.
+    @Param: request (HttpRequest): The HTTP request object.
+    @Param: queryset (QuerySet): The rows to search.
+    @Param: template (str): The search template.
+    @Param: name (str): The context name of the results.
+    @Param: via (str): The relation searched through, as for search().
+    @Return: HttpResponse: The rendered search page.
+    """
+    if request.method == "GET" and "query" in request.GET:
+        query = request.GET.get("query")
+        rows = await asearch(queryset, query, via=via)
+        return await arender(request, template, {name: rows, "query": query})
+    return await arender(request, template)
+
+
+@login_required
+@cache_page_versioned(Product)
+async def product_list(request):
+    """
+    @Description: Async version of views.product_list.
+    """
+    return await list_page(
+        request, Product.objects.all(), "product/product_list.html", "products"
+    )
+
+
+@login_required
+@cache_page_versioned(Supplier)
+async def supplier_list(request):
+    """
+    @Description: Async version of views.supplier_list.
+    """
+    return await list_page(
+        request, Supplier.objects.all(), "supplier/supplier_list.html", "suppliers"
+    )
+
+
+@login_required
+async def product_supplier_list(request):
+    """
+    @Description: Async version of views.product_supplier_list.
+    """
+    return await list_page(
+        request,
+        load_relations(ProductSupplier.objects.all()),
+        "product_supplier/product_supplier_list.html",
+        "product_suppliers",
+        keys=("id",),
+    )
+
+
+@login_required
+@cache_page_versioned(Warehouse)
+async def warehouse_list(request):
+    """
+    @Description: Async version of views.warehouse_list.
+    """
+    return await list_page(
+        request, Warehouse.objects.all(), "warehouse/warehouse_list.html", "warehouses"
+    )
+
+
+@login_required
+async def inventory_list(request):
+    """
+    @Description: Async version of views.inventory_list.
+    """
+    return await list_page(
+        request,
+        load_relations(Inventory.objects.all()),
+        "inventory/inventory_list.html",
+        "inventories",
+        keys=("id",),
+    )
+
+
+@login_required
+async def order_list(request):
+    """
+    @Description: Async version of views.order_list.
+    """
+    return await list_page(
+        request, load_relations(Order.objects.all()), "order/order_list.html", "orders"
+    )
+
+
+@login_required
+async def order_detail_list(request):
+    """
+    @Description: Async version of views.order_detail_list.
+    """
+    return await list_page(
+        request,
+        load_relations(OrderDetail.objects.all()),
+        "order_detail/order_detail_list.html",
+        "order_details",
+        keys=("id",),
+    )
+
+
+@login_required
+async def customer_list(request):
+    """
+    @Description: Async version of views.customer_list.
+    """
+    return await list_page(
+        request, Customer.objects.all(), "customer/customer_list.html", "customers"
+    )
+
+
+@login_required
+async def customer_order_list(request):
+    """
+    @Description: Async version of views.customer_order_list.
+    """
+    return await list_page(
+        request,
+        load_relations(CustomerOrder.objects.all()),
+        "customer_order/customer_order_list.html",
+        "customer_orders",
+    )
+
+
+@login_required
+async def shipment_list(request):
+    """
+    @Description: Async version of views.shipment_list.
+    """
+    return await list_page(
+        request, Shipment.objects.all(), "shipment/shipment_list.html", "shipments"
+    )
+
+
+@login_required
+async def shipment_detail_list(request):
+    """
+    @Description: Async version of views.shipment_detail_list.
+    """
+    return await list_page(
+        request,
+        load_relations(ShipmentDetail.objects.all()),
+        "shipment_detail/shipment_detail_list.html",
+        "shipment_details",
+        keys=("id",),
+    )
+
+
+@login_required
+async def stock_adjustment_list(request):
+    """
+    @Description: Async version of views.stock_adjustment_list.
+    """
+    return await list_page(
+        request,
+        load_relations(StockAdjustment.objects.all()),
+        "stock_adjustment/stock_adjustment_list.html",
+        "stock_adjustments",
+        keys=("adjustment_date", "id"),
+    )
+
+
+@login_required
+async def inventory_transaction_list(request):
+    """
+    @Description: Async version of views.inventory_transaction_list.
+    """
+    return await list_page(
+        request,
+        load_relations(InventoryTransaction.objects.all()),
+        "inventory_transaction/inventory_transaction_list.html",
+        "inventory_transactions",
+        keys=("transaction_date", "id"),
+    )
+
+
+@login_required
+async def task_list(request):
+    """
+    @Description: Async version of views.task_list.
+    """
+    return await list_page(
+        request,
+        load_relations(Task.objects.all()),
+        "task/task_list.html",
+        "tasks",
+        keys=("id",),
+    )
+
+
+@login_required
+async def event_list(request):
+    """
+    @Description: Async version of views.event_list.
+    """
+    return await list_page(
+        request,
+        load_relations(Event.objects.all()),
+        "event/event_list.html",
+        "event",
+        keys=("start_time", "id"),
+    )
+
+
+@login_required
+@cache_page_versioned(Product)
+async def search_product(request):
+    """
+    @Description: Async version of views.search_product.
+    """
+    return await search_page(
+        request, Product.objects.all(), "product/search_product.html", "products"
+    )
+
+
+@login_required
+@cache_page_versioned(Supplier)
+async def search_supplier(request):
+    """
+    @Description: Async version of views.search_supplier.
+    """
+    return await search_page(
+        request, Supplier.objects.all(), "supplier/search_supplier.html", "suppliers"
+    )
+
+
+@login_required
+@cache_page_versioned(Warehouse)
+async def search_warehouse(request):
+    """
+    @Description: Async version of views.search_warehouse.
+    """
+    return await search_page(
+        request,
+        Warehouse.objects.all(),
+        "warehouse/search_warehouse.html",
+        "warehouses",
+    )
+
+
+@login_required
+async def search_inventory(request):
+    """
+    @Description: Async version of views.search_inventory.
+    """
+    return await search_page(
+        request,
+        load_relations(Inventory.objects.all()),
+        "inventory/search_inventory.html",
+        "inventories",
+        via="product",
+    )
+
+
+@login_required
+async def search_order(request):
+    """
+    @Description: Async version of views.search_order.
+    """
+    return await search_page(
+        request,
+        load_relations(Order.objects.all()),
+        "order/search_order.html",
+        "orders",
+        via="supplier",
+    )
+
+
+@login_required
+async def search_order_detail(request):
+    """
+    @Description: Async version of views.search_order_detail.
+    """
+    return await search_page(
+        request,
+        load_relations(OrderDetail.objects.all()),
+        "order_detail/search_order_detail.html",
+        "order_details",
+        via="product",
+    )
+
+
+@login_required
+async def search_product_supplier(request):
+    """
+    @Description: Async version of views.search_product_supplier.
+    """
+    return await search_page(
+        request,
+        load_relations(ProductSupplier.objects.all()),
+        "product_supplier/search_product_supplier.html",
+        "product_suppliers",
+        via="product",
+    )
+
+
+@login_required
+async def search_customer(request):
+    """
+    @Description: Async version of views.search_customer.
+    """
+    return await search_page(
+        request, Customer.objects.all(), "customer/search_customer.html", "customers"
+    )
+
+
+@login_required
+async def search_customer_order(request):
+    """
+    @Description: Async version of views.search_customer_order.
+    """
+    return await search_page(
+        request,
+        load_relations(CustomerOrder.objects.all()),
+        "customer_order/search_customer_order.html",
+        "customer_orders",
+        via="customer",
+    )
+
+
+@login_required
+async def search_shipment(request):
+    """
+    @Description: Async version of views.search_shipment.
+    """
+    return await search_page(
+        request, Shipment.objects.all(), "shipment/search_shipment.html", "shipments"
+    )
+
+
+@login_required
+async def search_shipment_detail(request):
+    """
+    @Description: Async version of views.search_shipment_detail.
+    """
+    return await search_page(
+        request,
+        load_relations(ShipmentDetail.objects.all()),
+        "shipment_detail/search_shipment_detail.html",
+        "shipment_details",
+        via="shipment",
+    )
+
+
+@login_required
+async def search_customer_order_detail(request):
+    """
+    @Description: Async version of views.search_customer_order_detail.
+    """
+    return await search_page(
+        request,
+        load_relations(CustomerOrderDetail.objects.all()),
+        "customer_order_detail/search_customer_order_detail.html",
+        "customer_order_details",
+        via="product",
+    )
+
+
+@login_required
+async def task_detail(request, pk):
+    """
+    @Description: Async version of views.task_detail.
+    @Param: pk (int): The primary key of the task.
+    """
+    task = await aget_object_or_404(load_relations(Task.objects.all()), pk=pk)
+    return await arender(request, "task/task_detail.html", {"task": task})
+
+
+@login_required
+async def event_details(request, pk):
+    """
+    @Description: Async version of views.event_details.
+    @Param: pk (int): The primary key of the event.
+    """
+    event = await aget_object_or_404(load_relations(Event.objects.all()), pk=pk)
+    return await arender(request, "event/event_detail.html", {"event": event})
+
+
+async def existing_warehouse(warehouse_id):
+    if not await Warehouse.objects.filter(pk=warehouse_id).aexists():
+        raise Http404("No Warehouse matches the given query.")
+
+
+@login_required
+@require_GET
+async def stock_events(request, warehouse_id):
+    """
+    @Description: Streams a warehouse's stock changes as Server-Sent Events ("stock" deltas, "reset" when the page must be reloaded).
+    A reconnecting EventSource sends Last-Event-ID and resumes where it left off; ?cursor= does the same for other clients.
+    @Param: warehouse_id (int): The warehouse to follow.
+    @Return: StreamingHttpResponse: A text/event-stream response.
+    """
+    await existing_warehouse(warehouse_id)
+    broker = get_broker()
+    cursor = (
+        request.headers.get("Last-Event-ID")
+        or request.GET.get("cursor")
+        or broker.cursor()
+    )
+    if not hasattr(request, "scope"):
+        # Under WSGI the stream would hold a worker thread for its whole life;
+        # send what is there now and let the browser reconnect after RETRY_MS.
+        messages, cursor = catch_up(broker, warehouse_id, cursor)
+        content = sse(event_id=cursor, retry=RETRY_MS) + b"".join(messages)
+        response = HttpResponse(content, content_type="text/event-stream")
+    else:
+        response = StreamingHttpResponse(
+            stream(broker, warehouse_id, cursor), content_type="text/event-stream"
+        )
+    response["Cache-Control"] = "no-cache"
+    # Stop nginx from buffering the stream.
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+@login_required
+@require_GET
+async def stock_poll(request, warehouse_id):
+    """
+    @Description: Long-poll version of stock_events for clients without EventSource.
+    Waits up to ?timeout= seconds (default DEFAULT_POLL_SECONDS, at most MAX_POLL_SECONDS) for changes after ?cursor= and answers with their merged delta; poll again with the returned cursor.
+    @Param: warehouse_id (int): The warehouse to follow.
+    @Return: JsonResponse: {"cursor", "reset", "changes"}.
+    """
+    await existing_warehouse(warehouse_id)
+    try:
+        timeout = float(request.GET.get("timeout", DEFAULT_POLL_SECONDS))
+    except ValueError:
+        return HttpResponseBadRequest("Invalid timeout.")
+    timeout = min(max(timeout, 0), MAX_POLL_SECONDS)
+    broker = get_broker()
+    cursor = request.GET.get("cursor") or broker.cursor()
+    if await broker.wait(warehouse_id, cursor, timeout):
+        await asyncio.sleep(coalesce_seconds())
+    changes, cursor = broker.since(warehouse_id, cursor)
+    return JsonResponse(
+        {
+            "cursor": cursor,
+            "reset": changes is None,
+            "changes": merge(changes or []),
+        }
+    )
@@ -0,0 +1,529 @@
+"""
+@Description: Benchmark suite behind the run_benchmarks command, in the style of asv.
+Each benchmark has a setup that builds the work to time and returns it as a callable. The runner calls it once to warm up, picks how many calls make up one sample (at least min_time seconds) and records the min, median, mean and spread of repeat samples. The suite covers the list and search pages through the test client (with the page cache disabled, so every call runs the queries and renders), validation of every ModelForm in forms.py against an existing row, every serializer in serializers.py over a page of rows, and Order saves with the post_save signals and on_commit callbacks they trigger.
+A run leaves nothing behind in the database it measures: it runs in a transaction that is always rolled back, with a savepoint per benchmark, and the accounts it logs in with are created inside it. on_commit callbacks are run when the block that registered them ends, as a commit would.
+Results are plain JSON tagged with the commit, the machine and the dataset, so runs from different commits can be compared with compare().
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+import contextlib
+import copy
+import os
+import platform
+import re
+import statistics
+import subprocess
+import time
+from datetime import date, timedelta
+
+import django
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.forms import ModelForm
+from django.forms.models import model_to_dict
+from django.template import Origin
+from django.template.loaders.base import Loader
+from django.test import Client, TestCase, override_settings
+from django.urls import URLPattern, get_resolver
+from django.utils import timezone
+from rest_framework.serializers import ModelSerializer
+
+from . import async_views, forms, serializers, views
+from .models import (
+    Accountant,
+    EmailAttachment,
+    Event,
+    Order,
+    Product,
+    StockAdjustment,
+    Supplier,
+    Task,
+    User,
+    Warehouse,
+)
+from .relations import load_relations
+from .seeding import seed
+
+DEFAULT_REPEAT = 5
+DEFAULT_MIN_TIME = 0.05
+DEFAULT_ROWS = 100
+SEARCH_QUERY = "drill"
+CONFIRM_LINES = 5
+SUPPLEMENT_ROWS = 20
+
+# Form fields an existing row cannot supply, such as a new account's password.
+FORM_DATA = {
+    "UserForm": {
+        "username": "benchmarkuser",
+        "password1": "Stock-count-2026",
+        "password2": "Stock-count-2026",
+    },
+}
+
+# Context variables the list and search views pass their rows in.
+ROW_LISTS = (
+    "products", "suppliers", "product_suppliers", "warehouses", "inventories",
+    "orders", "order_details", "customers", "customer_orders",
+    "customer_order_details", "shipments", "shipment_details",
+    "stock_adjustments", "inventory_transactions", "tasks", "event",
+)
+FALLBACK_TEMPLATE = (
+    "<table>{% for row in page.object_list %}<tr><td>{{ row }}</td></tr>{% endfor %}"
+    + "".join(
+        f"{{% for row in {name} %}}<tr><td>{{{{ row }}}}</td></tr>{{% endfor %}}"
+        for name in ROW_LISTS
+    )
+    + '</table>{% if page %}{% include "pagination.html" %}{% endif %}'
+)
+
+
+class FallbackLoader(Loader):
+    """
+    @Description: Template loader of last resort for the benchmark run: any template the project does not ship renders every row of the view's list with str(), so the pages still run their queries and render each row.
+    """
+
+    def get_template_sources(self, template_name):
+        yield Origin(name=template_name, template_name=template_name, loader=self)
+
+    def get_contents(self, origin):
+        return FALLBACK_TEMPLATE
+
+
+class Benchmark:
+    """
+    @Description: One timed operation.
+    @Param: name (str): Unique name, "<group>.<subject>".
+    @Param: setup (callable): Returns (the callable to time, items one call processes), or raises Skip.
+    """
+
+    def __init__(self, name, setup):
+        self.name = name
+        self.setup = setup
+
+
+class Skip(Exception):
+    pass
+
+
+def measure(func, repeat=DEFAULT_REPEAT, min_time=DEFAULT_MIN_TIME):
+    """
+    @Description: Times func the way asv does: one warm-up call, a calibrated number of calls per sample, repeat samples.
+    @Return: dict: Seconds per call (min, median, mean, stdev) and the sampling parameters.
+    """
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    number = max(1, int(min_time / elapsed)) if elapsed < min_time else 1
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - started) / number)
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def members(module, base):
+    return [
+        value
+        for value in vars(module).values()
+        if isinstance(value, type)
+        and issubclass(value, base)
+        and value.__module__ == module.__name__
+    ]
+
+
+def page_views():
+    """
+    @Description: URL names of the project's list and search pages, from the root URLconf.
+    """
+    names = []
+    for pattern in get_resolver().url_patterns:
+        if (
+            isinstance(pattern, URLPattern)
+            and getattr(pattern.callback, "__module__", None)
+            in (views.__name__, async_views.__name__)
+            and re.search(r"_list$|^search_", pattern.name or "")
+            and pattern.name != "profile_list"
+        ):
+            names.append((pattern.name, str(pattern.pattern)))
+    return names
+
+
+def view_benchmarks(client):
+    def setup(path, data):
+        def setup():
+            response = client.get(path, data)
+            if response.status_code != 200:
+                raise Skip(f"HTTP {response.status_code}")
+            return (lambda: client.get(path, data)), 1
+
+        return setup
+
+    benchmarks = []
+    for name, route in page_views():
+        data = {"query": SEARCH_QUERY} if name.startswith("search_") else {}
+        benchmarks.append(Benchmark(f"views.{name}", setup("/" + route, data)))
+    return benchmarks
+
+
+def form_data(form_class, instance):
+    data = model_to_dict(
+        instance, fields=form_class._meta.fields, exclude=form_class._meta.exclude
+    )
+    data = {key: "" if value is None else value for key, value in data.items()}
+    return {**data, **FORM_DATA.get(form_class.__name__, {})}
+
+
+def form_benchmarks():
+    def setup(form_class):
+        def setup():
+            instance = form_class._meta.model._default_manager.order_by("pk").first()
+            if instance is None:
+                raise Skip("no rows")
+            data = form_data(form_class, instance)
+            return (lambda: form_class(data, instance=instance).is_valid()), 1
+
+        return setup
+
+    return [
+        Benchmark(f"forms.{form_class.__name__}", setup(form_class))
+        for form_class in members(forms, ModelForm)
+    ]
+
+
+def serializer_benchmarks(rows=DEFAULT_ROWS):
+    def setup(serializer_class):
+        def setup():
+            model = serializer_class.Meta.model
+            queryset = load_relations(model._default_manager.order_by("pk"))
+            instances = list(queryset[:rows])
+            if not instances:
+                raise Skip("no rows")
+            return (lambda: serializer_class(instances, many=True).data), len(instances)
+
+        return setup
+
+    return [
+        Benchmark(f"serializers.{serializer_class.__name__}", setup(serializer_class))
+        for serializer_class in members(serializers, ModelSerializer)
+    ]
+
+
+@contextlib.contextmanager
+def rolled_back(using=DEFAULT_DB_ALIAS):
+    """
+    @Description: Runs the block in a transaction (a savepoint when nested) that is rolled back when it ends, however it ends.
+    """
+    with transaction.atomic(using=using):
+        try:
+            yield
+        finally:
+            transaction.set_rollback(True, using=using)
+
+
+def committed(using=DEFAULT_DB_ALIAS):
+    """
+    @Description: Runs the on_commit callbacks registered in the block when it ends, since the run's transaction never commits.
+    """
+    return TestCase.captureOnCommitCallbacks(using=using, execute=True)
+
+
+def signal_benchmarks():
+    def administrator():
+        # create_task_for_new_order only does its work when an administrator exists.
+        if not User.objects.filter(role="Administrator").exists():
+            User.objects.create_user(username="benchmarkadmin", role="Administrator")
+        supplier = Supplier.objects.order_by("pk").first()
+        if supplier is None:
+            raise Skip("no suppliers")
+        return supplier
+
+    def save():
+        supplier = administrator()
+
+        def run():
+            with committed(), transaction.atomic():
+                Order.objects.create(order_date=date.today(), supplier=supplier)
+
+        return run, 1
+
+    def confirm():
+        supplier = administrator()
+        products = list(Product.objects.order_by("pk")[:CONFIRM_LINES])
+        lines = [{"product": product, "quantity": 3} for product in products]
+
+        def run():
+            with committed(), transaction.atomic():
+                order = Order.objects.create(order_date=date.today(), supplier=supplier)
+                order.confirm(lines)
+
+        return run, len(lines)
+
+    return [
+        Benchmark("signals.order_save", save),
+        Benchmark("signals.order_confirm", confirm),
+    ]
+
+
+def suite(client, rows=DEFAULT_ROWS):
+    return (
+        view_benchmarks(client)
+        + form_benchmarks()
+        + serializer_benchmarks(rows)
+        + signal_benchmarks()
+    )
+
+
+def with_fallback_templates():
+    """
+    @Description: A copy of settings.TEMPLATES with FallbackLoader as the last loader.
+    """
+    templates = copy.deepcopy(settings.TEMPLATES)
+    templates[0]["OPTIONS"].setdefault("loaders", []).append(
+        "inventory.benchmarks.FallbackLoader"
+    )
+    return templates
+
+
+@contextlib.contextmanager
+def benchmark_environment():
+    """
+    @Description: Settings for a run: the page cache is a dummy cache so every page request does the full work, the test client's host is allowed and templates the project does not ship fall back to FallbackLoader.
+    """
+    with override_settings(
+        CACHES={
+            **settings.CACHES,
+            "benchmark": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+        },
+        INVENTORY_VIEW_CACHE="benchmark",
+        INVENTORY_REPLICA_DATABASE=None,
+        INVENTORY_PROFILE_SAMPLE_RATE=0,
+        ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"],
+        TEMPLATES=with_fallback_templates(),
+    ):
+        yield
+
+
+@contextlib.contextmanager
+def scratch_database(path):
+    """
+    @Description: Points the default database at a new SQLite file for the duration, migrated and empty.
+    """
+    original = connections.settings[DEFAULT_DB_ALIAS]
+    engine = original["ENGINE"]
+    if "sqlite3" not in engine:
+        engine = "inventory.db.sqlite3"
+    connections[DEFAULT_DB_ALIAS].close()
+    connections.settings[DEFAULT_DB_ALIAS] = connections.configure_settings(
+        {DEFAULT_DB_ALIAS: {"ENGINE": engine, "NAME": path}}
+    )[DEFAULT_DB_ALIAS]
+    del connections[DEFAULT_DB_ALIAS]
+    try:
+        call_command("migrate", verbosity=0)
+        yield
+    finally:
+        connections[DEFAULT_DB_ALIAS].close()
+        connections.settings[DEFAULT_DB_ALIAS] = original
+        del connections[DEFAULT_DB_ALIAS]
+
+
+def prepare_dataset(scale, counts=None, stdout=None):
+    """
+    @Description: Seeds the default database at scale, refreshes what the generator leaves stale and adds the rows it does not generate.
+    @Return: dict: Rows written per model label.
+    """
+    written = seed(scale, counts=counts or {})
+    for command in ("rebuild_stock_levels", "rebuild_search_index"):
+        call_command(command, verbosity=0, stdout=stdout)
+    written.update(supplement())
+    return written
+
+
+def supplement(count=SUPPLEMENT_ROWS):
+    """
+    @Description: Adds a few users, tasks, events, stock adjustments and emails, which the generator leaves out, so every form and serializer has rows to work on.
+    @Return: dict: Rows written per model label.
+    """
+    now = timezone.now()
+    admin = User.objects.create_user(
+        username="benchmarkadmin",
+        email="admin@example.com",
+        password="benchmark",
+        role="Administrator",
+    )
+    Accountant.objects.create(
+        username="benchmark-accountant",
+        email="accountant@example.com",
+        first_name="Bench",
+        last_name="Mark",
+        password="benchmark",
+        user=get_user_model().objects.create_user(username="benchmark-accountant"),
+    )
+    products = list(Product.objects.order_by("pk")[:count])
+    warehouse = Warehouse.objects.order_by("pk").first()
+    for index, product in enumerate(products):
+        StockAdjustment.objects.create(
+            product=product,
+            warehouse=warehouse,
+            adjustment_date=now.date(),
+            quantity=index % 5 - 2 or 1,
+            reason="Cycle count",
+        )
+    Task.objects.bulk_create(
+        Task(
+            title=f"Task {index}",
+            description="Benchmark task",
+            due_date=now.date() + timedelta(days=index % 14),
+            assigned_to=admin,
+        )
+        for index in range(count)
+    )
+    for index in range(count):
+        event = Event.objects.create(
+            name=f"Event {index}",
+            description="Benchmark event",
+            start_time=now + timedelta(days=index),
+            end_time=now + timedelta(days=index, hours=1),
+            location="Manila",
+        )
+        event.participants.add(admin)
+    EmailAttachment.objects.bulk_create(
+        EmailAttachment(
+            customer_email=f"customer{index}@example.com",
+            subject=f"Order update {index}",
+            body="Your order has shipped.",
+        )
+        for index in range(count)
+    )
+    return {
+        model._meta.label: rows
+        for model, rows in (
+            (User, 1),
+            (Accountant, 1),
+            (StockAdjustment, len(products)),
+            (Task, count),
+            (Event, count),
+            (EmailAttachment, count),
+        )
+    }
+
+
+def run_suite(
+    pattern=None,
+    repeat=DEFAULT_REPEAT,
+    min_time=DEFAULT_MIN_TIME,
+    rows=DEFAULT_ROWS,
+    report=None,
+):
+    """
+    @Description: Runs every benchmark whose name matches pattern against the default database.
+    Everything the run writes, the benchmark account and its session included, is rolled back when it ends.
+    @Param: report (callable): Called with (name, result) after each benchmark.
+    @Return: dict: {name: result}; a result has the timings, items/s or a "skipped" reason.
+    """
+    results = {}
+    with benchmark_environment(), rolled_back():
+        for alias in caches:
+            caches[alias].clear()
+        client = Client()
+        account, _ = get_user_model().objects.get_or_create(
+            username="benchmark", defaults={"is_staff": True, "is_superuser": True}
+        )
+        client.force_login(account)
+        for benchmark in suite(client, rows):
+            if pattern and not re.search(pattern, benchmark.name):
+                continue
+            # Each benchmark starts from the same rows, whatever the last one wrote.
+            with rolled_back():
+                try:
+                    func, unit = benchmark.setup()
+                except Skip as reason:
+                    result = {"skipped": str(reason)}
+                else:
+                    result = measure(func, repeat, min_time)
+                    result["unit"] = unit
+                    result["per_second"] = unit / result["median"]
+            results[benchmark.name] = result
+            if report:
+                report(benchmark.name, result)
+    return results
+
+
+def git(*args):
+    try:
+        output = subprocess.run(
+            ["git", *args],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.strip()
+
+
+def environment():
+    """
+    @Description: The commit and machine a run belongs to.
+    """
+    return {
+        "commit": git("rev-parse", "HEAD"),
+        "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+        "timestamp": timezone.now().isoformat(),
+        "machine": {
+            "node": platform.node(),
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+            "cpus": os.cpu_count(),
+        },
+        "python": platform.python_version(),
+        "django": django.get_version(),
+    }
+
+
+def results_path(directory, run):
+    stamp = run["timestamp"][:19].replace("-", "").replace(":", "")
+    return os.path.join(directory, f"{stamp}-{(run['commit'] or 'unknown')[:10]}.json")
+
+
+def compare(baseline, current, threshold=1.1):
+    """
+    @Description: Pairs the median timings of two result files.
+    @Param: threshold (float): Ratio (current / baseline) above which a benchmark counts as a regression, and below whose inverse it counts as an improvement.
+    @Return: list: (dataset, name, baseline seconds, current seconds, ratio, "slower"/"faster"/"").
+    """
+    rows = []
+    for dataset, section in current["datasets"].items():
+        before_section = baseline["datasets"].get(dataset, {}).get("results", {})
+        for name, after in section["results"].items():
+            before = before_section.get(name)
+            if not before or "median" not in before or "median" not in after:
+                continue
+            ratio = after["median"] / before["median"]
+            if ratio > threshold:
+                change = "slower"
+            elif ratio < 1 / threshold:
+                change = "faster"
+            else:
+                change = ""
+            rows.append(
+                (dataset, name, before["median"], after["median"], ratio, change)
+            )
+    return rows
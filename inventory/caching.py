@@ -0,0 +1,236 @@
+"""
+@Description: Versioned cache for the rendered list and search pages.
+Every cached model has a version counter in the cache. A page's cache key includes the current versions of the models it shows, and post_save/post_delete (or bump_version() after bulk writes) increment the counter once the transaction commits, so a write invalidates every page built from the old rows at once without waiting for a TTL. Works with any cache backend; settings.CACHES picks local memory or files (see CACHE_BACKEND).
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+import functools
+import hashlib
+import threading
+import time
+from collections import Counter
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models.signals import post_delete, post_save
+from django.http import HttpResponse
+
+from .routers import read_alias
+
+DEFAULT_TIMEOUT = 24 * 60 * 60
+# Changed whenever the stored format changes, so older entries are never read.
+KEY_PREFIX = "inventory:page:2"
+
+# Models with cached pages; writes to other models do not touch the cache.
+cached_models = set()
+
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def get_cache():
+    return caches[getattr(settings, "INVENTORY_VIEW_CACHE", "default")]
+
+
+def timeout():
+    return getattr(settings, "INVENTORY_VIEW_CACHE_TIMEOUT", DEFAULT_TIMEOUT)
+
+
+def version_key(model):
+    return f"inventory:version:{model._meta.label_lower}"
+
+
+def get_versions(models):
+    """
+    @Description: Returns the current version of each model, initialising missing counters.
+    A missing counter starts at the current time in nanoseconds rather than 1, so a counter evicted from the cache can never come back with a version an older page was stored under.
+    @Param: models (iterable): The models.
+    @Return: list: One version per model, in order.
+    """
+    cache = get_cache()
+    keys = [version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, time.time_ns(), timeout=None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+async def aget_versions(models):
+    """
+    @Description: Async version of get_versions(), through the cache's async API.
+    """
+    cache = get_cache()
+    keys = [version_key(model) for model in models]
+    versions = await cache.aget_many(keys)
+    for key in keys:
+        if key not in versions:
+            await cache.aadd(key, time.time_ns(), timeout=None)
+            versions[key] = await cache.aget(key)
+    return [versions[key] for key in keys]
+
+
+def bump_version(*models, using=None):
+    """
+    @Description: Invalidates the cached pages of the given models once the current transaction commits (immediately outside a transaction).
+    Call it after writes that do not send signals, such as bulk_create and bulk_update.
+    @Param: models (Model): The changed models.
+    @Param: using (str): The database alias whose transaction to wait for.
+    """
+    transaction.on_commit(functools.partial(_bump, models), using=using)
+
+
+def _bump(models):
+    cache = get_cache()
+    for model in models:
+        try:
+            cache.incr(version_key(model))
+        except ValueError:
+            cache.set(version_key(model), time.time_ns(), timeout=None)
+
+
+def invalidate(sender, instance, raw=False, using=None, **kwargs):
+    if not raw and sender in cached_models:
+        bump_version(sender, using=using)
+
+
+def connect_signals():
+    post_save.connect(invalidate, dispatch_uid="inventory_cache_save")
+    post_delete.connect(invalidate, dispatch_uid="inventory_cache_delete")
+
+
+def record(view_name, outcome):
+    with _stats_lock:
+        _stats[view_name, outcome] += 1
+
+
+def stats():
+    """
+    @Description: Returns this process's hit and miss counts.
+    @Return: dict: {view name: {"hits": int, "misses": int}}.
+    """
+    with _stats_lock:
+        counts = dict(_stats)
+    result = {}
+    for (view_name, outcome), count in counts.items():
+        result.setdefault(view_name, {"hits": 0, "misses": 0})[outcome] = count
+    return result
+
+
+def reset_stats():
+    with _stats_lock:
+        _stats.clear()
+
+
+def page_digest(request, user):
+    # Pages can embed the user's CSRF token, so they are cached per user and browser.
+    vary = "|".join(
+        [
+            request.get_full_path(),
+            str(user.pk),
+            request.COOKIES.get(settings.CSRF_COOKIE_NAME, ""),
+        ]
+    )
+    return hashlib.md5(vary.encode(), usedforsecurity=False).hexdigest()
+
+
+def page_key(request, view_name, models):
+    digest = page_digest(request, request.user)
+    versions = ".".join(str(version) for version in get_versions(models))
+    return f"{KEY_PREFIX}:{view_name}:{digest}:{versions}"
+
+
+async def apage_key(request, view_name, models):
+    digest = page_digest(request, await request.auser())
+    versions = ".".join(str(version) for version in await aget_versions(models))
+    return f"{KEY_PREFIX}:{view_name}:{digest}:{versions}"
+
+
+def storable(response):
+    """
+    @Description: Whether a freshly rendered page may be cached.
+    Pages read from a replica are not: the replica may not have the write that bumped the version yet, and the stale page would be stored under the new version key for everyone.
+    """
+    return (
+        response.status_code == 200
+        and not response.streaming
+        and not response.cookies
+        and read_alias.get() in (None, DEFAULT_DB_ALIAS)
+    )
+
+
+def freeze(response):
+    """
+    @Description: The parts of a page that are cached: its body and every header the view set, as Django's UpdateCacheMiddleware keeps them.
+    Responses that set cookies are not stored (see storable()).
+    """
+    return response.content, list(response.items())
+
+
+def thaw(cached):
+    content, headers = cached
+    response = HttpResponse(content)
+    for header, value in headers:
+        response[header] = value
+    return response
+
+
+def cache_page_versioned(*models):
+    """
+    @Description: Caches a list or search view's GET responses until one of models changes.
+    Async views get an async wrapper that uses the cache's async API.
+    @Param: models (Model): Every model the page shows, including related rows it displays.
+    @Return: function: The view decorator.
+    """
+
+    def decorator(view):
+        cached_models.update(models)
+        view_name = view.__name__
+
+        if iscoroutinefunction(view):
+
+            @functools.wraps(view)
+            async def async_wrapper(request, *args, **kwargs):
+                if request.method != "GET":
+                    return await view(request, *args, **kwargs)
+                cache = get_cache()
+                key = await apage_key(request, view_name, models)
+                cached = await cache.aget(key)
+                if cached is not None:
+                    record(view_name, "hits")
+                    return thaw(cached)
+                record(view_name, "misses")
+                response = await view(request, *args, **kwargs)
+                if storable(response):
+                    await cache.aset(key, freeze(response), timeout())
+                return response
+
+            return async_wrapper
+
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method != "GET":
+                return view(request, *args, **kwargs)
+            cache = get_cache()
+            key = page_key(request, view_name, models)
+            cached = cache.get(key)
+            if cached is not None:
+                record(view_name, "hits")
+                return thaw(cached)
+            record(view_name, "misses")
+            response = view(request, *args, **kwargs)
+            if storable(response):
+                cache.set(key, freeze(response), timeout())
+            return response
+
+        return wrapper
+
+    return decorator
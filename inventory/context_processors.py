@@ -0,0 +1,33 @@
+"""
+@Description: Template context processors for the inventory app.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+from django.utils.functional import SimpleLazyObject
+
+
+def role_for(user):
+    """
+    @Description: Returns the coarse role that decides what the shared page chrome shows.
+    @Param: user (User): The request's user.
+    @Return: str: "admin", "staff", "user" or "anonymous".
+    """
+    if not user.is_authenticated:
+        return "anonymous"
+    if user.is_superuser:
+        return "admin"
+    if user.is_staff:
+        return "staff"
+    return "user"
+
+
+def user_role(request):
+    """
+    @Description: Adds user_role, the key header.html's cached fragment varies on. It is evaluated only when a template uses it.
+    """
+    return {"user_role": SimpleLazyObject(lambda: role_for(request.user))}
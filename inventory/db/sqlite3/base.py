@@ -0,0 +1,39 @@
+"""
+@Description: SQLite backend tuned for a multi-threaded web server.
+Every new connection is switched to WAL with synchronous=NORMAL, a busy timeout, memory-mapped I/O, a larger page cache and in-memory temp tables, and transactions start with BEGIN IMMEDIATE so a transaction that reads before it writes waits for the write lock up front instead of failing with "database is locked" when it tries to upgrade.
+Set "ENGINE": "inventory.db.sqlite3"; OPTIONS["pragmas"] overrides individual pragmas.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+from django.db.backends.sqlite3 import base
+
+DEFAULT_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,
+    "mmap_size": 256 * 1024 * 1024,
+    # Negative values are KiB rather than pages: a 64 MiB page cache.
+    "cache_size": -64 * 1024,
+    "temp_store": "MEMORY",
+}
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def get_connection_params(self):
+        params = super().get_connection_params()
+        self.pragmas = {**DEFAULT_PRAGMAS, **params.pop("pragmas", {})}
+        return params
+
+    def get_new_connection(self, conn_params):
+        conn = super().get_new_connection(conn_params)
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        return conn
+
+    def _start_transaction_under_autocommit(self):
+        self.cursor().execute("BEGIN IMMEDIATE")
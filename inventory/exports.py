@@ -0,0 +1,163 @@
+"""
+@Description: Streaming CSV and XLSX exports of the rows behind the list and search views.
+Rows are read with values_list().iterator() and written out chunk by chunk, so memory stays flat however many rows are exported. The ?query= filter matches the same rows as the corresponding search_* view, and rows come out in the same order as the list view.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+import csv
+import datetime
+import io
+import tempfile
+
+from django.core.exceptions import BadRequest
+from django.utils import timezone
+
+from .models import (
+    User,
+    Product,
+    Supplier,
+    ProductSupplier,
+    Warehouse,
+    Inventory,
+    Order,
+    OrderDetail,
+    Customer,
+    CustomerOrder,
+    CustomerOrderDetail,
+    Shipment,
+    ShipmentDetail,
+    StockAdjustment,
+    InventoryTransaction,
+    Task,
+    Event,
+)
+from .search import SEARCH_FIELDS, filter_queryset
+
+EXPORT_CHUNK_SIZE = 2000
+
+# The column shown next to a foreign key id so exports are readable without joins.
+LABEL_FIELDS = {
+    **{model: fields[0] for model, fields in SEARCH_FIELDS.items()},
+    User: "username",
+}
+
+
+class Export:
+    """
+    @Description: Describes the export of one model.
+    @Attributes:
+        - model (Model): The exported model.
+        - keys (tuple): The list view's sort key; rows are exported newest first, like the list.
+        - via (str): The foreign key the search view matches through, if it does not search the model itself.
+    """
+
+    def __init__(self, model, keys=("created_at", "id"), via=None):
+        self.model = model
+        self.keys = keys
+        self.via = via
+
+    @property
+    def columns(self):
+        columns = []
+        for field in self.model._meta.concrete_fields:
+            columns.append(field.attname)
+            label = LABEL_FIELDS.get(field.related_model) if field.is_relation else None
+            if label:
+                columns.append(f"{field.name}__{label}")
+        return columns
+
+    def queryset(self, query=None, using=None):
+        queryset = self.model._default_manager.all()
+        if using:
+            queryset = queryset.using(using)
+        if query:
+            if self.via is None and self.model not in SEARCH_FIELDS:
+                raise BadRequest(f"{self.model.__name__} rows cannot be searched.")
+            queryset = filter_queryset(queryset, query, via=self.via)
+        return queryset.order_by(*[f"-{key}" for key in self.keys]).values_list(
+            *self.columns
+        )
+
+
+EXPORTS = {
+    "product": Export(Product),
+    "supplier": Export(Supplier),
+    "product_supplier": Export(ProductSupplier, keys=("id",), via="product"),
+    "warehouse": Export(Warehouse),
+    "inventory": Export(Inventory, keys=("id",), via="product"),
+    "order": Export(Order, via="supplier"),
+    "order_detail": Export(OrderDetail, keys=("id",), via="product"),
+    "customer": Export(Customer),
+    "customer_order": Export(CustomerOrder, via="customer"),
+    "customer_order_detail": Export(
+        CustomerOrderDetail, keys=("id",), via="product"
+    ),
+    "shipment": Export(Shipment),
+    "shipment_detail": Export(ShipmentDetail, keys=("id",), via="shipment"),
+    "stock_adjustment": Export(StockAdjustment, keys=("adjustment_date", "id")),
+    "inventory_transaction": Export(
+        InventoryTransaction, keys=("transaction_date", "id")
+    ),
+    "task": Export(Task, keys=("id",)),
+    "event": Export(Event, keys=("start_time", "id")),
+}
+
+
+class _Buffer(io.StringIO):
+    def pop(self):
+        value = self.getvalue()
+        self.seek(0)
+        self.truncate()
+        return value
+
+
+def iter_csv(export, rows, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    @Description: Renders rows as CSV, yielding one string per chunk of rows.
+    @Param: export (Export): The export whose columns head the file.
+    @Param: rows (iterable): Tuples from Export.queryset().
+    @Param: chunk_size (int): Rows rendered per yielded string.
+    @Return: generator: CSV text.
+    """
+    buffer = _Buffer()
+    writer = csv.writer(buffer)
+    writer.writerow(export.columns)
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if count % chunk_size == 0:
+            yield buffer.pop()
+    yield buffer.pop()
+
+
+def _excel_value(value):
+    if isinstance(value, datetime.datetime) and timezone.is_aware(value):
+        return timezone.make_naive(value)
+    return value
+
+
+def write_xlsx(export, rows):
+    """
+    @Description: Writes rows to a temporary XLSX file with openpyxl's write-only mode, which spills rows to disk instead of keeping them in memory.
+    @Param: export (Export): The export whose columns head the sheet.
+    @Param: rows (iterable): Tuples from Export.queryset().
+    @Return: file: The workbook, opened for reading and rewound.
+    @Raises: BadRequest: If openpyxl is not installed.
+    """
+    try:
+        from openpyxl import Workbook
+    except ImportError:
+        raise BadRequest("XLSX exports require openpyxl.")
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(export.model.__name__)
+    sheet.append(export.columns)
+    for row in rows:
+        sheet.append([_excel_value(value) for value in row])
+    output = tempfile.TemporaryFile()
+    workbook.save(output)
+    output.seek(0)
+    return output
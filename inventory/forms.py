@@ -630,23 +630,27 @@ class EventForm(forms.ModelForm):
         }
 
 
-class EmailAttachmentForm(forms.Form):
+class EmailAttachmentForm(forms.ModelForm):
     """
-    @description: Form for uploading email attachments.
+    @description: Form for composing an email with an optional attachment.
     @attributes:
+        customer_email (EmailField): The recipient.
+        subject (CharField): The subject line.
+        body (TextField): The message.
         attachment (FileField): The attachment file to be uploaded.
     @widgets:
         attachment (FileInput): Rendered as a file input with Bootstrap form control styling.
     """
 
-    model = EmailAttachment
-    fields = ["customer_email", "subject", "body", "attachment"]
-    widgets = {
-        "customer_email": forms.EmailInput(attrs={"class": "form-control"}),
-        "subject": forms.TextInput(attrs={"class": "form-control"}),
-        "body": forms.Textarea(attrs={"class": "form-control"}),
-        "attachment": forms.FileInput(attrs={"class": "form-control"}),
-    }
+    class Meta:
+        model = EmailAttachment
+        fields = ["customer_email", "subject", "body", "attachment"]
+        widgets = {
+            "customer_email": forms.EmailInput(attrs={"class": "form-control"}),
+            "subject": forms.TextInput(attrs={"class": "form-control"}),
+            "body": forms.Textarea(attrs={"class": "form-control"}),
+            "attachment": forms.FileInput(attrs={"class": "form-control"}),
+        }
 
 
 class SalesTransactionForm(forms.Form):
@@ -0,0 +1,258 @@
+"""
+@Description: Streaming bulk import of Product, Supplier, Customer and Inventory rows from CSV or JSON Lines.
+Rows are read one at a time, validated with the same ModelForms as the add_* views and written with bulk_create/bulk_update, one transaction per chunk. Foreign keys are resolved once per chunk instead of once per row, and rows that fail validation are reported instead of aborting the import.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+import copy
+import csv
+import json
+
+from django import forms
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from .forms import ProductForm, SupplierForm, CustomerForm, InventoryForm
+from .caching import bump_version
+from .search import SEARCH_FIELDS, get_backend
+from .stockfeed import publish_bulk
+
+DEFAULT_CHUNK_SIZE = 1000
+
+MALFORMED_ROW = {"__all__": [{"message": "Malformed row.", "code": "invalid"}]}
+
+
+class CachedModelChoiceField(forms.ModelChoiceField):
+    """
+    @Description: A ModelChoiceField that resolves primary keys from a dictionary preloaded for the current chunk instead of querying per row.
+    """
+
+    def __init__(self, *args, cache=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache = {} if cache is None else cache
+
+    def __deepcopy__(self, memo):
+        # Forms deep-copy their fields on every instantiation; share the cache.
+        result = super().__deepcopy__(memo)
+        result.cache = self.cache
+        return result
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        try:
+            return self.cache[int(value)]
+        except (KeyError, TypeError, ValueError):
+            raise forms.ValidationError(
+                self.error_messages["invalid_choice"], code="invalid_choice"
+            )
+
+
+class Importer:
+    """
+    @Description: Imports rows of one model. The foreign key caches are refilled for every chunk, so each import_rows() call needs its own instance.
+    @Attributes:
+        - form_class (ModelForm): The form used to validate each row.
+        - key (tuple): Fields identifying an existing row to update. "id" matches on the primary key column of the file.
+    """
+
+    def __init__(self, form_class, key=("id",)):
+        self.form_class = form_class
+        self.model = form_class._meta.model
+        self.key = key
+        self.caches = {}
+        attrs = {
+            # Uniqueness is enforced by matching rows on self.key instead.
+            "validate_unique": lambda form: None,
+        }
+        for name, field in form_class.base_fields.items():
+            if isinstance(field, forms.ModelChoiceField):
+                self.caches[name] = {}
+                attrs[name] = CachedModelChoiceField(
+                    queryset=field.queryset,
+                    required=field.required,
+                    cache=self.caches[name],
+                )
+        self.batch_form_class = type(
+            f"Batch{form_class.__name__}", (form_class,), attrs
+        )
+        self.fields = list(form_class._meta.fields)
+
+    def row_key(self, row):
+        values = []
+        for name in self.key:
+            value = row.get(name)
+            if value in (None, ""):
+                return None
+            try:
+                values.append(int(value))
+            except (TypeError, ValueError):
+                return None
+        return tuple(values)
+
+    def instance_key(self, instance):
+        return tuple(
+            instance.pk if name == "id" else getattr(instance, f"{name}_id")
+            for name in self.key
+        )
+
+    def prepare(self, rows, using):
+        """
+        @Description: Preloads the related objects and existing rows referenced by a chunk.
+        @Return: dict: Existing model instances keyed by their import key.
+        """
+        rows = [(line, row) for line, row in rows if isinstance(row, dict)]
+        for name, cache in self.caches.items():
+            cache.clear()
+            ids = set()
+            for _, row in rows:
+                try:
+                    ids.add(int(row.get(name)))
+                except (TypeError, ValueError):
+                    pass
+            queryset = self.batch_form_class.base_fields[name].queryset
+            cache.update(queryset.using(using).in_bulk(ids))
+
+        keys = [key for key in (self.row_key(row) for _, row in rows) if key]
+        if not keys:
+            return {}
+        lookup = {}
+        for index, name in enumerate(self.key):
+            column = "pk" if name == "id" else f"{name}_id"
+            lookup[f"{column}__in"] = {key[index] for key in keys}
+        return {
+            self.instance_key(instance): instance
+            for instance in self.model.objects.using(using).filter(**lookup)
+        }
+
+    def write(self, rows, using, on_error):
+        """
+        @Description: Validates and writes one chunk inside a transaction.
+        @Return: tuple: (created, updated, rejected) counts.
+        """
+        existing = self.prepare(rows, using)
+        staged, unkeyed, to_update, rejected = {}, [], {}, 0
+        for line, row in rows:
+            if not isinstance(row, dict):
+                rejected += 1
+                if on_error:
+                    on_error(line, row, MALFORMED_ROW)
+                continue
+            key = self.row_key(row)
+            base = (staged.get(key) or existing.get(key)) if key else None
+            # Forms write into their instance even when invalid; work on a copy.
+            form = self.batch_form_class(
+                data=row, instance=copy.copy(base) if base is not None else None
+            )
+            if not form.is_valid():
+                rejected += 1
+                if on_error:
+                    on_error(line, row, form.errors.get_json_data())
+                continue
+            obj = form.save(commit=False)
+            if obj.pk is not None:
+                to_update[obj.pk] = existing[key] = obj
+            elif key:
+                # Later rows with the same key update this pending row.
+                staged[key] = obj
+            else:
+                unkeyed.append(obj)
+
+        with transaction.atomic(using=using):
+            created = self.model.objects.using(using).bulk_create(
+                list(staged.values()) + unkeyed
+            )
+            updated = list(to_update.values())
+            if updated:
+                self.model.objects.using(using).bulk_update(updated, self.fields)
+            if self.model in SEARCH_FIELDS:
+                get_backend(using).index_many(self.model, created + updated)
+            bump_version(self.model, using=using)
+            publish_bulk(self.model, created + updated, using=using)
+        return len(created), len(updated), rejected
+
+
+# The form and import key of each importable model; import_rows() builds an
+# Importer from them per call, so concurrent imports never share its caches.
+IMPORTERS = {
+    "product": (ProductForm, ("id",)),
+    "supplier": (SupplierForm, ("id",)),
+    "customer": (CustomerForm, ("id",)),
+    "inventory": (InventoryForm, ("product", "warehouse")),
+}
+
+
+class ImportResult:
+    def __init__(self):
+        self.created = 0
+        self.updated = 0
+        self.rejected = 0
+
+    def as_dict(self):
+        return {
+            "created": self.created,
+            "updated": self.updated,
+            "rejected": self.rejected,
+        }
+
+
+def read_rows(stream, fmt):
+    """
+    @Description: Lazily parses an uploaded or opened file.
+    @Param: stream (iterable): Lines of the file, as bytes or str.
+    @Param: fmt (str): "csv" or "jsonl".
+    @Return: generator: (line_number, row dict) pairs.
+    """
+    lines = (
+        line.decode("utf-8-sig") if isinstance(line, bytes) else line for line in stream
+    )
+    if fmt == "csv":
+        reader = csv.DictReader(lines)
+        for row in reader:
+            yield reader.line_num, row
+    elif fmt == "jsonl":
+        for number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield number, json.loads(line)
+            except ValueError:
+                yield number, line
+    else:
+        raise ValueError(f"Unsupported import format: {fmt}")
+
+
+def import_rows(model, rows, chunk_size=DEFAULT_CHUNK_SIZE, on_error=None, using=None):
+    """
+    @Description: Imports rows for one model, chunk by chunk.
+    @Param: model (str): A key of IMPORTERS.
+    @Param: rows (iterable): (line_number, row dict) pairs, e.g. from read_rows().
+    @Param: chunk_size (int): Rows validated and written per transaction.
+    @Param: on_error (callable): Called as on_error(line_number, row, errors) for each rejected row.
+    @Param: using (str): The database alias to write to.
+    @Return: ImportResult: Counts of created, updated and rejected rows.
+    """
+    form_class, key = IMPORTERS[model]
+    importer = Importer(form_class, key)
+    using = using or DEFAULT_DB_ALIAS
+    result = ImportResult()
+    chunk = []
+    for item in rows:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            _add(result, importer.write(chunk, using, on_error))
+            chunk = []
+    if chunk:
+        _add(result, importer.write(chunk, using, on_error))
+    return result
+
+
+def _add(result, counts):
+    created, updated, rejected = counts
+    result.created += created
+    result.updated += updated
+    result.rejected += rejected
@@ -0,0 +1,546 @@
+"""
+@Description: Load generator behind the load_test command.
+Worker threads (or asyncio tasks for ASGI) replay a weighted mix of list, search, add and update calls, each waiting for its response before sending the next, as a logged-in user would. The calls go to django_project.wsgi or django_project.asgi in the same process, or over HTTP to a running server (runserver, gunicorn, uvicorn). For in-process targets several worker processes can each run their own copy of the application, so a sweep over workers and threads shows where throughput stops growing and latency starts climbing.
+Every response is recorded with its operation, status and latency; summarise() turns them into throughput, error rate, percentiles and a latency histogram.
+A client delay makes every in-process client a slow reader: the WSGI client keeps its thread for the delay, as a WSGI server thread stays busy writing to a slow socket, while the ASGI client awaits it, as an ASGI server waits for the socket to drain without blocking its event loop. The peak number of live threads in each worker process is reported alongside, so a sweep shows how many threads a given concurrency costs.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+import asyncio
+import http.client
+import io
+import multiprocessing
+import random
+import sys
+import threading
+import time
+from collections import Counter, namedtuple
+from importlib import import_module
+from urllib.parse import urlencode, urlsplit
+
+import django
+from django.conf import settings
+from django.contrib.auth import (
+    BACKEND_SESSION_KEY,
+    HASH_SESSION_KEY,
+    SESSION_KEY,
+    get_user_model,
+)
+from django.db import connections
+from django.middleware.csrf import CSRF_SECRET_LENGTH
+from django.test import override_settings
+from django.urls import reverse
+from django.utils.crypto import get_random_string
+
+from .benchmarks import page_views, with_fallback_templates
+from .metrics import percentile
+from .models import Product
+from .seeding import ADJECTIVES, CATEGORIES, NOUNS
+
+DEFAULT_MIX = {"list": 60, "search": 25, "add": 10, "update": 5}
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+IN_PROCESS_HOST = "localhost"
+THREAD_POLL_INTERVAL = 0.01
+SAMPLE_PRODUCTS = 1000
+
+Call = namedtuple("Call", "operation method path query body")
+Sample = namedtuple("Sample", "operation status latency")
+
+
+def parse_mix(text):
+    """
+    @Description: Parses a traffic mix such as "list=60,search=25,add=10,update=5".
+    @Return: dict: {operation: weight}.
+    @Raises: ValueError: For unknown operations or weights that are not positive integers.
+    """
+    mix = {}
+    for part in text.split(","):
+        operation, _, weight = part.partition("=")
+        operation = operation.strip()
+        if operation not in DEFAULT_MIX:
+            raise ValueError(f"Unknown operation {operation!r}.")
+        mix[operation] = int(weight)
+        if mix[operation] < 0:
+            raise ValueError(f"Negative weight for {operation!r}.")
+    if not any(mix.values()):
+        raise ValueError("The mix has no traffic.")
+    return mix
+
+
+class Traffic:
+    """
+    @Description: Draws calls from a mix. Each worker has its own instance, seeded differently, so workers do not send identical sequences.
+    @Param: mix (dict): {operation: weight}.
+    @Param: paths (dict): "lists" (list page paths), "search" and "add" paths and "update" (a format string taking the product id).
+    @Param: product_ids (list): Products to update.
+    @Param: seed (int): The random seed.
+    """
+
+    def __init__(self, mix, paths, product_ids, seed=0):
+        self.operations = [operation for operation in mix if mix[operation]]
+        self.weights = [mix[operation] for operation in self.operations]
+        self.paths = paths
+        self.product_ids = product_ids
+        self.rng = random.Random(seed)
+
+    def next(self):
+        operation = self.rng.choices(self.operations, self.weights)[0]
+        return getattr(self, operation)()
+
+    def list(self):
+        return Call("list", "GET", self.rng.choice(self.paths["lists"]), "", b"")
+
+    def search(self):
+        query = urlencode({"query": self.rng.choice(NOUNS + ADJECTIVES).lower()})
+        return Call("search", "GET", self.paths["search"], query, b"")
+
+    def add(self):
+        return Call("add", "POST", self.paths["add"], "", self.product_form())
+
+    def update(self):
+        path = self.paths["update"].format(self.rng.choice(self.product_ids))
+        return Call("update", "POST", path, "", self.product_form())
+
+    def product_form(self):
+        rng = self.rng
+        return urlencode(
+            {
+                "product_name": f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)}",
+                "description": "Load test",
+                "category": rng.choice(CATEGORIES),
+                "unit_price": f"{rng.uniform(1, 500):.2f}",
+                "reorder_level": rng.randint(0, 50),
+            }
+        ).encode()
+
+
+def prepare(username="loadtest"):
+    """
+    @Description: Creates a logged-in session and a CSRF secret for the load, in the configured database, and collects the paths and product ids the traffic needs.
+    The session belongs to a plain user, created if there is none by that name; every page the load requests only needs a login. Call cleanup() with the state when the run ends.
+    @Return: dict: The picklable state handed to every worker.
+    @Raises: LookupError: If there are no products yet.
+    """
+    product_ids = list(
+        Product.objects.order_by("?").values_list("pk", flat=True)[:SAMPLE_PRODUCTS]
+    )
+    if not product_ids:
+        raise LookupError("There are no products; seed the database first.")
+    user, created = get_user_model().objects.get_or_create(username=username)
+    session = import_module(settings.SESSION_ENGINE).SessionStore()
+    session[SESSION_KEY] = user._meta.pk.value_to_string(user)
+    session[BACKEND_SESSION_KEY] = "django.contrib.auth.backends.ModelBackend"
+    session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+    session.create()
+    csrf = get_random_string(CSRF_SECRET_LENGTH)
+    return {
+        "cookie": (
+            f"{settings.SESSION_COOKIE_NAME}={session.session_key}; "
+            f"{settings.CSRF_COOKIE_NAME}={csrf}"
+        ),
+        "csrf": csrf,
+        "session_key": session.session_key,
+        "created_user": user.pk if created else None,
+        "paths": {
+            "lists": ["/" + route for name, route in page_views() if "_list" in name],
+            "search": reverse("search_product"),
+            "add": reverse("add_product"),
+            "update": reverse("update_product", args=[0]).replace("/0/", "/{}/"),
+        },
+        "product_ids": product_ids,
+    }
+
+
+def cleanup(state):
+    """
+    @Description: Deletes the session prepare() created, and its user if prepare() created that too.
+    @Param: state (dict): The state returned by prepare().
+    """
+    import_module(settings.SESSION_ENGINE).SessionStore(state["session_key"]).delete()
+    if state["created_user"] is not None:
+        get_user_model().objects.filter(pk=state["created_user"]).delete()
+
+
+def headers(state, call):
+    result = {"Cookie": state["cookie"], "X-CSRFToken": state["csrf"]}
+    if call.body:
+        result["Content-Type"] = "application/x-www-form-urlencoded"
+    return result
+
+
+class WSGIClient:
+    """
+    @Description: Calls a WSGI application directly with a hand-built environ.
+    @Param: delay (float): Seconds the client takes to read each response.
+    """
+
+    def __init__(self, application, state, delay=0):
+        self.application = application
+        self.state = state
+        self.delay = delay
+
+    def send(self, call):
+        environ = {
+            "REQUEST_METHOD": call.method,
+            "PATH_INFO": call.path,
+            "QUERY_STRING": call.query,
+            "SERVER_NAME": IN_PROCESS_HOST,
+            "SERVER_PORT": "80",
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "REMOTE_ADDR": "127.0.0.1",
+            "CONTENT_LENGTH": str(len(call.body)),
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": "http",
+            "wsgi.input": io.BytesIO(call.body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": True,
+            "wsgi.run_once": False,
+        }
+        for name, value in headers(self.state, call).items():
+            key = name.upper().replace("-", "_")
+            if key != "CONTENT_TYPE":
+                key = f"HTTP_{key}"
+            environ[key] = value
+        environ["HTTP_HOST"] = IN_PROCESS_HOST
+        status = []
+
+        def start_response(line, response_headers, exc_info=None):
+            status.append(int(line.split(" ", 1)[0]))
+
+        response = self.application(environ, start_response)
+        try:
+            for _ in response:
+                pass
+            if self.delay:
+                time.sleep(self.delay)
+        finally:
+            if hasattr(response, "close"):
+                response.close()
+        return status[0]
+
+
+class ASGIClient:
+    """
+    @Description: Calls an ASGI application directly, one HTTP scope per call.
+    @Param: delay (float): Seconds the client takes to read each response.
+    """
+
+    def __init__(self, application, state, delay=0):
+        self.application = application
+        self.state = state
+        self.delay = delay
+
+    async def send(self, call):
+        request = [{"type": "http.request", "body": call.body, "more_body": False}]
+        disconnected = asyncio.Event()
+        status = []
+
+        async def receive():
+            if request:
+                return request.pop()
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                status.append(message["status"])
+            elif self.delay and not message.get("more_body"):
+                await asyncio.sleep(self.delay)
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": call.method,
+            "scheme": "http",
+            "path": call.path,
+            "raw_path": call.path.encode(),
+            "query_string": call.query.encode(),
+            "root_path": "",
+            "headers": [(b"host", IN_PROCESS_HOST.encode())]
+            + [
+                (name.lower().encode(), value.encode())
+                for name, value in headers(self.state, call).items()
+            ],
+            "client": ("127.0.0.1", 0),
+            "server": (IN_PROCESS_HOST, 80),
+        }
+        try:
+            await self.application(scope, receive, send)
+        finally:
+            disconnected.set()
+        return status[0]
+
+
+class HTTPClient:
+    """
+    @Description: Sends calls to a running server over one keep-alive connection.
+    """
+
+    def __init__(self, url, state, timeout=30):
+        parts = urlsplit(url)
+        connection_class = (
+            http.client.HTTPSConnection
+            if parts.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        self.connection = connection_class(parts.netloc, timeout=timeout)
+        self.prefix = parts.path.rstrip("/")
+        self.state = state
+
+    def send(self, call):
+        path = self.prefix + call.path + (f"?{call.query}" if call.query else "")
+        try:
+            self.connection.request(
+                call.method, path, body=call.body or None,
+                headers=headers(self.state, call),
+            )
+            response = self.connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            self.connection.close()
+            raise
+        return response.status
+
+
+def in_process_settings():
+    # The in-process host has to be allowed, and pages whose templates the
+    # project does not ship render through the benchmark fallback loader.
+    return override_settings(
+        ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, IN_PROCESS_HOST],
+        TEMPLATES=with_fallback_templates(),
+    )
+
+
+def application(target):
+    module = import_module(f"django_project.{target}")
+    return module.application
+
+
+class ThreadWatcher:
+    """
+    @Description: Polls the number of live threads in this process while a run is in progress.
+    @Return: The peak is in .peak once the with block exits.
+    """
+
+    def __init__(self, interval=THREAD_POLL_INTERVAL):
+        self.interval = interval
+        self.peak = threading.active_count()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.watch, daemon=True)
+
+    def watch(self):
+        while not self.stopped.wait(self.interval):
+            # The watcher itself does not count.
+            self.peak = max(self.peak, threading.active_count() - 1)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stopped.set()
+        self.thread.join()
+
+
+def run_threads(make_client, state, mix, threads, duration, warmup, seed):
+    """
+    @Description: Runs closed-loop worker threads for warmup + duration seconds.
+    @Return: list: The Samples of the calls that started after the warm-up.
+    """
+    samples = []
+    lock = threading.Lock()
+    start = time.perf_counter() + warmup
+    stop = start + duration
+
+    def worker(index):
+        traffic = Traffic(mix, state["paths"], state["product_ids"], seed + index)
+        client = make_client()
+        recorded = []
+        try:
+            while True:
+                call = traffic.next()
+                began = time.perf_counter()
+                if began >= stop:
+                    break
+                try:
+                    status = client.send(call)
+                except Exception:
+                    status = None
+                if began >= start:
+                    recorded.append(
+                        Sample(call.operation, status, time.perf_counter() - began)
+                    )
+        finally:
+            connections.close_all()
+            with lock:
+                samples.extend(recorded)
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return samples
+
+
+async def run_tasks(client, state, mix, tasks, duration, warmup, seed):
+    """
+    @Description: The asyncio counterpart of run_threads: tasks concurrent calls into one ASGI application.
+    """
+    loop = asyncio.get_running_loop()
+    start = loop.time() + warmup
+    stop = start + duration
+    samples = []
+
+    async def worker(index):
+        traffic = Traffic(mix, state["paths"], state["product_ids"], seed + index)
+        while True:
+            call = traffic.next()
+            began = loop.time()
+            if began >= stop:
+                return
+            try:
+                status = await client.send(call)
+            except Exception:
+                status = None
+            if began >= start:
+                samples.append(Sample(call.operation, status, loop.time() - began))
+
+    await asyncio.gather(*(worker(index) for index in range(tasks)))
+    return samples
+
+
+def run_worker(target, state, mix, threads, duration, warmup, seed, client_delay=0):
+    """
+    @Description: One worker's share of a load run, in this process.
+    @Param: target (str): "wsgi", "asgi" or a server URL.
+    @Param: threads (int): Concurrent threads, or asyncio tasks for "asgi".
+    @Param: client_delay (float): Seconds in-process clients take to read a response.
+    @Return: tuple: (list of Samples, peak number of live threads).
+    """
+    with ThreadWatcher() as watcher:
+        if target == "asgi":
+            with in_process_settings():
+                client = ASGIClient(application("asgi"), state, client_delay)
+                samples = asyncio.run(
+                    run_tasks(client, state, mix, threads, duration, warmup, seed)
+                )
+        elif target == "wsgi":
+            with in_process_settings():
+                app = application("wsgi")
+                samples = run_threads(
+                    lambda: WSGIClient(app, state, client_delay),
+                    state, mix, threads, duration, warmup, seed,
+                )
+        else:
+            samples = run_threads(
+                lambda: HTTPClient(target, state),
+                state, mix, threads, duration, warmup, seed,
+            )
+    return samples, watcher.peak
+
+
+def _process_worker(arguments):
+    return run_worker(*arguments)
+
+
+def run_load(
+    target, state, mix, workers, threads, duration, warmup=1, seed=0, client_delay=0
+):
+    """
+    @Description: Runs one configuration: workers processes (the calling process when 1) of threads each.
+    @Return: dict: The summary, see summarise(), with the peak thread count of the busiest worker.
+    """
+    if workers == 1:
+        samples, peak_threads = run_worker(
+            target, state, mix, threads, duration, warmup, seed, client_delay
+        )
+    else:
+        connections.close_all()
+        arguments = [
+            (
+                target, state, mix, threads, duration, warmup,
+                seed + index * threads, client_delay,
+            )
+            for index in range(workers)
+        ]
+        # Spawned rather than forked, so no worker inherits the parent's open
+        # database connections or locks; each sets Django up before unpickling
+        # its task.
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(workers, initializer=django.setup) as pool:
+            results = pool.map(_process_worker, arguments)
+        samples = [sample for chunk, _ in results for sample in chunk]
+        peak_threads = max(peak for _, peak in results)
+    summary = summarise(samples, duration)
+    summary.update(
+        {"workers": workers, "threads": threads, "peak_threads": peak_threads}
+    )
+    return summary
+
+
+def histogram(latencies_ms):
+    """
+    @Description: Counts latencies into HISTOGRAM_BOUNDS_MS buckets.
+    @Return: dict: {"<=1": count, ..., ">5000": count}.
+    """
+    counts = Counter()
+    for latency in latencies_ms:
+        bucket = next(
+            (f"<={bound}" for bound in HISTOGRAM_BOUNDS_MS if latency <= bound),
+            f">{HISTOGRAM_BOUNDS_MS[-1]}",
+        )
+        counts[bucket] += 1
+    labels = [f"<={bound}" for bound in HISTOGRAM_BOUNDS_MS]
+    return {label: counts[label] for label in labels + [f">{HISTOGRAM_BOUNDS_MS[-1]}"]}
+
+
+def latency_summary(samples):
+    ordered = sorted(sample.latency for sample in samples)
+    return {
+        "p50": percentile(ordered, 50),
+        "p90": percentile(ordered, 90),
+        "p99": percentile(ordered, 99),
+        "max": round(ordered[-1] * 1000, 3) if ordered else None,
+    }
+
+
+def is_error(sample):
+    return sample.status is None or sample.status >= 400
+
+
+def summarise(samples, duration):
+    """
+    @Description: Throughput, errors and latency of one run.
+    @Param: samples (list): The run's Samples.
+    @Param: duration (float): The measured seconds.
+    @Return: dict: requests, throughput (req/s), errors, error_rate, statuses, latency_ms percentiles, histogram and the same figures per operation.
+    """
+    errors = sum(1 for sample in samples if is_error(sample))
+    operations = {}
+    for operation in sorted({sample.operation for sample in samples}):
+        subset = [sample for sample in samples if sample.operation == operation]
+        operations[operation] = {
+            "requests": len(subset),
+            "errors": sum(1 for sample in subset if is_error(sample)),
+            "latency_ms": latency_summary(subset),
+        }
+    return {
+        "requests": len(samples),
+        "throughput": round(len(samples) / duration, 1),
+        "errors": errors,
+        "error_rate": round(errors / len(samples), 4) if samples else 0.0,
+        "statuses": dict(
+            Counter(str(sample.status or "failed") for sample in samples)
+        ),
+        "latency_ms": latency_summary(samples),
+        "histogram": histogram(sample.latency * 1000 for sample in samples),
+        "operations": operations,
+    }
@@ -0,0 +1,82 @@
+"""
+@Description: Management command that measures the render time of each project template, parsed on every render (no loader cache) and with the configured cached loader and fragment cache.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+import os
+import time
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.template import Engine, RequestContext, engines
+from django.test import RequestFactory
+
+UNCACHED_LOADERS = [
+    "django.template.loaders.filesystem.Loader",
+    "django.template.loaders.app_directories.Loader",
+]
+
+
+class Command(BaseCommand):
+    help = "Benchmarks template render times with and without template caching."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=200,
+            help="Renders timed per template and mode.",
+        )
+        parser.add_argument(
+            "--template",
+            action="append",
+            help="Only benchmark this template (repeatable). Defaults to every "
+            "template in the project's template directories.",
+        )
+
+    def handle(self, *args, **options):
+        cached = engines["django"].engine
+        uncached = Engine(
+            dirs=cached.dirs,
+            loaders=UNCACHED_LOADERS,
+            context_processors=cached.context_processors,
+            debug=cached.debug,
+            string_if_invalid=cached.string_if_invalid,
+            libraries=cached.libraries,
+            builtins=cached.builtins[len(Engine.default_builtins):],
+        )
+        request = RequestFactory().get("/")
+        request.user = AnonymousUser()
+        iterations = options["iterations"]
+        self.stdout.write(
+            f"{'template':<24} {'uncached ms':>12} {'cached ms':>10} {'speedup':>8}"
+        )
+        for name in options["template"] or self.project_templates(cached):
+            slow = self.time(uncached, name, request, iterations)
+            fast = self.time(cached, name, request, iterations)
+            self.stdout.write(
+                f"{name:<24} {slow:>12.3f} {fast:>10.3f} {slow / fast:>7.1f}x"
+            )
+
+    def project_templates(self, engine):
+        names = []
+        for directory in engine.dirs:
+            for root, _, files in os.walk(directory):
+                for filename in files:
+                    if filename.endswith(".html"):
+                        path = os.path.join(root, filename)
+                        names.append(os.path.relpath(path, directory))
+        return sorted(names)
+
+    def time(self, engine, name, request, iterations):
+        # One untimed render warms the loader and fragment caches.
+        engine.get_template(name).render(RequestContext(request))
+        started = time.perf_counter()
+        for _ in range(iterations):
+            engine.get_template(name).render(RequestContext(request))
+        return (time.perf_counter() - started) / iterations * 1000
@@ -0,0 +1,82 @@
+"""
+@Description: Management command that bulk imports products, suppliers, customers or inventory from a CSV or JSON Lines file.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+import json
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from inventory.importers import DEFAULT_CHUNK_SIZE, IMPORTERS, import_rows, read_rows
+
+
+class Command(BaseCommand):
+    help = "Imports rows from a CSV or JSON Lines file, validating them with the model's form."
+
+    def add_arguments(self, parser):
+        parser.add_argument("model", choices=sorted(IMPORTERS))
+        parser.add_argument("path", help="The file to import.")
+        parser.add_argument(
+            "--format",
+            choices=["csv", "jsonl"],
+            help="The file format. Defaults to the file extension.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Rows validated and written per transaction.",
+        )
+        parser.add_argument(
+            "--errors",
+            help="Write rejected rows with their errors to this JSON Lines file.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to import into.",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        fmt = options["format"] or os.path.splitext(path)[1].lstrip(".").lower()
+        if fmt not in ("csv", "jsonl"):
+            raise CommandError("Pass --format csv or --format jsonl.")
+
+        error_file = open(options["errors"], "w") if options["errors"] else None
+
+        def on_error(line, row, errors):
+            if error_file:
+                error_file.write(
+                    json.dumps({"line": line, "row": row, "errors": errors}) + "\n"
+                )
+
+        started = time.perf_counter()
+        try:
+            with open(path, encoding="utf-8-sig", newline="") as stream:
+                result = import_rows(
+                    options["model"],
+                    read_rows(stream, fmt),
+                    chunk_size=options["chunk_size"],
+                    on_error=on_error,
+                    using=options["database"],
+                )
+        finally:
+            if error_file:
+                error_file.close()
+        elapsed = time.perf_counter() - started
+
+        rows = result.created + result.updated + result.rejected
+        self.stdout.write(
+            f"{result.created} created, {result.updated} updated, "
+            f"{result.rejected} rejected in {elapsed:.2f}s "
+            f"({rows / elapsed if elapsed else 0:.0f} rows/s)"
+        )
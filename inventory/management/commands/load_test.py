@@ -0,0 +1,154 @@
+"""
+@Description: Management command that load-tests the application with a mix of list, search, add and update calls and sweeps worker and thread counts.
+--target wsgi or asgi drives django_project.wsgi / django_project.asgi in-process; a URL drives a running server instead, in which case --workers and --threads set the client's concurrency and the server's own worker count is swept by restarting it (for example gunicorn --workers N --threads M) between runs. The session the calls use is created in the configured database, so a server under test must share it and allow its host name in ALLOWED_HOSTS. Seed the database first (seed_inventory); add calls create products.
+--client-delay turns the in-process clients into slow readers, and the "peak thr" column shows the most threads alive at once in a worker process. Compare, for example, --target wsgi --threads 8,32 with --target asgi --threads 8,32,128 at --client-delay 0.2; the asgi target serves the async views unless ASYNC_VIEWS=0.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+import json
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from inventory.benchmarks import environment
+from inventory.loadtest import DEFAULT_MIX, cleanup, parse_mix, prepare, run_load
+
+
+def counts(text):
+    return [int(count) for count in text.split(",")]
+
+
+class Command(BaseCommand):
+    help = "Replays a traffic mix against the WSGI/ASGI application or a server."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--target",
+            default="wsgi",
+            help="wsgi, asgi (both in-process) or the base URL of a running server.",
+        )
+        parser.add_argument(
+            "--mix",
+            default=",".join(f"{name}={share}" for name, share in DEFAULT_MIX.items()),
+            help="Weights of the list, search, add and update calls.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=counts,
+            default=[1],
+            help="Comma separated process counts to sweep (in-process targets).",
+        )
+        parser.add_argument(
+            "--threads",
+            type=counts,
+            default=[1, 4, 8],
+            help="Comma separated threads per worker to sweep; asyncio tasks for asgi.",
+        )
+        parser.add_argument(
+            "--duration", type=float, default=10, help="Measured seconds per run."
+        )
+        parser.add_argument(
+            "--warmup",
+            type=float,
+            default=1,
+            help="Seconds per run before measuring starts.",
+        )
+        parser.add_argument(
+            "--client-delay",
+            type=float,
+            default=0,
+            help="Seconds each in-process client takes to read a response.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--output", default=None, help="Write the results as JSON to this file."
+        )
+
+    def handle(self, *args, **options):
+        target = options["target"]
+        in_process = target in ("wsgi", "asgi")
+        if not in_process and not target.startswith(("http://", "https://")):
+            raise CommandError("--target must be wsgi, asgi or an http(s) URL.")
+        if options["client_delay"] and not in_process:
+            raise CommandError("--client-delay only applies to wsgi and asgi.")
+        try:
+            mix = parse_mix(options["mix"])
+            state = prepare()
+        except (ValueError, LookupError) as exc:
+            raise CommandError(str(exc))
+        try:
+            self.stdout.write(
+                f"{'workers':>7} {'threads':>7} {'req/s':>9} {'p50 ms':>9} "
+                f"{'p90 ms':>9} {'p99 ms':>9} {'errors':>7} {'peak thr':>8}"
+            )
+            runs = []
+            for workers in options["workers"]:
+                for threads in options["threads"]:
+                    summary = run_load(
+                        target,
+                        state,
+                        mix,
+                        workers,
+                        threads,
+                        options["duration"],
+                        options["warmup"],
+                        options["seed"],
+                        options["client_delay"],
+                    )
+                    runs.append(summary)
+                    self.report(summary, options["verbosity"])
+        finally:
+            cleanup(state)
+        if not runs or not any(run["requests"] for run in runs):
+            raise CommandError("No requests completed.")
+        peak = max(runs, key=lambda run: run["throughput"])
+        self.stdout.write(
+            f"Peak {peak['throughput']:.1f} req/s with {peak['workers']} worker(s) "
+            f"x {peak['threads']} thread(s), p99 {peak['latency_ms']['p99']} ms."
+        )
+        if options["output"]:
+            result = environment()
+            result.update(
+                {
+                    "target": target,
+                    "mix": mix,
+                    "duration": options["duration"],
+                    "warmup": options["warmup"],
+                    "client_delay": options["client_delay"],
+                    "runs": runs,
+                }
+            )
+            os.makedirs(
+                os.path.dirname(os.path.abspath(options["output"])), exist_ok=True
+            )
+            with open(options["output"], "w", encoding="utf-8") as output:
+                json.dump(result, output, indent=2)
+            self.stdout.write(f"Results written to {options['output']}")
+
+    def report(self, summary, verbosity):
+        latency = summary["latency_ms"]
+        self.stdout.write(
+            f"{summary['workers']:>7} {summary['threads']:>7} "
+            f"{summary['throughput']:>9.1f} {latency['p50'] or 0:>9.2f} "
+            f"{latency['p90'] or 0:>9.2f} {latency['p99'] or 0:>9.2f} "
+            f"{summary['error_rate']:>7.1%} {summary['peak_threads']:>8}"
+        )
+        if verbosity < 2:
+            return
+        largest = max(summary["histogram"].values()) or 1
+        for bucket, count in summary["histogram"].items():
+            bar = "#" * round(40 * count / largest)
+            self.stdout.write(f"    {bucket:>7} ms {count:>7} {bar}")
+        for operation, figures in summary["operations"].items():
+            self.stdout.write(
+                f"    {operation:<7} {figures['requests']:>7} requests "
+                f"{figures['errors']:>5} errors  p50 {figures['latency_ms']['p50']} ms"
+                f"  p99 {figures['latency_ms']['p99']} ms"
+            )
+        if summary["errors"]:
+            self.stdout.write(f"    statuses: {summary['statuses']}")
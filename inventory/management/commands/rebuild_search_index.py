@@ -0,0 +1,33 @@
+"""
+@Description: Management command that repopulates the search index from the tables it mirrors.
+Run it after bulk loads, which bypass the post_save signals that normally keep the index current.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from inventory.search import SEARCH_FIELDS, get_backend
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the search index used by the search_* views."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to rebuild the index in.",
+        )
+
+    def handle(self, *args, **options):
+        backend = get_backend(options["database"])
+        for model in SEARCH_FIELDS:
+            with transaction.atomic(using=options["database"]):
+                backend.rebuild(model)
+            self.stdout.write(f"Indexed {model._meta.verbose_name_plural}")
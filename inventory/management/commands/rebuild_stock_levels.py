@@ -0,0 +1,131 @@
+"""
+@Description: Management command that recomputes the StockLevel projection from the InventoryTransaction and StockAdjustment ledgers.
+Products are processed in chunks of consecutive ids; each chunk is summed in the database and written in its own transaction, so the command can repair a large table without holding one long lock.
+The chunk's StockLevel rows are locked before the ledgers are summed, so a ledger write that lands during the rebuild waits for the chunk and then adds its delta to the rebuilt row. The exception is the first ledger row of a product and warehouse that has no stock level yet: its row is created without a lock to wait on, and the rebuild fails on the unique constraint and can be run again.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import Case, F, Sum, When
+from django.utils import timezone
+
+from inventory.models import (
+    Product,
+    InventoryTransaction,
+    StockAdjustment,
+    StockLevel,
+)
+
+
+class Command(BaseCommand):
+    help = "Recomputes per-warehouse stock levels from the inventory ledgers."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of products recomputed per transaction.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to rebuild stock levels in.",
+        )
+
+    def handle(self, *args, **options):
+        using = options["database"]
+        chunk_size = options["chunk_size"]
+        last_id = 0
+        total = 0
+        while True:
+            product_ids = list(
+                Product.objects.using(using)
+                .filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", flat=True)[:chunk_size]
+            )
+            if not product_ids:
+                break
+            total += self.rebuild_chunk(
+                using, product_ids[0], product_ids[-1], chunk_size
+            )
+            last_id = product_ids[-1]
+        self.stdout.write(f"Rebuilt {total} stock levels")
+
+    def rebuild_chunk(self, using, first_id, last_id, chunk_size):
+        """
+        @Description: Recomputes the stock levels of the products whose ids fall in [first_id, last_id].
+        Existing rows are locked with select_for_update() and updated in place rather than deleted and recreated, so StockLevel.apply_delta() calls blocked on them apply their delta on top of the rebuilt quantity.
+        @Return: int: The number of stock level rows written.
+        """
+        in_range = {"product_id__gte": first_id, "product_id__lte": last_id}
+        with transaction.atomic(using=using):
+            # Lock first: ledger rows committed before the lock is granted are in
+            # the sums below, and writers arriving later wait for this transaction.
+            existing = {
+                (level.product_id, level.warehouse_id): level
+                for level in StockLevel.objects.using(using)
+                .select_for_update()
+                .filter(**in_range)
+            }
+            totals = defaultdict(int)
+            transactions = (
+                InventoryTransaction.objects.using(using)
+                .filter(**in_range)
+                .values("product_id", "warehouse_id")
+                .annotate(
+                    total=Sum(
+                        Case(
+                            When(transaction_type="OUT", then=-F("quantity")),
+                            default=F("quantity"),
+                        )
+                    )
+                )
+                .order_by()
+            )
+            adjustments = (
+                StockAdjustment.objects.using(using)
+                .filter(**in_range)
+                .values("product_id", "warehouse_id")
+                .annotate(total=Sum("quantity"))
+                .order_by()
+            )
+            # Streamed with server-side cursors on PostgreSQL.
+            for rows in (transactions, adjustments):
+                for row in rows.iterator(chunk_size=chunk_size):
+                    totals[row["product_id"], row["warehouse_id"]] += row["total"]
+
+            now = timezone.now()
+            changed = []
+            created = []
+            for key, quantity in totals.items():
+                level = existing.pop(key, None)
+                if level is None:
+                    product_id, warehouse_id = key
+                    created.append(
+                        StockLevel(
+                            product_id=product_id,
+                            warehouse_id=warehouse_id,
+                            quantity=quantity,
+                            last_updated=now,
+                        )
+                    )
+                elif level.quantity != quantity:
+                    level.quantity = quantity
+                    level.last_updated = now
+                    changed.append(level)
+            manager = StockLevel.objects.using(using)
+            manager.bulk_update(changed, ["quantity", "last_updated"], batch_size=1000)
+            manager.bulk_create(created, batch_size=1000)
+            # Rows left over have no ledger entries any more.
+            manager.filter(pk__in=[level.pk for level in existing.values()]).delete()
+        return len(totals)
@@ -0,0 +1,161 @@
+"""
+@Description: Management command that runs the benchmark suite in inventory.benchmarks and stores the results as JSON.
+By default every --scale gets a fresh SQLite database, seeded with the same seed, so runs on different commits measure the same rows; --current measures the configured database as it is instead; whatever the suite writes there is rolled back when the run ends. --compare prints the change against an earlier results file.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+import json
+import os
+import tempfile
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from inventory.benchmarks import (
+    DEFAULT_MIN_TIME,
+    DEFAULT_REPEAT,
+    DEFAULT_ROWS,
+    compare,
+    environment,
+    prepare_dataset,
+    results_path,
+    run_suite,
+    scratch_database,
+)
+from inventory.seeding import SCALES
+
+
+class Command(BaseCommand):
+    help = "Benchmarks views, forms, serializers and signals on seeded datasets."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scale",
+            choices=list(SCALES),
+            action="append",
+            help="Dataset scale to seed and measure (repeatable). Defaults to tiny.",
+        )
+        parser.add_argument(
+            "--current",
+            action="store_true",
+            help="Measure the configured database as it is instead of seeding.",
+        )
+        parser.add_argument(
+            "--bench",
+            default=None,
+            help="Only run benchmarks whose name matches this regular expression.",
+        )
+        parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+        parser.add_argument(
+            "--min-time",
+            type=float,
+            default=DEFAULT_MIN_TIME,
+            help="Minimum seconds per sample.",
+        )
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=DEFAULT_ROWS,
+            help="Rows each serializer benchmark serializes per call.",
+        )
+        parser.add_argument(
+            "--output",
+            default=None,
+            help="Results file. Defaults to a new file in "
+            "settings.INVENTORY_BENCHMARK_DIR.",
+        )
+        parser.add_argument(
+            "--compare",
+            default=None,
+            help="An earlier results file to compare this run against.",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=1.1,
+            help="Slowdown ratio reported as a regression.",
+        )
+        parser.add_argument(
+            "--fail-on-regression",
+            action="store_true",
+            help="Exit with an error if any benchmark is slower than --threshold.",
+        )
+
+    def handle(self, *args, **options):
+        baseline = self.load(options["compare"]) if options["compare"] else None
+        run = environment()
+        run["parameters"] = {
+            "repeat": options["repeat"],
+            "min_time": options["min_time"],
+            "rows": options["rows"],
+        }
+        run["datasets"] = {}
+        suite_options = {
+            "pattern": options["bench"],
+            "repeat": options["repeat"],
+            "min_time": options["min_time"],
+            "rows": options["rows"],
+            "report": self.report,
+        }
+        if options["current"]:
+            self.stdout.write("dataset: current database")
+            run["datasets"]["current"] = {
+                "rows": None,
+                "results": run_suite(**suite_options),
+            }
+        else:
+            with tempfile.TemporaryDirectory() as directory:
+                for scale in options["scale"] or ["tiny"]:
+                    path = os.path.join(directory, f"{scale}.sqlite3")
+                    with scratch_database(path):
+                        self.stdout.write(f"dataset: {scale}")
+                        written = prepare_dataset(scale, stdout=self.stdout)
+                        run["datasets"][scale] = {
+                            "rows": written,
+                            "results": run_suite(**suite_options),
+                        }
+        path = options["output"] or results_path(
+            settings.INVENTORY_BENCHMARK_DIR, run
+        )
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as output:
+            json.dump(run, output, indent=2, sort_keys=True)
+        self.stdout.write(f"Results written to {path}")
+        if baseline is not None:
+            self.print_comparison(baseline, run, options)
+
+    def report(self, name, result):
+        if "skipped" in result:
+            self.stdout.write(f"  {name:<48} skipped ({result['skipped']})")
+            return
+        self.stdout.write(
+            f"  {name:<48} {result['median'] * 1000:>10.3f} ms "
+            f"± {result['stdev'] * 1000:>8.3f}  {result['per_second']:>10.0f}/s"
+        )
+
+    def load(self, path):
+        try:
+            with open(path, encoding="utf-8") as results:
+                return json.load(results)
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"Cannot read results file {path}: {exc}")
+
+    def print_comparison(self, baseline, run, options):
+        self.stdout.write(
+            f"Compared with {(baseline.get('commit') or 'unknown')[:10]} "
+            f"({baseline.get('timestamp')}):"
+        )
+        rows = compare(baseline, run, options["threshold"])
+        for dataset, name, before, after, ratio, change in rows:
+            self.stdout.write(
+                f"  {dataset:<8} {name:<48} {before * 1000:>10.3f} ms -> "
+                f"{after * 1000:>10.3f} ms  x{ratio:.2f} {change}"
+            )
+        regressions = [row for row in rows if row[5] == "slower"]
+        if regressions and options["fail_on_regression"]:
+            raise CommandError(f"{len(regressions)} benchmark(s) regressed.")
@@ -0,0 +1,105 @@
+"""
+@Description: Management command that fills the database with a synthetic, deterministic dataset for local load and performance work (see inventory/seeding.py).
+Rows are appended to whatever is already there. Afterwards the StockLevel projection and the search index are rebuilt, and the page cache versions are bumped, because bulk inserts send no signals.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+import time
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+
+from inventory.caching import bump_version
+from inventory.models import Product, Supplier, Warehouse
+from inventory.seeding import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_DAYS,
+    DEFAULT_SEED,
+    SCALES,
+    seed,
+)
+
+
+class Command(BaseCommand):
+    help = "Generates a large, realistically skewed synthetic dataset."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scale",
+            choices=list(SCALES),
+            default="small",
+            help="Base volumes; 'large' is about 10M rows.",
+        )
+        parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Rows per bulk_create and transaction.",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=DEFAULT_DAYS,
+            help="Days of history the dates are spread over.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to seed.",
+        )
+        parser.add_argument(
+            "--skip-rebuild",
+            action="store_true",
+            help="Do not rebuild stock levels and the search index afterwards.",
+        )
+        for name in SCALES["tiny"]:
+            parser.add_argument(
+                f"--{name.replace('_', '-')}",
+                type=int,
+                dest=name,
+                help=f"Override the scale's number of {name.replace('_', ' ')}.",
+            )
+
+    def handle(self, *args, **options):
+        using = options["database"]
+        counts = {
+            name: options[name]
+            for name in SCALES["tiny"]
+            if options.get(name) is not None
+        }
+        started = time.perf_counter()
+        written = seed(
+            options["scale"],
+            seed=options["seed"],
+            counts=counts,
+            chunk_size=options["chunk_size"],
+            using=using,
+            days=options["days"],
+            progress=self.progress if options["verbosity"] >= 2 else None,
+        )
+        elapsed = time.perf_counter() - started
+        total = sum(written.values())
+        for label, count in written.items():
+            self.stdout.write(f"{label:<34} {count:>10}")
+        self.stdout.write(
+            f"Wrote {total} rows in {elapsed:.1f}s ({total / elapsed:.0f} rows/s)"
+        )
+        if not options["skip_rebuild"]:
+            for command in ("rebuild_stock_levels", "rebuild_search_index"):
+                call_command(
+                    command,
+                    database=using,
+                    verbosity=options["verbosity"],
+                    stdout=self.stdout,
+                )
+        bump_version(Product, Supplier, Warehouse, using=using)
+
+    def progress(self, model, written):
+        self.stdout.write(f"  {model._meta.label}: {written}")
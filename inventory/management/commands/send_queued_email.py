@@ -0,0 +1,51 @@
+"""
+@Description: Management command that delivers the queued emails of the outbox, meant to run as its own process next to the web workers.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from inventory.outbox import DEFAULT_BATCH_SIZE, send_batch
+
+
+class Command(BaseCommand):
+    help = "Sends queued emails in batches, retrying failures with backoff."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Messages sent per mail connection.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running, polling for new messages.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="Seconds to wait when the outbox is empty (with --loop).",
+        )
+
+    def handle(self, *args, **options):
+        total_sent = total_failed = 0
+        while True:
+            sent, failed = send_batch(options["batch_size"])
+            total_sent += sent
+            total_failed += failed
+            if sent or failed:
+                continue
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
+        self.stdout.write(f"{total_sent} sent, {total_failed} failed")
@@ -0,0 +1,107 @@
+"""
+@Description: Management command that summarises the slow-query log by SQL fingerprint: how often each statement shape was slow, its total, mean and worst duration, the views and code lines that ran it, and the plan of its slowest run.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+import glob
+import json
+from collections import Counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from inventory.slowlog import fingerprint
+
+
+class Command(BaseCommand):
+    help = "Aggregates the slow-query log by normalised SQL fingerprint."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--log",
+            default=None,
+            help="The log file; rotated files next to it are read too. "
+            "Defaults to settings.INVENTORY_SLOW_QUERY_LOG.",
+        )
+        parser.add_argument(
+            "--limit", type=int, default=20, help="Fingerprints to show."
+        )
+        parser.add_argument(
+            "--json", action="store_true", help="Print the summary as JSON."
+        )
+
+    def handle(self, *args, **options):
+        path = options["log"] or settings.INVENTORY_SLOW_QUERY_LOG
+        files = sorted(glob.glob(glob.escape(path) + ".*")) + glob.glob(
+            glob.escape(path)
+        )
+        if not files:
+            raise CommandError(f"No slow-query log at {path}.")
+        groups = {}
+        for entry in self.read(files):
+            key = fingerprint(entry["sql"])
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = {
+                    "fingerprint": key,
+                    "count": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "views": Counter(),
+                    "frames": Counter(),
+                    "slowest": None,
+                }
+            group["count"] += 1
+            group["total_ms"] += entry["duration_ms"]
+            group["views"][entry.get("view") or "-"] += 1
+            frame = entry.get("frame")
+            if frame:
+                group["frames"][f"{frame['file']}:{frame['line']}"] += 1
+            if entry["duration_ms"] >= group["max_ms"]:
+                group["max_ms"] = entry["duration_ms"]
+                group["slowest"] = entry
+        report = [
+            self.summarise(group)
+            for group in sorted(groups.values(), key=lambda g: -g["total_ms"])
+        ][: options["limit"]]
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+        for group in report:
+            self.stdout.write(
+                f"{group['count']:>6}x  total {group['total_ms']:.1f} ms  "
+                f"mean {group['mean_ms']:.1f} ms  max {group['max_ms']:.1f} ms"
+            )
+            self.stdout.write(f"  {group['fingerprint']}")
+            self.stdout.write(f"  views: {', '.join(group['views'])}")
+            if group["frames"]:
+                self.stdout.write(f"  code: {', '.join(group['frames'])}")
+            for line in group["explain"] or []:
+                self.stdout.write(f"  plan: {line}")
+            self.stdout.write("")
+
+    def read(self, files):
+        for name in files:
+            with open(name, encoding="utf-8") as log:
+                for line in log:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue
+
+    def summarise(self, group):
+        return {
+            "fingerprint": group["fingerprint"],
+            "count": group["count"],
+            "total_ms": round(group["total_ms"], 3),
+            "mean_ms": round(group["total_ms"] / group["count"], 3),
+            "max_ms": group["max_ms"],
+            "views": [name for name, _ in group["views"].most_common(5)],
+            "frames": [name for name, _ in group["frames"].most_common(5)],
+            "explain": group["slowest"].get("explain"),
+        }
@@ -0,0 +1,136 @@
+"""
+@Description: In-process request metrics collected by RequestMetricsMiddleware.
+For every resolved view the registry keeps the request count, a bounded window of recent latencies (for p50/p95/p99), the number of queries, the time spent in the database, and the SQL statements repeated within one request, which usually means an N+1 query. Recording a request is a few dictionary updates under a lock; percentiles are only computed when the report is read.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+import threading
+import time
+from collections import Counter, deque
+
+from django.conf import settings
+
+DEFAULT_SAMPLES = 1024
+# A statement run this many times in one request is reported as a likely N+1.
+DEFAULT_DUPLICATE_THRESHOLD = 5
+# Distinct duplicated statements kept per view.
+MAX_DUPLICATES = 20
+
+
+class QueryRecorder:
+    """
+    @Description: Database execute wrapper counting a request's queries and their time.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+            # Parameters are passed separately, so the SQL text is the statement's signature.
+            self.statements[sql] += 1
+
+    def duplicates(self, threshold):
+        return {
+            sql: count for sql, count in self.statements.items() if count >= threshold
+        }
+
+
+class ViewMetrics:
+    def __init__(self, samples):
+        self.count = 0
+        self.latencies = deque(maxlen=samples)
+        self.queries = 0
+        self.db_time = 0.0
+        self.duplicates = {}
+
+    def add(self, latency, recorder, duplicates):
+        self.count += 1
+        self.latencies.append(latency)
+        self.queries += recorder.count
+        self.db_time += recorder.duration
+        for sql, count in duplicates.items():
+            if sql in self.duplicates or len(self.duplicates) < MAX_DUPLICATES:
+                seen = self.duplicates.setdefault(sql, {"requests": 0, "max": 0})
+                seen["requests"] += 1
+                seen["max"] = max(seen["max"], count)
+
+    def as_dict(self):
+        latencies = sorted(self.latencies)
+        return {
+            "count": self.count,
+            "p50_ms": percentile(latencies, 50),
+            "p95_ms": percentile(latencies, 95),
+            "p99_ms": percentile(latencies, 99),
+            "queries_per_request": round(self.queries / self.count, 2),
+            "db_ms_per_request": round(self.db_time * 1000 / self.count, 3),
+            "duplicated_sql": [
+                {"sql": sql, **seen}
+                for sql, seen in sorted(
+                    self.duplicates.items(), key=lambda item: -item[1]["requests"]
+                )
+            ],
+        }
+
+
+def percentile(ordered, pct):
+    """
+    @Description: Nearest-rank percentile of already sorted latencies.
+    @Param: ordered (list): Latencies in seconds, ascending.
+    @Param: pct (int): The percentile.
+    @Return: float: The latency in milliseconds, or None without samples.
+    """
+    if not ordered:
+        return None
+    index = max(0, -(-len(ordered) * pct // 100) - 1)
+    return round(ordered[index] * 1000, 3)
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.views = {}
+
+    def record(self, view_name, latency, recorder):
+        samples = getattr(settings, "INVENTORY_METRICS_SAMPLES", DEFAULT_SAMPLES)
+        threshold = getattr(
+            settings,
+            "INVENTORY_METRICS_DUPLICATE_THRESHOLD",
+            DEFAULT_DUPLICATE_THRESHOLD,
+        )
+        duplicates = recorder.duplicates(threshold)
+        with self.lock:
+            metrics = self.views.get(view_name)
+            if metrics is None:
+                metrics = self.views[view_name] = ViewMetrics(samples)
+            metrics.add(latency, recorder, duplicates)
+
+    def report(self):
+        """
+        @Description: Returns the metrics of every view, slowest p95 first.
+        @Return: dict: {view name: metrics}.
+        """
+        with self.lock:
+            views = {name: metrics.as_dict() for name, metrics in self.views.items()}
+        return dict(
+            sorted(views.items(), key=lambda item: -(item[1]["p95_ms"] or 0))
+        )
+
+    def reset(self):
+        with self.lock:
+            self.views.clear()
+
+
+registry = MetricsRegistry()
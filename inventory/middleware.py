@@ -0,0 +1,200 @@
+"""
+@Description: Request middleware for the inventory app.
+RequestMetricsMiddleware records per-view latency and query metrics (see metrics.py).
+ProfilingMiddleware profiles requests on demand (see profiling.py).
+SlowQueryLogMiddleware tells the slow-query log which view is running (see slowlog.py).
+ReplicaRoutingMiddleware routes the reads of read-only views to the replica (see routers.py) and keeps a client on the primary for INVENTORY_REPLICA_STICKY_SECONDS after it writes, so it always reads its own writes.
+All four run natively under both WSGI and ASGI, so an async view served through asgi.py is not pushed onto a worker thread by a synchronous middleware in front of it.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+import re
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from .metrics import QueryRecorder, registry
+from .profiling import (
+    PROFILE_PARAMETER,
+    aprofile_request,
+    profile_request,
+    requested_profiler,
+)
+from .routers import read_alias, replica_alias
+from .slowlog import current_view
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+PIN_PRIMARY_COOKIE = "inventory_primary"
+DEFAULT_STICKY_SECONDS = 5
+DEFAULT_REPLICA_VIEWS = (r"_list$", r"^search_", r"^export_rows$", r"-list$")
+
+
+class HybridMiddleware:
+    """
+    @Description: Base for middleware that runs in whichever mode the handler is in.
+    Subclasses implement call() for WSGI and __acall__() for ASGI. A process_view() hook must not block; under ASGI it is wrapped as a coroutine rather than sent to a thread.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+            hook = getattr(self, "process_view", None)
+            if hook is not None:
+
+                async def process_view(*args):
+                    return hook(*args)
+
+                self.process_view = process_view
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        return self.call(request)
+
+
+class RequestMetricsMiddleware(HybridMiddleware):
+    def __init__(self, get_response):
+        if not getattr(settings, "INVENTORY_METRICS_ENABLED", True):
+            raise MiddlewareNotUsed
+        super().__init__(get_response)
+
+    def call(self, request):
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        with self.recording(recorder):
+            response = self.get_response(request)
+        self.record(request, started, recorder)
+        return response
+
+    async def __acall__(self, request):
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        with self.recording(recorder):
+            response = await self.get_response(request)
+        self.record(request, started, recorder)
+        return response
+
+    def recording(self, recorder):
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(recorder))
+        return stack
+
+    def record(self, request, started, recorder):
+        latency = time.perf_counter() - started
+        match = request.resolver_match
+        registry.record(match.view_name if match else "<unresolved>", latency, recorder)
+
+
+class ProfilingMiddleware(HybridMiddleware):
+    def call(self, request):
+        profiler = requested_profiler(request)
+        if profiler is None:
+            return self.get_response(request)
+        response, name = profile_request(profiler, self.get_response, request)
+        if name:
+            response["X-Profile"] = name
+        return response
+
+    async def __acall__(self, request):
+        if PROFILE_PARAMETER in request.GET:
+            # requested_profiler() checks is_superuser; load the user without
+            # blocking the event loop.
+            request.user = await request.auser()
+        profiler = requested_profiler(request)
+        if profiler is None:
+            return await self.get_response(request)
+        response, name = await aprofile_request(profiler, self.get_response, request)
+        if name:
+            response["X-Profile"] = name
+        return response
+
+
+class SlowQueryLogMiddleware(HybridMiddleware):
+    def call(self, request):
+        token = current_view.set(None)
+        try:
+            return self.get_response(request)
+        finally:
+            current_view.reset(token)
+
+    async def __acall__(self, request):
+        token = current_view.set(None)
+        try:
+            return await self.get_response(request)
+        finally:
+            current_view.reset(token)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        current_view.set(request.resolver_match.view_name)
+
+
+class ReplicaRoutingMiddleware(HybridMiddleware):
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.view_patterns = [
+            re.compile(pattern)
+            for pattern in getattr(
+                settings, "INVENTORY_REPLICA_VIEWS", DEFAULT_REPLICA_VIEWS
+            )
+        ]
+
+    def call(self, request):
+        token = read_alias.set(None)
+        try:
+            response = self.get_response(request)
+        finally:
+            read_alias.reset(token)
+        return self.pin_writer(request, response)
+
+    async def __acall__(self, request):
+        token = read_alias.set(None)
+        try:
+            response = await self.get_response(request)
+        finally:
+            read_alias.reset(token)
+        return self.pin_writer(request, response)
+
+    def pin_writer(self, request, response):
+        if request.method not in SAFE_METHODS and replica_alias():
+            response.set_cookie(
+                PIN_PRIMARY_COOKIE,
+                "1",
+                max_age=getattr(
+                    settings, "INVENTORY_REPLICA_STICKY_SECONDS", DEFAULT_STICKY_SECONDS
+                ),
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        alias = replica_alias()
+        if (
+            alias
+            and request.method in SAFE_METHODS
+            and PIN_PRIMARY_COOKIE not in request.COOKIES
+            and self.is_read_only(request)
+        ):
+            read_alias.set(alias)
+
+    def is_read_only(self, request):
+        match = request.resolver_match
+        name = match.url_name if match else None
+        return bool(name) and any(
+            pattern.search(name) for pattern in self.view_patterns
+        )
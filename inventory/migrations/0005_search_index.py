@@ -0,0 +1,53 @@
+from django.db import migrations
+
+# Mirrors inventory.search.SEARCH_FIELDS at the time this migration was written.
+SEARCH_FIELDS = {
+    "inventory_product": ("product_name", "category", "description"),
+    "inventory_supplier": ("supplier_name", "contact_name", "city"),
+    "inventory_warehouse": ("warehouse_name", "location"),
+    "inventory_customer": ("customer_name", "contact_name", "city"),
+    "inventory_shipment": ("tracking_number", "carrier"),
+}
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for table, fields in SEARCH_FIELDS.items():
+        columns = ", ".join(fields)
+        if vendor == "sqlite":
+            schema_editor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {table}_fts "
+                f"USING fts5({columns}, tokenize='trigram')"
+            )
+            schema_editor.execute(
+                f"INSERT INTO {table}_fts (rowid, {columns}) "
+                f"SELECT id, {columns} FROM {table}"
+            )
+        elif vendor == "postgresql":
+            schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            for field in fields:
+                schema_editor.execute(
+                    f"CREATE INDEX IF NOT EXISTS {table}_{field}_trgm "
+                    f"ON {table} USING gin ({field} gin_trgm_ops)"
+                )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for table, fields in SEARCH_FIELDS.items():
+        if vendor == "sqlite":
+            schema_editor.execute(f"DROP TABLE IF EXISTS {table}_fts")
+        elif vendor == "postgresql":
+            for field in fields:
+                schema_editor.execute(f"DROP INDEX IF EXISTS {table}_{field}_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0004_accountant_salestransaction"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:07
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0005_search_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='role',
+            field=models.CharField(choices=[('Administrator', 'Administrator'), ('Inventory Manager', 'Inventory Manager'), ('Warehouse Staff', 'Warehouse Staff'), ('Purchasing Manager', 'Purchasing Manager'), ('Sales Manager', 'Sales Manager'), ('Customer Service Representative', 'Customer Service Representative'), ('Technical Service Representative', 'Technical Service Representative'), ('Accountant', 'Accountant'), ('Auditor', 'Auditor'), ('System User', 'System User'), ('Customer', 'Customer'), ('Standard User', 'Standard User')], max_length=50),
+        ),
+        migrations.CreateModel(
+            name='StockLevel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('quantity', models.IntegerField(default=0)),
+                ('last_updated', models.DateTimeField(default=django.utils.timezone.now)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='inventory.product')),
+                ('warehouse', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='inventory.warehouse')),
+            ],
+            options={
+                'unique_together': {('product', 'warehouse')},
+            },
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:18
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def mark_existing_sent(apps, schema_editor):
+    # Messages saved before the outbox existed were sent synchronously.
+    EmailAttachment = apps.get_model("inventory", "EmailAttachment")
+    EmailAttachment.objects.using(schema_editor.connection.alias).update(status="Sent")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0007_order_confirmed_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emailattachment',
+            name='attempts',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='emailattachment',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name='emailattachment',
+            name='from_email',
+            field=models.EmailField(blank=True, max_length=254),
+        ),
+        migrations.AddField(
+            model_name='emailattachment',
+            name='last_error',
+            field=models.TextField(blank=True),
+        ),
+        migrations.AddField(
+            model_name='emailattachment',
+            name='next_attempt_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name='emailattachment',
+            name='sent_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='emailattachment',
+            name='status',
+            field=models.CharField(choices=[('Queued', 'Queued'), ('Sending', 'Sending'), ('Sent', 'Sent'), ('Failed', 'Failed')], default='Queued', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='emailattachment',
+            name='attachment',
+            field=models.FileField(blank=True, upload_to='email_attachments/'),
+        ),
+        migrations.AddIndex(
+            model_name='emailattachment',
+            index=models.Index(fields=['status', 'next_attempt_at'], name='inventory_e_status_edc534_idx'),
+        ),
+        migrations.RunPython(mark_existing_sent, migrations.RunPython.noop),
+    ]
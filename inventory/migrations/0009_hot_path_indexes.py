@@ -0,0 +1,82 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0008_email_outbox'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='role',
+            field=models.CharField(choices=[('Administrator', 'Administrator'), ('Inventory Manager', 'Inventory Manager'), ('Warehouse Staff', 'Warehouse Staff'), ('Purchasing Manager', 'Purchasing Manager'), ('Sales Manager', 'Sales Manager'), ('Customer Service Representative', 'Customer Service Representative'), ('Technical Service Representative', 'Technical Service Representative'), ('Accountant', 'Accountant'), ('Auditor', 'Auditor'), ('System User', 'System User'), ('Customer', 'Customer'), ('Standard User', 'Standard User')], db_index=True, max_length=50),
+        ),
+        migrations.AddIndex(
+            model_name='customer',
+            index=models.Index(fields=['created_at', 'id'], name='customer_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customerorder',
+            index=models.Index(fields=['status', 'order_date'], name='custorder_status_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customerorder',
+            index=models.Index(fields=['created_at', 'id'], name='custorder_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['start_time', 'id'], name='event_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='inventorytransaction',
+            index=models.Index(fields=['product', 'warehouse', 'transaction_date'], name='invtxn_prod_wh_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='inventorytransaction',
+            index=models.Index(fields=['transaction_date', 'id'], name='invtxn_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['status', 'order_date'], name='order_status_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['created_at', 'id'], name='order_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['created_at', 'id'], name='product_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='salestransaction',
+            index=models.Index(fields=['customer', 'transaction_date'], name='sale_customer_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='shipment',
+            index=models.Index(fields=['created_at', 'id'], name='shipment_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='stockadjustment',
+            index=models.Index(fields=['product', 'adjustment_date'], name='stockadj_product_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='stockadjustment',
+            index=models.Index(fields=['adjustment_date', 'id'], name='stockadj_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='supplier',
+            index=models.Index(fields=['created_at', 'id'], name='supplier_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('completed', False)), fields=['assigned_to', 'due_date'], name='task_assignee_open_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='warehouse',
+            index=models.Index(fields=['created_at', 'id'], name='warehouse_created_idx'),
+        ),
+    ]
@@ -8,13 +8,19 @@ Version     Author           Date                Logs
 1.0         Jobet Casquejo   2024-5-26           Initial Version
 """
 
+import contextlib
+import contextvars
+
 from django.contrib.auth.base_user import AbstractBaseUser, BaseUserManager
-from django.db import models
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, models, router, transaction
+from django.db.models import F
 from django.contrib.auth.models import AbstractUser, Group, Permission, PermissionsMixin
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth import get_user_model
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
 User = get_user_model()
@@ -99,10 +105,38 @@ class InternalUser(AbstractBaseUser):
 
 
 class EmailAttachment(models.Model):
+    """
+    @Description: An outbound email composed by an administrator. Rows double as the outbox read by the send_queued_email worker.
+    @Fields:
+        - customer_email, subject, body, attachment: The message; the attachment is optional.
+        - from_email: The sender, defaulting to settings.DEFAULT_FROM_EMAIL when blank.
+        - status: Queued until sent, Sending while a worker holds it, then Sent, or Failed once retries run out.
+        - attempts: The number of failed delivery attempts.
+        - next_attempt_at: When the message may next be picked up; a worker's claim on a Sending row lapses at this time.
+        - last_error: The error of the most recent failed attempt.
+        - created_at, sent_at: When the message was queued and delivered.
+    """
+
+    STATUS_CHOICES = [
+        ("Queued", "Queued"),
+        ("Sending", "Sending"),
+        ("Sent", "Sent"),
+        ("Failed", "Failed"),
+    ]
     customer_email = models.EmailField()
     subject = models.CharField(max_length=255)
     body = models.TextField()
-    attachment = models.FileField(upload_to='email_attachments/')
+    attachment = models.FileField(upload_to='email_attachments/', blank=True)
+    from_email = models.EmailField(blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="Queued")
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    sent_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "next_attempt_at"])]
 
     def __str__(self):
         return self.customer_email
@@ -142,7 +176,7 @@ class User(AbstractUser, PermissionsMixin):
         ("Customer", "Customer"),
         ("Standard User", "Standard User"),
     ]
-    role = models.CharField(max_length=50, choices=ROLE_CHOICES)
+    role = models.CharField(max_length=50, choices=ROLE_CHOICES, db_index=True)
 
     groups = models.ManyToManyField(
         Group,
@@ -180,6 +214,11 @@ class Product(models.Model):
     reorder_level = models.IntegerField(default=0)
     created_at = models.DateTimeField(default=timezone.now)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="product_created_idx"),
+        ]
+
     def __str__(self):
         return self.product_name
 
@@ -209,6 +248,11 @@ class Supplier(models.Model):
     phone = models.CharField(max_length=50, blank=True, null=True)
     created_at = models.DateTimeField(default=timezone.now)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="supplier_created_idx"),
+        ]
+
     def __str__(self):
         return self.supplier_name
 
@@ -243,6 +287,11 @@ class Warehouse(models.Model):
     location = models.CharField(max_length=255)
     created_at = models.DateTimeField(default=timezone.now)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="warehouse_created_idx"),
+        ]
+
     def __str__(self):
         return self.warehouse_name
 
@@ -281,6 +330,7 @@ class Order(models.Model):
     ORDER_STATUS_CHOICES = [
         ("Pending", "Pending"),
         ("Placed", "Placed"),
+        ("Confirmed", "Confirmed"),
         ("Shipped", "Shipped"),
         ("Delivered", "Delivered"),
         ("Cancelled", "Cancelled"),
@@ -294,11 +344,19 @@ class Order(models.Model):
     )
     created_at = models.DateTimeField(default=timezone.now)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "order_date"], name="order_status_date_idx"),
+            models.Index(fields=["created_at", "id"], name="order_created_idx"),
+        ]
+
     def __str__(self):
+        if self.supplier_id is None:
+            return f"Order {self.id}"
         return f"Order {self.id} from {self.supplier.supplier_name}"
 
     def can_be_cancelled(self):
-        return self.status in ["Pending", "Placed"]
+        return self.status in ["Pending", "Placed", "Confirmed"]
 
     def cancel(self):
         if self.can_be_cancelled():
@@ -307,6 +365,64 @@ class Order(models.Model):
             return True
         return False
 
+    def can_be_confirmed(self):
+        return self.status in ["Pending", "Placed"]
+
+    def confirm(self, lines, using=None):
+        """
+        @Description: Confirms the order and records its line items.
+        All detail rows are built in memory and inserted with one bulk_create, so confirming costs the same number of queries for any number of lines. The order row is locked first; confirming an order that is already Confirmed returns its existing details without adding any.
+        @Param: lines (iterable): Dictionaries with "product" (a Product or its id), "quantity" and optionally "unit_price", which defaults to the product's unit price.
+        @Param: using (str): The database alias, defaulting to the router's choice.
+        @Return: list: The OrderDetail rows of the order.
+        @Raises: ValidationError: If the order is Shipped, Delivered or Cancelled, or a line names a product that does not exist; nothing is written then.
+        """
+        using = using or router.db_for_write(Order, instance=self)
+        with transaction.atomic(using=using):
+            order = Order.objects.using(using).select_for_update().get(pk=self.pk)
+            if order.status == "Confirmed":
+                self.status = order.status
+                return list(OrderDetail.objects.using(using).filter(order=order))
+            if not order.can_be_confirmed():
+                raise ValidationError(f"A {order.status} order cannot be confirmed.")
+
+            lines = list(lines)
+            ids = [
+                line["product"]
+                for line in lines
+                if not isinstance(line["product"], Product)
+            ]
+            products = Product.objects.using(using).in_bulk(ids)
+            unknown = [
+                f"Line {number}: product {line['product']} does not exist."
+                for number, line in enumerate(lines, start=1)
+                if not isinstance(line["product"], Product)
+                and line["product"] not in products
+            ]
+            if unknown:
+                raise ValidationError(unknown)
+            details = []
+            for line in lines:
+                product = line["product"]
+                if not isinstance(product, Product):
+                    product = products[product]
+                unit_price = line.get("unit_price")
+                if unit_price is None:
+                    unit_price = product.unit_price
+                details.append(
+                    OrderDetail(
+                        order=order,
+                        product=product,
+                        quantity=line["quantity"],
+                        unit_price=unit_price,
+                    )
+                )
+            OrderDetail.objects.using(using).bulk_create(details)
+
+            order.status = self.status = "Confirmed"
+            order.save(using=using, update_fields=["status"])
+        return details
+
 
 class OrderDetail(models.Model):
     """
@@ -344,6 +460,11 @@ class Customer(models.Model):
     phone = models.CharField(max_length=50, blank=True, null=True)
     created_at = models.DateTimeField(default=timezone.now)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="customer_created_idx"),
+        ]
+
     def __str__(self):
         return self.customer_name
 
@@ -370,6 +491,14 @@ class CustomerOrder(models.Model):
     )
     created_at = models.DateTimeField(default=timezone.now)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["status", "order_date"], name="custorder_status_date_idx"
+            ),
+            models.Index(fields=["created_at", "id"], name="custorder_created_idx"),
+        ]
+
 
 class CustomerOrderDetail(models.Model):
     """
@@ -412,6 +541,11 @@ class Shipment(models.Model):
     )
     created_at = models.DateTimeField(default=timezone.now)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="shipment_created_idx"),
+        ]
+
 
 class ShipmentDetail(models.Model):
     """
@@ -448,6 +582,28 @@ class StockAdjustment(models.Model):
     quantity = models.IntegerField()
     reason = models.CharField(max_length=255, blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["product", "adjustment_date"], name="stockadj_product_date_idx"
+            ),
+            models.Index(fields=["adjustment_date", "id"], name="stockadj_date_idx"),
+        ]
+
+    def stock_delta(self):
+        return self.quantity
+
+    def save(self, *args, **kwargs):
+        # Keeps the row and its StockLevel update in one transaction.
+        using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            return super().delete(*args, **kwargs)
+
 
 class InventoryTransaction(models.Model):
     """
@@ -470,6 +626,79 @@ class InventoryTransaction(models.Model):
         max_length=50, choices=TRANSACTION_TYPE_CHOICES)
     transaction_date = models.DateTimeField(default=timezone.now)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["product", "warehouse", "transaction_date"],
+                name="invtxn_prod_wh_date_idx",
+            ),
+            models.Index(fields=["transaction_date", "id"], name="invtxn_date_idx"),
+        ]
+
+    def stock_delta(self):
+        return -self.quantity if self.transaction_type == "OUT" else self.quantity
+
+    def save(self, *args, **kwargs):
+        # Keeps the row and its StockLevel update in one transaction.
+        using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            return super().delete(*args, **kwargs)
+
+
+class StockLevel(models.Model):
+    """
+    @Description: The StockLevel model is a running total of stock per product and warehouse, derived from the InventoryTransaction and StockAdjustment ledgers.
+    It is updated incrementally whenever a ledger row is saved or deleted, so reports can read current stock without summing the ledgers. The rebuild_stock_levels command recomputes it from scratch.
+    @Fields:
+        - product: A foreign key field linking to an instance of the Product model.
+        - warehouse: A foreign key field linking to an instance of the Warehouse model.
+        - quantity: An integer field holding the net quantity in stock.
+        - last_updated: A datetime field recording when the quantity last changed.
+    """
+
+    product = models.ForeignKey(Product, on_delete=models.CASCADE)
+    warehouse = models.ForeignKey(Warehouse, on_delete=models.CASCADE)
+    quantity = models.IntegerField(default=0)
+    last_updated = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        unique_together = (("product", "warehouse"),)
+
+    @classmethod
+    def apply_delta(cls, product_id, warehouse_id, delta, using=None, create=True):
+        """
+        @Description: Adds delta to the stock level of a product in a warehouse, creating the row if needed.
+        The increment is a single UPDATE ... SET quantity = quantity + delta, so concurrent writers never lose updates.
+        @Param: product_id (int): The product's primary key.
+        @Param: warehouse_id (int): The warehouse's primary key.
+        @Param: delta (int): The signed change in quantity.
+        @Param: using (str): The database alias to write to.
+        @Param: create (bool): Whether to create a missing row. Reversals pass False, since the product or warehouse may be in the middle of a cascading delete.
+        """
+        if not delta:
+            return
+        manager = cls.objects.db_manager(using)
+        rows = manager.filter(product_id=product_id, warehouse_id=warehouse_id)
+        now = timezone.now()
+        if rows.update(quantity=F("quantity") + delta, last_updated=now) or not create:
+            return
+        try:
+            with transaction.atomic(using=manager.db):
+                manager.create(
+                    product_id=product_id,
+                    warehouse_id=warehouse_id,
+                    quantity=delta,
+                    last_updated=now,
+                )
+        except IntegrityError:
+            # Another writer created the row first; add to it instead.
+            rows.update(quantity=F("quantity") + delta, last_updated=now)
+
 
 class Task(models.Model):
     """
@@ -488,6 +717,17 @@ class Task(models.Model):
     completed = models.BooleanField(default=False)
     assigned_to = models.ForeignKey(User, on_delete=models.CASCADE)
 
+    class Meta:
+        indexes = [
+            # Django filters completed=False as NOT completed, which a plain
+            # (assigned_to, completed, due_date) index cannot serve on SQLite.
+            models.Index(
+                fields=["assigned_to", "due_date"],
+                condition=models.Q(completed=False),
+                name="task_assignee_open_due_idx",
+            ),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -511,6 +751,11 @@ class Event(models.Model):
     location = models.CharField(max_length=255)
     participants = models.ManyToManyField(User, related_name="events")
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["start_time", "id"], name="event_start_idx"),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -535,40 +780,167 @@ class SalesTransaction(models.Model):
     total_amount = models.DecimalField(max_digits=10, decimal_places=2)
     status = models.CharField(max_length=50)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["customer", "transaction_date"], name="sale_customer_date_idx"
+            ),
+        ]
+
     def __str__(self):
         return str(self.transaction_id)
 
 
-@receiver(post_save, sender=Order)
-def create_task_for_new_order(sender, instance, created, **kwargs):
-    if created:
-        admin_user = User.objects.filter(role="Administrator").first()
-        if admin_user:
-            Task.objects.create(
-                title=f"New Order #{instance.id} placed",
-                description="A new order has been placed with.",
-                due_date=timezone.now() + timezone.timedelta(days=1),
-                assigned_to=admin_user,
+ROLE_CACHE_TIMEOUT = 300
+
+
+def role_cache_key(role):
+    return "inventory:role-user:" + role.replace(" ", "_")
+
+
+def user_id_for_role(role):
+    """
+    @Description: Resolves the first user holding a role, through the cache.
+    Entries are cleared whenever a user is saved or deleted; the timeout bounds staleness when each process has its own cache.
+    @Param: role (str): One of User.ROLE_CHOICES.
+    @Return: int: The user's id, or None if nobody holds the role.
+    """
+    key = role_cache_key(role)
+    user_id = cache.get(key)
+    if user_id is None:
+        user_id = (
+            User.objects.filter(role=role)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+            .first()
+        )
+        # Cache misses too, as 0, so a role nobody holds is not looked up per order.
+        cache.set(key, user_id or 0, ROLE_CACHE_TIMEOUT)
+    return user_id or None
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def clear_role_cache(sender, **kwargs):
+    cache.delete_many([role_cache_key(role) for role, _ in User.ROLE_CHOICES])
+
+
+_order_task_batch = contextvars.ContextVar("order_task_batch", default=None)
+
+
+@contextlib.contextmanager
+def batched_order_tasks():
+    """
+    @Description: Coalesces the new-order tasks of every order created inside the block into one task per assignee, written with a single bulk_create when the block (and its transaction) commits. Meant for bulk order imports.
+    """
+    orders = []
+    token = _order_task_batch.set(orders)
+    try:
+        yield
+    finally:
+        _order_task_batch.reset(token)
+    if not orders:
+        return
+    grouped = {}
+    for order_id, assigned_to_id in orders:
+        grouped.setdefault(assigned_to_id, []).append(order_id)
+    due_date = timezone.now() + timezone.timedelta(days=1)
+    tasks = []
+    for assigned_to_id, order_ids in grouped.items():
+        if len(order_ids) == 1:
+            tasks.append(new_order_task(order_ids[0], assigned_to_id))
+            continue
+        tasks.append(
+            Task(
+                title=f"{len(order_ids)} new orders placed",
+                description="New orders have been placed: "
+                + ", ".join(f"#{order_id}" for order_id in order_ids),
+                due_date=due_date,
+                assigned_to_id=assigned_to_id,
             )
+        )
+    transaction.on_commit(lambda: Task.objects.bulk_create(tasks))
+
+
+def new_order_task(order_id, assigned_to_id):
+    return Task(
+        title=f"New Order #{order_id} placed",
+        description="A new order has been placed with.",
+        due_date=timezone.now() + timezone.timedelta(days=1),
+        assigned_to_id=assigned_to_id,
+    )
 
 
 @receiver(post_save, sender=Order)
-def create_order_details(sender, instance, created, **kwargs):
+def create_task_for_new_order(
+    sender, instance, created, raw=False, using=None, **kwargs
+):
+    if not created or raw:
+        return
+    admin_id = user_id_for_role("Administrator")
+    if admin_id is None:
+        return
+    batch = _order_task_batch.get()
+    if batch is not None:
+        batch.append((instance.id, admin_id))
+        return
+    # Created after commit, so the order's own transaction is not extended by the insert.
+    transaction.on_commit(
+        lambda: new_order_task(instance.id, admin_id).save(using=using), using=using
+    )
+
+
+@receiver(pre_save, sender=InventoryTransaction)
+@receiver(pre_save, sender=StockAdjustment)
+def remember_stock_delta(sender, instance, raw=False, using=None, **kwargs):
+    """
+    @Description: Records the stock effect of a ledger row before it is edited so post_save can reverse it.
+    """
+    instance._previous_stock = None
+    if raw or instance.pk is None:
+        return
+    previous = sender.objects.using(using).filter(pk=instance.pk).first()
+    if previous is not None:
+        instance._previous_stock = (
+            previous.product_id,
+            previous.warehouse_id,
+            previous.stock_delta(),
+        )
+
+
+@receiver(post_save, sender=InventoryTransaction)
+@receiver(post_save, sender=StockAdjustment)
+def update_stock_level(sender, instance, created, raw=False, using=None, **kwargs):
     """
-    @Description: Signal handler to create order details when an order is confirmed.
+    @Description: Applies a saved ledger row to the StockLevel projection.
     @Parameters:
-        sender (Model): The model class that sent the signal.
-        instance (Order): The instance of the Order model being saved.
-        created (bool): Indicates whether the instance was created or updated.
+        sender (Model): InventoryTransaction or StockAdjustment.
+        instance (Model): The ledger row that was saved.
+        created (bool): Indicates whether the row was inserted or updated.
         kwargs (dict): Additional keyword arguments.
     @Returns:
         None
     """
-    if not created and instance.status == "Confirmed":
-        for item in instance.items.all():
-            OrderDetail.objects.create(
-                order=instance,
-                product=item.product,
-                quantity=item.quantity,
-                customer=instance.customer,
-            )
+    if raw:
+        return
+    previous = getattr(instance, "_previous_stock", None)
+    if not created and previous is not None:
+        product_id, warehouse_id, delta = previous
+        StockLevel.apply_delta(
+            product_id, warehouse_id, -delta, using=using, create=False
+        )
+    StockLevel.apply_delta(
+        instance.product_id, instance.warehouse_id, instance.stock_delta(), using=using
+    )
+
+
+@receiver(post_delete, sender=InventoryTransaction)
+@receiver(post_delete, sender=StockAdjustment)
+def reverse_stock_level(sender, instance, using=None, **kwargs):
+    StockLevel.apply_delta(
+        instance.product_id,
+        instance.warehouse_id,
+        -instance.stock_delta(),
+        using=using,
+        create=False,
+    )
@@ -0,0 +1,154 @@
+"""
+@Description: Database-backed outbox for the emails composed in admin_compose_email.
+The view only saves the message; the send_queued_email worker claims due messages in batches, sends each batch over one reused mail connection, records the outcome on the row and reschedules failures with exponential backoff.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+import base64
+import logging
+import mimetypes
+import os
+from datetime import timedelta
+from email.mime.base import MIMEBase
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.utils import timezone
+
+from .models import EmailAttachment
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_RETRY_DELAY = 60
+# How long a worker may hold a claimed message before another worker can take it over.
+CLAIM_TIMEOUT = timedelta(minutes=10)
+# A multiple of 57 bytes, so every chunk encodes to whole 76-character base64 lines.
+ATTACHMENT_CHUNK_SIZE = 57 * 1024
+
+
+def retry_delay(attempts):
+    """
+    @Description: The backoff before the next attempt: INVENTORY_EMAIL_RETRY_DELAY seconds, doubled after every failure.
+    @Param: attempts (int): The number of failed attempts so far.
+    @Return: timedelta: The delay.
+    """
+    base = getattr(settings, "INVENTORY_EMAIL_RETRY_DELAY", DEFAULT_RETRY_DELAY)
+    return timedelta(seconds=base * 2 ** (attempts - 1))
+
+
+def claim_batch(size=DEFAULT_BATCH_SIZE):
+    """
+    @Description: Claims up to size due messages for this worker.
+    Each row is claimed with a conditional UPDATE on its current status and next_attempt_at, so two workers never send the same message.
+    @Param: size (int): The maximum number of messages.
+    @Return: list: The claimed EmailAttachment rows, now Sending.
+    """
+    now = timezone.now()
+    due = list(
+        EmailAttachment.objects.filter(
+            status__in=["Queued", "Sending"], next_attempt_at__lte=now
+        )
+        .order_by("next_attempt_at", "id")
+        .values_list("id", "next_attempt_at")[:size]
+    )
+    lease = now + CLAIM_TIMEOUT
+    claimed = [
+        pk
+        for pk, next_attempt_at in due
+        if EmailAttachment.objects.filter(
+            pk=pk, next_attempt_at=next_attempt_at
+        ).update(status="Sending", next_attempt_at=lease)
+    ]
+    return list(EmailAttachment.objects.filter(pk__in=claimed).order_by("id"))
+
+
+def attachment_part(field_file):
+    """
+    @Description: Builds the MIME part of a stored attachment, reading and base64-encoding it chunk by chunk so the raw file is never held in memory alongside its encoding.
+    @Param: field_file (FieldFile): The stored attachment.
+    @Return: MIMEBase: The encoded attachment.
+    """
+    name = os.path.basename(field_file.name)
+    content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+    part = MIMEBase(*content_type.split("/", 1))
+    lines = []
+    field_file.open("rb")
+    try:
+        for chunk in field_file.chunks(ATTACHMENT_CHUNK_SIZE):
+            lines.append(base64.encodebytes(chunk).decode("ascii"))
+    finally:
+        field_file.close()
+    part.set_payload("".join(lines))
+    part["Content-Transfer-Encoding"] = "base64"
+    part.add_header("Content-Disposition", "attachment", filename=name)
+    return part
+
+
+def build_message(email, connection):
+    message = EmailMessage(
+        subject=email.subject,
+        body=email.body,
+        from_email=email.from_email or None,
+        to=[email.customer_email],
+        connection=connection,
+    )
+    if email.attachment:
+        message.attach(attachment_part(email.attachment))
+    return message
+
+
+def record_failure(email, error):
+    email.attempts += 1
+    email.last_error = str(error)
+    max_attempts = getattr(
+        settings, "INVENTORY_EMAIL_MAX_ATTEMPTS", DEFAULT_MAX_ATTEMPTS
+    )
+    if email.attempts >= max_attempts:
+        email.status = "Failed"
+    else:
+        email.status = "Queued"
+        email.next_attempt_at = timezone.now() + retry_delay(email.attempts)
+    email.save(update_fields=["attempts", "last_error", "status", "next_attempt_at"])
+
+
+def send_batch(size=DEFAULT_BATCH_SIZE):
+    """
+    @Description: Claims one batch of due messages and sends it over a single mail connection.
+    @Param: size (int): The maximum number of messages to send.
+    @Return: tuple: (sent, failed) counts; failed includes messages rescheduled for a retry.
+    """
+    batch = claim_batch(size)
+    if not batch:
+        return 0, 0
+    sent = failed = 0
+    connection = get_connection()
+    try:
+        connection.open()
+    except Exception as exc:
+        logger.exception("Could not open the mail connection")
+        for email in batch:
+            record_failure(email, exc)
+        return 0, len(batch)
+    try:
+        for email in batch:
+            try:
+                build_message(email, connection).send()
+            except Exception as exc:
+                logger.warning("Could not send email %s: %s", email.pk, exc)
+                record_failure(email, exc)
+                failed += 1
+            else:
+                email.status = "Sent"
+                email.sent_at = timezone.now()
+                email.save(update_fields=["status", "sent_at"])
+                sent += 1
+    finally:
+        connection.close()
+    return sent, failed
@@ -0,0 +1,192 @@
+"""
+@Description: Keyset (seek) pagination shared by the list views.
+Pages are addressed by an opaque cursor holding the sort key of the last (or first) row of the previous page instead of an OFFSET, so fetching page N costs the same as fetching page 1.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+import base64
+import binascii
+import json
+
+from django.conf import settings
+from django.core.exceptions import BadRequest, ValidationError
+from django.db.models import Q
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+class KeysetPage:
+    """
+    @Description: A single page of results produced by KeysetPaginator.
+    @Attributes:
+        - object_list (list): The rows of this page, in display order.
+        - next_token (str): Opaque cursor for the following page, or None on the last page.
+        - prev_token (str): Opaque cursor for the preceding page, or None on the first page.
+        - page_size (int): The number of rows requested per page.
+    """
+
+    def __init__(self, object_list, next_token, prev_token, page_size):
+        self.object_list = object_list
+        self.next_token = next_token
+        self.prev_token = prev_token
+        self.page_size = page_size
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_token is not None
+
+    def has_previous(self):
+        return self.prev_token is not None
+
+
+class KeysetPaginator:
+    """
+    @Description: Paginates a queryset by seeking on a composite sort key, e.g. (created_at, id).
+    Rows are returned newest first. The last column of the key must be unique so that every row has exactly one position.
+    @Attributes:
+        - queryset (QuerySet): The queryset to paginate. Any existing ordering is replaced.
+        - keys (tuple): Field names making up the sort key, most significant first.
+        - page_size (int): The number of rows per page.
+    """
+
+    def __init__(self, queryset, keys=("created_at", "id"), page_size=DEFAULT_PAGE_SIZE):
+        self.queryset = queryset
+        self.keys = tuple(keys)
+        self.page_size = page_size
+        self.fields = [queryset.model._meta.get_field(key) for key in self.keys]
+
+    def encode_cursor(self, direction, obj):
+        """
+        @Description: Builds an opaque cursor pointing at obj.
+        @Param: direction (str): "n" to continue after obj, "p" to continue before it.
+        @Param: obj (Model): The boundary row.
+        @Return: str: A URL-safe token.
+        """
+        values = [field.value_to_string(obj) for field in self.fields]
+        payload = json.dumps([direction, values], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, token):
+        """
+        @Description: Reverses encode_cursor.
+        @Param: token (str): The cursor received from the client.
+        @Return: tuple: (direction, values) with values converted back to Python types.
+        @Raises: BadRequest: If the token is malformed.
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            direction, values = json.loads(base64.urlsafe_b64decode(padded))
+            if direction not in ("n", "p") or len(values) != len(self.fields):
+                raise ValueError(token)
+            values = [
+                field.to_python(value) for field, value in zip(self.fields, values)
+            ]
+        except (ValueError, TypeError, binascii.Error, ValidationError) as exc:
+            raise BadRequest("Invalid pagination cursor.") from exc
+        return direction, values
+
+    def _seek(self, values, forward):
+        """
+        @Description: Builds the row-value comparison (k1, k2, ...) < (v1, v2, ...) as nested Q objects.
+        """
+        lookup = "lt" if forward else "gt"
+        condition = Q(**{f"{self.keys[-1]}__{lookup}": values[-1]})
+        for key, value in zip(self.keys[-2::-1], values[-2::-1]):
+            condition = Q(**{f"{key}__{lookup}": value}) | (
+                Q(**{key: value}) & condition
+            )
+        return condition
+
+    def page(self, token=None):
+        """
+        @Description: Fetches the page addressed by token.
+        @Param: token (str): A cursor from a previous page, or None for the first page.
+        @Return: KeysetPage: The requested page.
+        """
+        queryset, forward = self._page_query(token)
+        return self._build_page(list(queryset), token, forward)
+
+    async def apage(self, token=None):
+        """
+        @Description: Async version of page(), for async views; the rows are read with aiterator().
+        """
+        queryset, forward = self._page_query(token)
+        rows = [row async for row in queryset.aiterator(chunk_size=self.page_size + 1)]
+        return self._build_page(rows, token, forward)
+
+    def _page_query(self, token):
+        forward = True
+        queryset = self.queryset
+        if token:
+            direction, values = self.decode_cursor(token)
+            forward = direction == "n"
+            queryset = queryset.filter(self._seek(values, forward))
+
+        prefix = "-" if forward else ""
+        queryset = queryset.order_by(*(prefix + key for key in self.keys))
+        return queryset[: self.page_size + 1], forward
+
+    def _build_page(self, rows, token, forward):
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if not forward:
+            rows.reverse()
+
+        if forward:
+            has_next, has_previous = has_more, bool(token)
+        else:
+            has_next, has_previous = True, has_more
+
+        next_token = (
+            self.encode_cursor("n", rows[-1]) if rows and has_next else None
+        )
+        prev_token = (
+            self.encode_cursor("p", rows[0]) if rows and has_previous else None
+        )
+        return KeysetPage(rows, next_token, prev_token, self.page_size)
+
+
+def get_page_size(request):
+    """
+    @Description: Resolves the page size from ?page_size=, falling back to settings.INVENTORY_PAGE_SIZE.
+    @Param: request (HttpRequest): The HTTP request object.
+    @Return: int: A page size between 1 and settings.INVENTORY_MAX_PAGE_SIZE.
+    """
+    default = getattr(settings, "INVENTORY_PAGE_SIZE", DEFAULT_PAGE_SIZE)
+    maximum = getattr(settings, "INVENTORY_MAX_PAGE_SIZE", MAX_PAGE_SIZE)
+    try:
+        size = int(request.GET.get("page_size", default))
+    except ValueError:
+        size = default
+    return max(1, min(size, maximum))
+
+
+def paginate(request, queryset, keys=("created_at", "id")):
+    """
+    @Description: Paginates queryset for a list view using the ?cursor= and ?page_size= query parameters.
+    @Param: request (HttpRequest): The HTTP request object.
+    @Param: queryset (QuerySet): The rows to paginate.
+    @Param: keys (tuple): The sort key, most significant column first; the last column must be unique.
+    @Return: KeysetPage: The requested page.
+    """
+    paginator = KeysetPaginator(queryset, keys, get_page_size(request))
+    return paginator.page(request.GET.get("cursor"))
+
+
+async def apaginate(request, queryset, keys=("created_at", "id")):
+    """
+    @Description: Async version of paginate(), for async views.
+    """
+    paginator = KeysetPaginator(queryset, keys, get_page_size(request))
+    return await paginator.apage(request.GET.get("cursor"))
@@ -0,0 +1,237 @@
+"""
+@Description: On-demand profiling of single requests, driven by ProfilingMiddleware.
+A superuser adds ?__profile=1 (the INVENTORY_PROFILER default), ?__profile=cprofile or ?__profile=sample to any URL; INVENTORY_PROFILE_SAMPLE_RATE additionally profiles that fraction of all requests. cProfile runs write a .prof file for pstats/snakeviz. The sampler reads the request thread's stack every INVENTORY_PROFILE_INTERVAL seconds from a background thread, which costs far less than tracing every call, and writes collapsed stacks ("a;b;c count" lines) that flamegraph.pl and speedscope read directly. Files go to INVENTORY_PROFILE_DIR; the newest INVENTORY_PROFILE_KEEP are kept.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+import cProfile
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import uuid
+from collections import Counter
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+PROFILE_PARAMETER = "__profile"
+DEFAULT_PROFILER = "cprofile"
+DEFAULT_INTERVAL = 0.005
+DEFAULT_KEEP = 200
+EXTENSIONS = {"cprofile": "prof", "sample": "collapsed"}
+# One cProfile run at a time: on Python 3.12+ a second enable() in the process
+# raises ValueError, so concurrent profiled requests fall back to sampling.
+_cprofile_lock = threading.Lock()
+PROFILE_NAME = re.compile(
+    r"^(?P<stamp>\d{8}T\d{12})-(?P<view>[\w.:-]+)-(?P<token>[0-9a-f]{8})"
+    r"\.(?P<kind>prof|collapsed)$"
+)
+
+
+def profile_dir():
+    return str(
+        getattr(settings, "INVENTORY_PROFILE_DIR", None)
+        or os.path.join(settings.BASE_DIR, "profiles")
+    )
+
+
+def requested_profiler(request):
+    """
+    @Description: Decides whether and how a request is profiled.
+    @Param: request (HttpRequest): The request, after authentication.
+    @Return: str: "cprofile" or "sample", or None to run the request normally.
+    """
+    default = getattr(settings, "INVENTORY_PROFILER", DEFAULT_PROFILER)
+    value = request.GET.get(PROFILE_PARAMETER)
+    if value and request.user.is_superuser:
+        return value if value in EXTENSIONS else default
+    rate = getattr(settings, "INVENTORY_PROFILE_SAMPLE_RATE", 0)
+    if rate and random.random() < rate:
+        return default
+    return None
+
+
+class StackSampler:
+    """
+    @Description: Samples one thread's Python stack at a fixed interval and counts identical stacks.
+    """
+
+    def __init__(self, interval=DEFAULT_INTERVAL):
+        self.interval = interval
+        self.stacks = Counter()
+        self.thread_id = None
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self.thread_id = threading.get_ident()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[collapse(frame)] += 1
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as output:
+            for stack, count in self.stacks.most_common():
+                output.write(f"{stack} {count}\n")
+
+
+def collapse(frame):
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        # co_qualname is new in Python 3.11.
+        name = getattr(code, "co_qualname", code.co_name)
+        names.append(
+            f"{name} ({os.path.basename(code.co_filename)}:"
+            f"{code.co_firstlineno})".replace(";", ":").replace(" ", "_")
+        )
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+def profile_request(profiler, get_response, request):
+    """
+    @Description: Runs the rest of the middleware chain under a profiler and saves the result.
+    @Param: profiler (str): "cprofile" or "sample".
+    @Param: get_response (callable): The next middleware.
+    @Param: request (HttpRequest): The request.
+    @Return: tuple: (response, file name of the saved profile, or None if it could not be saved).
+    """
+    collector = start_collector(profiler)
+    try:
+        response = get_response(request)
+    finally:
+        stop_collector(collector)
+    return response, save_profile(collector, request)
+
+
+async def aprofile_request(profiler, get_response, request):
+    """
+    @Description: Async version of profile_request(). The profile covers the event loop thread, so other requests in flight at the same time show up in it, and work the view hands to worker threads (such as async ORM queries) does not.
+    """
+    collector = start_collector(profiler)
+    try:
+        response = await get_response(request)
+    finally:
+        stop_collector(collector)
+    return response, save_profile(collector, request)
+
+
+def start_collector(profiler):
+    """
+    @Description: Starts the requested profiler, or the stack sampler when cProfile is already running for another request (or another tool such as a debugger or coverage holds the profiling hook).
+    """
+    if profiler != "sample" and _cprofile_lock.acquire(blocking=False):
+        collector = cProfile.Profile()
+        try:
+            collector.enable()
+            return collector
+        except ValueError:
+            _cprofile_lock.release()
+    collector = StackSampler(
+        getattr(settings, "INVENTORY_PROFILE_INTERVAL", DEFAULT_INTERVAL)
+    )
+    collector.start()
+    return collector
+
+
+def stop_collector(collector):
+    if isinstance(collector, StackSampler):
+        collector.stop()
+    else:
+        collector.disable()
+        _cprofile_lock.release()
+
+
+def save_profile(collector, request):
+    """
+    @Description: Writes a finished profile to INVENTORY_PROFILE_DIR.
+    @Return: str: The file name, or None if it could not be written; profiling never fails the request.
+    """
+    try:
+        return _save_profile(collector, request)
+    except OSError:
+        logger.exception("Could not save the profile of %s", request.path)
+        return None
+
+
+def _save_profile(collector, request):
+    profiler = "sample" if isinstance(collector, StackSampler) else "cprofile"
+    match = request.resolver_match
+    view = re.sub(r"[^\w.:-]", "_", match.view_name if match else "unresolved")
+    stamp = datetime.now(dt_timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+    name = f"{stamp}-{view}-{uuid.uuid4().hex[:8]}.{EXTENSIONS[profiler]}"
+    directory = profile_dir()
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, name)
+    if profiler == "sample":
+        collector.dump(path)
+    else:
+        collector.dump_stats(path)
+    prune(directory)
+    return name
+
+
+def list_profiles():
+    """
+    @Description: Lists the saved profiles, newest first.
+    @Return: list: Dicts with name, view, kind, size and created.
+    """
+    directory = profile_dir()
+    if not os.path.isdir(directory):
+        return []
+    profiles = []
+    for name in os.listdir(directory):
+        match = PROFILE_NAME.match(name)
+        if match:
+            profiles.append(
+                {
+                    "name": name,
+                    "view": match["view"],
+                    "kind": match["kind"],
+                    "size": os.path.getsize(os.path.join(directory, name)),
+                    "created": datetime.strptime(
+                        match["stamp"], "%Y%m%dT%H%M%S%f"
+                    ).replace(tzinfo=dt_timezone.utc),
+                }
+            )
+    return sorted(profiles, key=lambda profile: profile["name"], reverse=True)
+
+
+def profile_path(name):
+    """
+    @Description: Returns the path of a saved profile, or None if name is not one.
+    """
+    if not PROFILE_NAME.match(name):
+        return None
+    path = os.path.join(profile_dir(), name)
+    return path if os.path.isfile(path) else None
+
+
+def prune(directory):
+    keep = getattr(settings, "INVENTORY_PROFILE_KEEP", DEFAULT_KEEP)
+    names = sorted(name for name in os.listdir(directory) if PROFILE_NAME.match(name))
+    for name in names[:-keep] if keep else []:
+        try:
+            os.remove(os.path.join(directory, name))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,120 @@
+"""
+@Description: Declares which related rows the list and search pages read for every row they render, so the views can load them up front instead of issuing one query per row.
+Joined products, suppliers and customers are trimmed to the columns a listing shows, leaving out wide text such as descriptions and addresses; the row's own columns are always loaded.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+from .models import (
+    ProductSupplier,
+    Inventory,
+    Order,
+    OrderDetail,
+    CustomerOrder,
+    CustomerOrderDetail,
+    ShipmentDetail,
+    StockAdjustment,
+    InventoryTransaction,
+    Task,
+    Event,
+    SalesTransaction,
+)
+
+# Columns read from a joined row; description and address stay behind.
+PRODUCT_COLUMNS = ("product_name", "category", "unit_price", "reorder_level")
+SUPPLIER_COLUMNS = ("supplier_name", "contact_name", "city", "country", "phone")
+CUSTOMER_COLUMNS = ("customer_name", "contact_name", "city", "country", "phone")
+
+
+def columns(relation, fields):
+    return tuple(f"{relation}__{field}" for field in fields)
+
+
+class Relations:
+    """
+    @Description: The relations a page touches for each row of a model.
+    @Attributes:
+        - select (tuple): Forward foreign keys joined in with select_related().
+        - prefetch (tuple): Many-valued relations loaded with prefetch_related().
+        - only (tuple): Columns of selected relations to load, as "relation__field"; a selected relation not named here is loaded whole. The model's own columns are always loaded.
+    """
+
+    def __init__(self, select=(), prefetch=(), only=()):
+        self.select = tuple(select)
+        self.prefetch = tuple(prefetch)
+        self.only = tuple(only)
+
+    def apply(self, queryset):
+        if self.select:
+            queryset = queryset.select_related(*self.select)
+        if self.prefetch:
+            queryset = queryset.prefetch_related(*self.prefetch)
+        if self.only:
+            own = [field.name for field in queryset.model._meta.concrete_fields]
+            queryset = queryset.only(*own, *self.only)
+        return queryset
+
+
+RELATIONS = {
+    ProductSupplier: Relations(
+        select=("product", "supplier"),
+        only=(
+            *columns("product", PRODUCT_COLUMNS),
+            *columns("supplier", SUPPLIER_COLUMNS),
+        ),
+    ),
+    Inventory: Relations(
+        select=("product", "warehouse"), only=columns("product", PRODUCT_COLUMNS)
+    ),
+    Order: Relations(select=("supplier",), only=columns("supplier", SUPPLIER_COLUMNS)),
+    OrderDetail: Relations(
+        select=("order__supplier", "product"), only=columns("product", PRODUCT_COLUMNS)
+    ),
+    CustomerOrder: Relations(
+        select=("customer",), only=columns("customer", CUSTOMER_COLUMNS)
+    ),
+    CustomerOrderDetail: Relations(
+        select=("customer_order__customer", "product"),
+        only=columns("product", PRODUCT_COLUMNS),
+    ),
+    ShipmentDetail: Relations(
+        select=(
+            "shipment",
+            "order__supplier",
+            "customer_order__customer",
+            "product",
+        ),
+        only=columns("product", PRODUCT_COLUMNS),
+    ),
+    StockAdjustment: Relations(
+        select=("product", "warehouse"), only=columns("product", PRODUCT_COLUMNS)
+    ),
+    InventoryTransaction: Relations(
+        select=("product", "warehouse"), only=columns("product", PRODUCT_COLUMNS)
+    ),
+    Task: Relations(select=("assigned_to",)),
+    Event: Relations(prefetch=("participants",)),
+    SalesTransaction: Relations(
+        select=("product", "customer"),
+        only=(
+            *columns("product", PRODUCT_COLUMNS),
+            *columns("customer", CUSTOMER_COLUMNS),
+        ),
+    ),
+}
+
+
+def load_relations(queryset):
+    """
+    @Description: Applies the declared relations for queryset's model.
+    @Param: queryset (QuerySet): The rows a page is about to render.
+    @Return: QuerySet: The same rows with their related objects loaded in bulk; unchanged for models without relations.
+    """
+    relations = RELATIONS.get(queryset.model)
+    if relations is None:
+        return queryset
+    return relations.apply(queryset)
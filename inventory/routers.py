@@ -0,0 +1,48 @@
+"""
+@Description: Database router that serves read-only views from a replica.
+ReplicaRoutingMiddleware marks requests for read-only views (the *_list and search_* views, exports and API lists) and the router then sends their inventory reads to settings.INVENTORY_REPLICA_DATABASE. Writes, and every read outside a marked request, go to the primary. Sessions and auth are never read from the replica, so a fresh login is never lost to replication lag.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+import contextvars
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# The alias reads are routed to for the current request, if any.
+read_alias = contextvars.ContextVar("inventory_read_alias", default=None)
+
+
+def replica_alias():
+    """
+    @Description: Returns the configured replica alias, or None when no replica is set up.
+    """
+    alias = getattr(settings, "INVENTORY_REPLICA_DATABASE", None)
+    if alias and alias in connections.settings:
+        return alias
+    return None
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label == "inventory":
+            return read_alias.get()
+        return None
+
+    def db_for_write(self, model, **hints):
+        # Rows read from the replica are saved back to the primary.
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db == replica_alias():
+            return DEFAULT_DB_ALIAS
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {DEFAULT_DB_ALIAS, replica_alias()}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
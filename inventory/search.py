@@ -0,0 +1,327 @@
+"""
+@Description: Pluggable search backends for the search_* views.
+On SQLite every searchable model has an FTS5 shadow table (trigram tokenizer, so substring matches behave like icontains) kept in sync by post_save/post_delete signals. On PostgreSQL the same lookups run against pg_trgm GIN indexes. Any other database falls back to icontains.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+import logging
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import DatabaseError, connections, router
+from django.db.models import F, FloatField, Func, Q, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_save
+from django.utils.module_loading import import_string
+
+from .models import Product, Supplier, Warehouse, Customer, Shipment
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEARCH_LIMIT = 100
+
+# Searchable models and the text columns that are indexed for each of them.
+SEARCH_FIELDS = {
+    Product: ("product_name", "category", "description"),
+    Supplier: ("supplier_name", "contact_name", "city"),
+    Warehouse: ("warehouse_name", "location"),
+    Customer: ("customer_name", "contact_name", "city"),
+    Shipment: ("tracking_number", "carrier"),
+}
+
+
+def fts_table(model):
+    return f"{model._meta.db_table}_fts"
+
+
+class SearchBackend:
+    """
+    @Description: Base backend. Matches with icontains across the indexed fields and does not rank.
+    Subclasses override search_ids() and, when they keep their own index, index()/remove()/rebuild().
+    """
+
+    def __init__(self, alias="default"):
+        self.alias = alias
+
+    def search_ids(self, model, query, limit):
+        """
+        @Description: Finds the primary keys of the rows of model matching query.
+        @Param: model (Model): A model listed in SEARCH_FIELDS.
+        @Param: query (str): The text typed by the user.
+        @Param: limit (int): The maximum number of ids to return.
+        @Return: list: Primary keys, best match first.
+        """
+        return list(
+            model._default_manager.using(self.alias)
+            .filter(self.match(model, query))
+            .order_by("-pk")
+            .values_list("pk", flat=True)[:limit]
+        )
+
+    def match(self, model, query):
+        """
+        @Description: Builds a filter matching the same rows as search_ids(), without ranking or a limit.
+        @Return: Q: A condition on model.
+        """
+        condition = Q()
+        for field in SEARCH_FIELDS[model]:
+            condition |= Q(**{f"{field}__icontains": query})
+        return condition
+
+    def index(self, instance):
+        pass
+
+    def index_many(self, model, instances):
+        for instance in instances:
+            self.index(instance)
+
+    def remove(self, model, pk):
+        pass
+
+    def rebuild(self, model):
+        pass
+
+
+class SQLiteFTSBackend(SearchBackend):
+    """
+    @Description: Searches the FTS5 shadow tables created by migration 0005 and ranks by bm25.
+    Queries shorter than three characters cannot be matched by trigrams and fall back to icontains.
+    """
+
+    def __init__(self, alias="default"):
+        super().__init__(alias)
+        self._available = None
+
+    @property
+    def connection(self):
+        return connections[self.alias]
+
+    def available(self):
+        if self._available is None:
+            with self.connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT COUNT(*) FROM sqlite_master WHERE name = %s",
+                    [fts_table(Product)],
+                )
+                self._available = cursor.fetchone()[0] == 1
+        return self._available
+
+    def search_ids(self, model, query, limit):
+        if len(query) < 3 or not self.available():
+            return super().search_ids(model, query, limit)
+        phrase = '"' + query.replace('"', '""') + '"'
+        table = fts_table(model)
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT rowid FROM {table} WHERE {table} MATCH %s "
+                "ORDER BY rank LIMIT %s",
+                [phrase, limit],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    def match(self, model, query):
+        if len(query) < 3 or not self.available():
+            return super().match(model, query)
+        table = fts_table(model)
+        return Q(
+            pk__in=RawSQL(
+                f"SELECT rowid FROM {table} WHERE {table} MATCH %s",
+                ['"' + query.replace('"', '""') + '"'],
+            )
+        )
+
+    def index(self, instance):
+        self.index_many(type(instance), [instance])
+
+    def index_many(self, model, instances):
+        if not instances or not self.available():
+            return
+        fields = SEARCH_FIELDS[model]
+        columns = ", ".join(fields)
+        placeholders = ", ".join(["%s"] * (len(fields) + 1))
+        with self.connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT OR REPLACE INTO {fts_table(model)} "
+                f"(rowid, {columns}) VALUES ({placeholders})",
+                [
+                    [instance.pk] + [getattr(instance, field) for field in fields]
+                    for instance in instances
+                ],
+            )
+
+    def remove(self, model, pk):
+        if not self.available():
+            return
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {fts_table(model)} WHERE rowid = %s", [pk])
+
+    def rebuild(self, model):
+        if not self.available():
+            return
+        fields = SEARCH_FIELDS[model]
+        columns = ", ".join(fields)
+        table = fts_table(model)
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {table}")
+            cursor.execute(
+                f"INSERT INTO {table} (rowid, {columns}) "
+                f"SELECT id, {columns} FROM {model._meta.db_table}"
+            )
+
+
+class PostgresTrigramBackend(SearchBackend):
+    """
+    @Description: Uses the pg_trgm GIN indexes created by migration 0005; icontains becomes an index scan and rows are ranked by trigram similarity.
+    """
+
+    def search_ids(self, model, query, limit):
+        fields = SEARCH_FIELDS[model]
+        similarities = [
+            Func(
+                F(field), Value(query), function="similarity", output_field=FloatField()
+            )
+            for field in fields
+        ]
+        rank = Greatest(*similarities) if len(similarities) > 1 else similarities[0]
+        return list(
+            model._default_manager.using(self.alias)
+            .filter(self.match(model, query))
+            .annotate(rank=rank)
+            .order_by("-rank", "-pk")
+            .values_list("pk", flat=True)[:limit]
+        )
+
+
+VENDOR_BACKENDS = {
+    "sqlite": SQLiteFTSBackend,
+    "postgresql": PostgresTrigramBackend,
+}
+
+_backends = {}
+
+
+def get_backend(alias="default"):
+    """
+    @Description: Returns the search backend for a database alias.
+    settings.INVENTORY_SEARCH_BACKEND may name a backend class by dotted path; otherwise one is picked from the database vendor.
+    @Param: alias (str): The database alias.
+    @Return: SearchBackend: A shared backend instance.
+    """
+    path = getattr(settings, "INVENTORY_SEARCH_BACKEND", None)
+    key = (alias, path)
+    if key not in _backends:
+        if path:
+            backend_class = import_string(path)
+        else:
+            vendor = connections[alias].vendor
+            backend_class = VENDOR_BACKENDS.get(vendor, SearchBackend)
+        _backends[key] = backend_class(alias)
+    return _backends[key]
+
+
+def search(queryset, query, via=None, limit=None):
+    """
+    @Description: Runs a ranked, capped search for a search_* view.
+    @Param: queryset (QuerySet): The rows to return, with any relations the page needs already applied.
+    @Param: query (str): The text typed by the user.
+    @Param: via (str): Optional foreign key on queryset's model; the related model is searched and rows pointing at the matches are returned.
+    @Param: limit (int): The maximum number of rows, defaulting to settings.INVENTORY_SEARCH_LIMIT.
+    @Return: list: Matching rows, best match first.
+    """
+    query, target, limit = _search_arguments(queryset, query, via, limit)
+    if not query:
+        return []
+    ids = get_backend(queryset.db).search_ids(target, query, limit)
+    if via is None:
+        rows = queryset.in_bulk(ids)
+        return [rows[pk] for pk in ids if pk in rows]
+    rows = list(queryset.filter(**{f"{via}__in": ids}).order_by("-pk")[:limit])
+    return _in_match_order(rows, ids, via)
+
+
+async def asearch(queryset, query, via=None, limit=None):
+    """
+    @Description: Async version of search(), for async views.
+    The backends match with raw SQL, which has no async API in Django, so the id lookup runs in a worker thread; the rows are read with the async ORM.
+    """
+    query, target, limit = _search_arguments(queryset, query, via, limit)
+    if not query:
+        return []
+    backend = get_backend(queryset.db)
+    ids = await sync_to_async(backend.search_ids)(target, query, limit)
+    if via is None:
+        rows = await queryset.ain_bulk(ids)
+        return [rows[pk] for pk in ids if pk in rows]
+    matches = queryset.filter(**{f"{via}__in": ids}).order_by("-pk")[:limit]
+    rows = [row async for row in matches.aiterator(chunk_size=limit)]
+    return _in_match_order(rows, ids, via)
+
+
+def _search_arguments(queryset, query, via, limit):
+    if limit is None:
+        limit = getattr(settings, "INVENTORY_SEARCH_LIMIT", DEFAULT_SEARCH_LIMIT)
+    model = queryset.model
+    target = model._meta.get_field(via).related_model if via else model
+    return query.strip(), target, limit
+
+
+def _in_match_order(rows, ids, via):
+    position = {pk: index for index, pk in enumerate(ids)}
+    rows.sort(key=lambda row: position[getattr(row, f"{via}_id")])
+    return rows
+
+
+def filter_queryset(queryset, query, via=None):
+    """
+    @Description: Narrows a queryset to the rows a search_* view would match, without ranking or a limit, for callers that stream every match.
+    @Param: queryset (QuerySet): The rows to filter.
+    @Param: query (str): The text typed by the user.
+    @Param: via (str): Optional foreign key on queryset's model, as for search().
+    @Return: QuerySet: The filtered queryset, still lazy.
+    """
+    query = query.strip()
+    if not query:
+        return queryset
+    model = queryset.model
+    target = model._meta.get_field(via).related_model if via else model
+    condition = get_backend(queryset.db).match(target, query)
+    if via is None:
+        return queryset.filter(condition)
+    return queryset.filter(
+        **{f"{via}__in": target._default_manager.using(queryset.db).filter(condition)}
+    )
+
+
+def update_index(sender, instance, raw=False, using=None, **kwargs):
+    if raw:
+        return
+    try:
+        get_backend(using or router.db_for_write(sender)).index(instance)
+    except DatabaseError:
+        # The search index is derived data; never fail the write that triggered it.
+        logger.exception("Could not index %s %s", sender.__name__, instance.pk)
+
+
+def remove_from_index(sender, instance, using=None, **kwargs):
+    try:
+        get_backend(using or router.db_for_write(sender)).remove(sender, instance.pk)
+    except DatabaseError:
+        logger.exception("Could not unindex %s %s", sender.__name__, instance.pk)
+
+
+def connect_signals():
+    for model in SEARCH_FIELDS:
+        post_save.connect(
+            update_index, sender=model, dispatch_uid=f"search_index_{model.__name__}"
+        )
+        post_delete.connect(
+            remove_from_index,
+            sender=model,
+            dispatch_uid=f"search_remove_{model.__name__}",
+        )
@@ -0,0 +1,517 @@
+"""
+@Description: Synthetic data generator behind the seed_inventory command and the benchmark suite.
+Rows are generated from one random.Random(seed), so a given seed and scale always produce the same rows (dated relative to the day of the run), and are written in chunks, one transaction per chunk. Parent tables, whose ids the later tables need, go through bulk_create. The high-volume child tables (order lines, ledgers, links) are written as plain tuples with executemany; per-row model instantiation and field preparation in bulk_create cost several times more than the insert itself. The data is skewed the way real traffic is: product and customer popularity follow a Zipf distribution (a few best sellers account for most order lines, sales and stock movements) and dates follow a seasonal curve with a December peak and quieter weekends.
+Neither path sends signals, so the generator leaves the StockLevel projection, the search index and the page cache versions to be refreshed afterwards; seed_inventory does this.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+import functools
+import itertools
+import math
+import random
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from .models import (
+    Product,
+    Supplier,
+    ProductSupplier,
+    Warehouse,
+    Inventory,
+    Order,
+    OrderDetail,
+    Customer,
+    CustomerOrder,
+    CustomerOrderDetail,
+    Shipment,
+    ShipmentDetail,
+    InventoryTransaction,
+    SalesTransaction,
+)
+
+DEFAULT_SEED = 42
+DEFAULT_CHUNK_SIZE = 5000
+DEFAULT_DAYS = 730
+ZIPF_EXPONENT = 1.1
+
+# Base volumes; order, shipment and customer order lines, product-supplier
+# links and inventory rows are derived from them. "large" is about 10M rows.
+SCALES = {
+    "tiny": {
+        "products": 200,
+        "suppliers": 20,
+        "warehouses": 3,
+        "customers": 200,
+        "orders": 300,
+        "customer_orders": 1000,
+        "shipments": 300,
+        "inventory_transactions": 5000,
+        "sales_transactions": 5000,
+    },
+    "small": {
+        "products": 2000,
+        "suppliers": 100,
+        "warehouses": 5,
+        "customers": 2000,
+        "orders": 3000,
+        "customer_orders": 10000,
+        "shipments": 3000,
+        "inventory_transactions": 50000,
+        "sales_transactions": 50000,
+    },
+    "medium": {
+        "products": 20000,
+        "suppliers": 500,
+        "warehouses": 10,
+        "customers": 20000,
+        "orders": 30000,
+        "customer_orders": 100000,
+        "shipments": 30000,
+        "inventory_transactions": 500000,
+        "sales_transactions": 500000,
+    },
+    "large": {
+        "products": 100000,
+        "suppliers": 2000,
+        "warehouses": 20,
+        "customers": 200000,
+        "orders": 200000,
+        "customer_orders": 1000000,
+        "shipments": 200000,
+        "inventory_transactions": 3000000,
+        "sales_transactions": 1500000,
+    },
+}
+
+CATEGORIES = [
+    "Fasteners", "Tools", "Electrical", "Plumbing", "Paint", "Hardware",
+    "Safety", "Garden", "Lighting", "Adhesives", "Abrasives", "Storage",
+]
+ADJECTIVES = [
+    "Heavy-duty", "Compact", "Galvanized", "Stainless", "Cordless", "Industrial",
+    "Premium", "Standard", "Outdoor", "Precision", "Mini", "Reinforced",
+]
+NOUNS = [
+    "Bolt", "Nut", "Washer", "Drill", "Hammer", "Wrench", "Cable", "Pipe",
+    "Valve", "Brush", "Roller", "Glove", "Lamp", "Hose", "Clamp", "Saw",
+]
+CITIES = [
+    ("Manila", "Philippines"), ("Cebu", "Philippines"), ("Davao", "Philippines"),
+    ("Singapore", "Singapore"), ("Jakarta", "Indonesia"), ("Bangkok", "Thailand"),
+    ("Kuala Lumpur", "Malaysia"), ("Hanoi", "Vietnam"), ("Tokyo", "Japan"),
+]
+CARRIERS = ["LBC", "J&T", "DHL", "FedEx", "UPS", "Ninja Van"]
+LINE_COLUMNS = ("order", "product", "quantity", "unit_price")
+
+
+class ZipfSampler:
+    """
+    @Description: Draws items with probability proportional to 1 / rank ** exponent. Ranks are assigned by shuffling, so popularity does not follow id order.
+    """
+
+    def __init__(self, rng, items, exponent=ZIPF_EXPONENT):
+        self.rng = rng
+        self.items = list(items)
+        rng.shuffle(self.items)
+        self.cum_weights = list(
+            itertools.accumulate(
+                1 / rank**exponent for rank in range(1, len(self.items) + 1)
+            )
+        )
+
+    def sample(self, k):
+        return self.rng.choices(self.items, cum_weights=self.cum_weights, k=k)
+
+
+class SeasonalCalendar:
+    """
+    @Description: Draws dates from the last days days, weighted by a yearly curve peaking in December and a weekend dip.
+    """
+
+    def __init__(self, rng, days=DEFAULT_DAYS, end=None):
+        self.rng = rng
+        end = end or date.today()
+        self.days = [end - timedelta(days=offset) for offset in range(days)]
+        self.cum_weights = list(itertools.accumulate(map(self.weight, self.days)))
+
+    @staticmethod
+    def weight(day):
+        # Peaks in mid-December (day 350 of the year).
+        yearly = 1 + 0.35 * math.cos(
+            2 * math.pi * (day.timetuple().tm_yday - 350) / 365
+        )
+        weekly = 0.6 if day.weekday() >= 5 else 1.0
+        return yearly * weekly
+
+    def dates(self, k):
+        return self.rng.choices(self.days, cum_weights=self.cum_weights, k=k)
+
+    def datetimes(self, k):
+        return [
+            datetime.combine(day, datetime.min.time(), tzinfo=dt_timezone.utc)
+            + timedelta(seconds=self.rng.randrange(86400))
+            for day in self.dates(k)
+        ]
+
+
+def column_adapter(field, connection):
+    """
+    @Description: Returns the function converting a Python value to what the database driver expects for field, or None if the value can be passed as is.
+    """
+    ops = connection.ops
+    internal_type = field.get_internal_type()
+    if internal_type == "DateTimeField":
+        return ops.adapt_datetimefield_value
+    if internal_type == "DateField":
+        return ops.adapt_datefield_value
+    if internal_type == "DecimalField":
+        return functools.partial(
+            ops.adapt_decimalfield_value,
+            max_digits=field.max_digits,
+            decimal_places=field.decimal_places,
+        )
+    return None
+
+
+class Seeder:
+    """
+    @Description: Generates one dataset.
+    @Attributes:
+        - counts (dict): Base volumes, as in SCALES.
+        - rng (Random): The only source of randomness.
+        - chunk_size (int): Rows per bulk_create and transaction.
+        - using (str): The database alias.
+        - progress (callable): Called with (model, rows written so far) after every chunk.
+    """
+
+    def __init__(
+        self,
+        counts,
+        seed=DEFAULT_SEED,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        using=DEFAULT_DB_ALIAS,
+        days=DEFAULT_DAYS,
+        progress=None,
+    ):
+        self.counts = counts
+        self.rng = random.Random(seed)
+        self.chunk_size = chunk_size
+        self.using = using
+        self.calendar = SeasonalCalendar(self.rng, days)
+        self.progress = progress
+        self.written = {}
+
+    def run(self):
+        """
+        @Description: Generates every table in dependency order.
+        @Return: dict: Rows written per model label.
+        """
+        product_ids, prices = self.products()
+        self.popular_products = ZipfSampler(self.rng, range(len(product_ids)))
+        self.product_ids = product_ids
+        self.prices = prices
+        supplier_ids = self.write(Supplier, self.counts["suppliers"], self.supplier)
+        warehouse_ids = self.write(
+            Warehouse, self.counts["warehouses"], self.warehouse
+        )
+        customer_ids = self.write(Customer, self.counts["customers"], self.customer)
+        self.supplier_ids = supplier_ids
+        self.warehouse_ids = warehouse_ids
+        self.popular_suppliers = ZipfSampler(self.rng, supplier_ids)
+        self.popular_customers = ZipfSampler(self.rng, customer_ids)
+
+        self.insert(
+            ProductSupplier, ("product", "supplier"), self.product_suppliers()
+        )
+        self.insert(
+            Inventory,
+            ("product", "warehouse", "quantity", "last_updated"),
+            self.inventory(),
+        )
+        order_ids = self.write(Order, self.counts["orders"], self.order)
+        self.insert(OrderDetail, LINE_COLUMNS, self.lines(order_ids, 5, 0.6))
+        customer_order_ids = self.write(
+            CustomerOrder, self.counts["customer_orders"], self.customer_order
+        )
+        self.insert(
+            CustomerOrderDetail,
+            ("customer_order",) + LINE_COLUMNS[1:],
+            self.lines(customer_order_ids, 4, 1),
+        )
+        shipment_ids = self.write(Shipment, self.counts["shipments"], self.shipment)
+        self.insert(
+            ShipmentDetail,
+            ("shipment", "customer_order", "product", "quantity"),
+            self.shipment_details(shipment_ids, customer_order_ids),
+        )
+        self.insert(
+            InventoryTransaction,
+            ("product", "warehouse", "quantity", "transaction_type", "transaction_date"),
+            self.inventory_transactions(self.counts["inventory_transactions"]),
+        )
+        self.insert(
+            SalesTransaction,
+            (
+                "product",
+                "customer",
+                "quantity",
+                "total_amount",
+                "transaction_date",
+                "status",
+            ),
+            self.sales_transactions(self.counts["sales_transactions"]),
+        )
+        return self.written
+
+    # Writing
+
+    def write(self, model, count, build):
+        """
+        @Description: Writes count rows built by build(index, created_at) and returns their ids in creation order.
+        """
+        created_at = sorted(self.calendar.datetimes(count))
+        rows = (build(index, created_at[index]) for index in range(count))
+        return self.write_many(model, rows, collect_ids=True)
+
+    def write_many(self, model, rows, collect_ids=False):
+        manager = model._default_manager.db_manager(self.using)
+        ids = []
+        rows = iter(rows)
+        while True:
+            chunk = list(itertools.islice(rows, self.chunk_size))
+            if not chunk:
+                break
+            with transaction.atomic(using=self.using):
+                created = manager.bulk_create(chunk)
+            if collect_ids:
+                ids.extend(self.ids_of(manager, created))
+            self.count(model, len(chunk))
+        return ids
+
+    def insert(self, model, names, rows):
+        """
+        @Description: Inserts tuples of field values with executemany, adapting only the columns that need it (dates, datetimes, decimals) for the database.
+        @Param: model (Model): The model whose table is written.
+        @Param: names (tuple): The field names, in the tuples' order.
+        @Param: rows (iterable): The tuples.
+        """
+        connection = connections[self.using]
+        fields = [model._meta.get_field(name) for name in names]
+        quote = connection.ops.quote_name
+        sql = "INSERT INTO {} ({}) VALUES ({})".format(
+            quote(model._meta.db_table),
+            ", ".join(quote(field.column) for field in fields),
+            ", ".join(["%s"] * len(fields)),
+        )
+        adapters = [
+            (position, adapter)
+            for position, adapter in enumerate(
+                column_adapter(field, connection) for field in fields
+            )
+            if adapter is not None
+        ]
+        rows = iter(rows)
+        while True:
+            chunk = list(itertools.islice(rows, self.chunk_size))
+            if not chunk:
+                break
+            if adapters:
+                chunk = [list(row) for row in chunk]
+                for row in chunk:
+                    for position, adapter in adapters:
+                        row[position] = adapter(row[position])
+            with transaction.atomic(using=self.using), connection.cursor() as cursor:
+                cursor.executemany(sql, chunk)
+            self.count(model, len(chunk))
+
+    def count(self, model, rows):
+        label = model._meta.label
+        self.written[label] = self.written.get(label, 0) + rows
+        if self.progress:
+            self.progress(model, self.written[label])
+
+    def ids_of(self, manager, created):
+        if created[0].pk is not None:
+            return [obj.pk for obj in created]
+        # Backends that cannot return ids from bulk inserts.
+        newest = manager.order_by("-pk").values_list("pk", flat=True)[: len(created)]
+        return list(reversed(newest))
+
+    # Rows
+
+    def products(self):
+        rng = self.rng
+        prices = []
+
+        def build(index, created_at):
+            price = Decimal(rng.lognormvariate(3, 1)).quantize(Decimal("0.01"))
+            prices.append(max(price, Decimal("0.50")))
+            name = f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {index + 1}"
+            return Product(
+                product_name=name,
+                description=f"Catalogue item {index + 1}",
+                category=rng.choice(CATEGORIES),
+                unit_price=prices[-1],
+                reorder_level=rng.choice((0, 5, 10, 20, 50)),
+                created_at=created_at,
+            )
+
+        ids = self.write(Product, self.counts["products"], build)
+        return ids, prices
+
+    def _party(self, model, name_field, name, created_at):
+        city, country = self.rng.choice(CITIES)
+        return model(
+            **{name_field: name},
+            contact_name=f"Contact {self.rng.randrange(1, 10000)}",
+            address=f"{self.rng.randrange(1, 999)} Main Street",
+            city=city,
+            postal_code=str(self.rng.randrange(1000, 9999)),
+            country=country,
+            phone=f"+63 9{self.rng.randrange(10**8, 10**9)}",
+            created_at=created_at,
+        )
+
+    def supplier(self, index, created_at):
+        return self._party(
+            Supplier, "supplier_name", f"Supplier {index + 1}", created_at
+        )
+
+    def customer(self, index, created_at):
+        return self._party(
+            Customer, "customer_name", f"Customer {index + 1}", created_at
+        )
+
+    def warehouse(self, index, created_at):
+        city, country = CITIES[index % len(CITIES)]
+        return Warehouse(
+            warehouse_name=f"{city} Warehouse {index + 1}",
+            location=f"{city}, {country}",
+            created_at=created_at,
+        )
+
+    def product_suppliers(self):
+        for product_id in self.product_ids:
+            count = self.rng.choice((1, 1, 2, 3))
+            for supplier_id in set(self.popular_suppliers.sample(count)):
+                yield product_id, supplier_id
+
+    def inventory(self):
+        now = datetime.now(dt_timezone.utc)
+        for warehouse_id in self.warehouse_ids:
+            for product_id in self.product_ids:
+                if self.rng.random() < 0.6:
+                    yield product_id, warehouse_id, self.rng.randrange(0, 500), now
+
+    def status_by_age(self, day, recent, settled, cancel_rate=0.03):
+        if self.rng.random() < cancel_rate:
+            return "Cancelled"
+        age = (self.calendar.days[0] - day).days
+        return self.rng.choice(recent) if age < 30 else settled
+
+    def order(self, index, created_at):
+        day = created_at.date()
+        return Order(
+            order_date=day,
+            supplier_id=self.popular_suppliers.sample(1)[0],
+            status=self.status_by_age(
+                day, ("Pending", "Placed", "Confirmed", "Shipped"), "Delivered"
+            ),
+            created_at=created_at,
+        )
+
+    def customer_order(self, index, created_at):
+        day = created_at.date()
+        return CustomerOrder(
+            customer_id=self.popular_customers.sample(1)[0],
+            order_date=day,
+            status=self.status_by_age(day, ("Pending", "Completed"), "Completed"),
+            created_at=created_at,
+        )
+
+    def shipment(self, index, created_at):
+        carrier = self.rng.choice(CARRIERS)
+        return Shipment(
+            shipment_date=created_at.date(),
+            carrier=carrier,
+            tracking_number=f"{carrier[:3].upper()}{index + 1:010d}",
+            status=self.status_by_age(
+                created_at.date(), ("In Transit",), "Delivered", cancel_rate=0.01
+            ),
+            created_at=created_at,
+        )
+
+    def lines(self, parent_ids, max_lines, price_factor):
+        factor = Decimal(str(price_factor))
+        for parent_id in parent_ids:
+            count = self.rng.randint(1, max_lines)
+            for index in set(self.popular_products.sample(count)):
+                yield (
+                    parent_id,
+                    self.product_ids[index],
+                    self.rng.randint(1, 20),
+                    (self.prices[index] * factor).quantize(Decimal("0.01")),
+                )
+
+    def shipment_details(self, shipment_ids, customer_order_ids):
+        for shipment_id in shipment_ids:
+            customer_order_id = self.rng.choice(customer_order_ids)
+            for index in set(self.popular_products.sample(self.rng.randint(1, 3))):
+                yield (
+                    shipment_id,
+                    customer_order_id,
+                    self.product_ids[index],
+                    self.rng.randint(1, 10),
+                )
+
+    def inventory_transactions(self, count):
+        for start in range(0, count, self.chunk_size):
+            size = min(self.chunk_size, count - start)
+            products = self.popular_products.sample(size)
+            for index, when in zip(products, self.calendar.datetimes(size)):
+                inbound = self.rng.random() < 0.4
+                quantity = self.rng.randint(20, 200) if inbound else self.rng.randint(1, 20)
+                yield (
+                    self.product_ids[index],
+                    self.rng.choice(self.warehouse_ids),
+                    quantity,
+                    "IN" if inbound else "OUT",
+                    when,
+                )
+
+    def sales_transactions(self, count):
+        for start in range(0, count, self.chunk_size):
+            size = min(self.chunk_size, count - start)
+            products = self.popular_products.sample(size)
+            customers = self.popular_customers.sample(size)
+            for index, customer_id, when in zip(
+                products, customers, self.calendar.datetimes(size)
+            ):
+                quantity = self.rng.randint(1, 5)
+                yield (
+                    self.product_ids[index],
+                    customer_id,
+                    quantity,
+                    self.prices[index] * quantity,
+                    when,
+                    "Refunded" if self.rng.random() < 0.02 else "Completed",
+                )
+
+
+def seed(scale="small", seed=DEFAULT_SEED, **options):
+    """
+    @Description: Generates a dataset at one of the SCALES.
+    @Param: scale (str): A key of SCALES.
+    @Param: seed (int): The random seed.
+    @Param: options: Further Seeder arguments (chunk_size, using, days, progress); a "counts" dict overrides individual volumes.
+    @Return: dict: Rows written per model label.
+    """
+    counts = {**SCALES[scale], **options.pop("counts", {})}
+    return Seeder(counts, seed=seed, **options).run()
@@ -9,7 +9,6 @@ Version     Author           Date                Logs
 """
 
 from rest_framework import serializers
-from django.contrib.auth import get_user_model
 from .models import (
     User,
     Product,
@@ -26,6 +25,7 @@ from .models import (
     ShipmentDetail,
     StockAdjustment,
     InventoryTransaction,
+    StockLevel,
     Task,
     Event,
     EmailAttachment,
@@ -33,7 +33,6 @@ from .models import (
     Accountant
 )
 
-User = get_user_model()
 
 class Accountant(serializers.ModelSerializer):
     class Meta:
@@ -434,6 +433,24 @@ class InventoryTransactionSerializer(serializers.ModelSerializer):
         ]
 
 
+class StockLevelSerializer(serializers.ModelSerializer):
+    """
+    @Descrption: Serializer for the StockLevel projection. Read-only; levels change through the inventory ledgers.
+    @Attributes:
+        - id: The unique identifier of the stock level.
+        - product: The product counted.
+        - warehouse: The warehouse holding the stock.
+        - quantity: The quantity on hand.
+        - last_updated: When the level last changed.
+    @Methods: None
+    """
+
+    class Meta:
+        model = StockLevel
+        fields = ["id", "product", "warehouse", "quantity", "last_updated"]
+        read_only_fields = fields
+
+
 class TaskSerializer(serializers.ModelSerializer):
     """
     @Description: Serializer for the Task model.
@@ -485,7 +502,7 @@ class EventSerializer(serializers.ModelSerializer):
         ]
 
 
-class EmailAttachmentSerializer(serializers.Serializer):
+class EmailAttachmentSerializer(serializers.ModelSerializer):
     """
     @Description: Serializer for the EmailAttachment model.
     @Attributes:
@@ -500,7 +517,7 @@ class EmailAttachmentSerializer(serializers.Serializer):
             "customer_email",
             "subject",
             "body",
-            "attachments"
+            "attachment"
         ]
 
 class SalesTransactionSerializer(serializers.ModelSerializer):
@@ -517,4 +534,5 @@ class SalesTransactionSerializer(serializers.ModelSerializer):
     """
     class Meta:
         model = SalesTransaction
-        fields = ['transaction_id', 'product', 'customer', 'quantity', 'total_amount', 'status']
\ No newline at end of file
+        fields = ['transaction_id', 'product', 'customer', 'quantity',
+                  'transaction_date', 'total_amount', 'status']
\ No newline at end of file
@@ -0,0 +1,149 @@
+"""
+@Description: Slow-query log.
+An execute wrapper, installed on every database connection as it opens, times each statement. Statements slower than INVENTORY_SLOW_QUERY_MS are written as one JSON line to the "inventory.slow_queries" logger (a rotating file, see LOGGING), with the view that ran them, the innermost project stack frame and the database's query plan. A statement that fails is logged with its error class and without a plan. Parameter values are not logged. The slow_query_report command groups the entries by SQL fingerprint.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+import contextvars
+import json
+import logging
+import os
+import re
+import time
+import traceback
+
+from django.conf import settings
+from django.db import DatabaseError
+from django.db.backends.signals import connection_created
+from django.utils import timezone
+
+logger = logging.getLogger("inventory.slow_queries")
+
+DEFAULT_THRESHOLD_MS = 200
+EXPLAIN_PREFIXES = {"sqlite": "EXPLAIN QUERY PLAN ", "postgresql": "EXPLAIN "}
+
+# The view handling the current request, set by SlowQueryLogMiddleware.
+current_view = contextvars.ContextVar("inventory_current_view", default=None)
+_explaining = contextvars.ContextVar("inventory_explaining", default=False)
+
+_HERE = os.path.abspath(__file__)
+_SITE_PACKAGES = (f"{os.sep}site-packages{os.sep}", f"{os.sep}dist-packages{os.sep}")
+
+
+def project_frame():
+    """
+    @Description: Finds the innermost stack frame in the project's own code, skipping Django and other libraries.
+    @Return: dict: file, line, function and code of the frame, or None.
+    """
+    base = str(settings.BASE_DIR)
+    for frame in reversed(traceback.extract_stack()):
+        filename = os.path.abspath(frame.filename)
+        if (
+            filename.startswith(base)
+            and filename != _HERE
+            and not any(part in filename for part in _SITE_PACKAGES)
+        ):
+            return {
+                "file": os.path.relpath(filename, base),
+                "line": frame.lineno,
+                "function": frame.name,
+                "code": frame.line,
+            }
+    return None
+
+
+def explain(connection, sql, params):
+    """
+    @Description: Captures the plan of a read statement with the vendor's EXPLAIN, on the same connection.
+    @Return: list: The plan rows as strings, or None for statements that are not explained.
+    """
+    prefix = EXPLAIN_PREFIXES.get(connection.vendor)
+    keyword = sql.lstrip()[:6].upper()
+    if prefix is None or not keyword.startswith(("SELECT", "WITH")):
+        return None
+    token = _explaining.set(True)
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(prefix + sql, params)
+            return [" ".join(str(value) for value in row) for row in cursor.fetchall()]
+    except DatabaseError as exc:
+        return [f"EXPLAIN failed: {exc}"]
+    finally:
+        _explaining.reset(token)
+
+
+class SlowQueryWrapper:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __call__(self, execute, sql, params, many, context):
+        threshold = getattr(settings, "INVENTORY_SLOW_QUERY_MS", DEFAULT_THRESHOLD_MS)
+        if threshold is None or _explaining.get():
+            return execute(sql, params, many, context)
+        started = time.perf_counter()
+        try:
+            result = execute(sql, params, many, context)
+        except Exception as exc:
+            # The transaction may be aborted now (PostgreSQL), so no EXPLAIN is
+            # sent after a failed statement.
+            duration = (time.perf_counter() - started) * 1000
+            if duration >= threshold:
+                self.log(sql, params, many, duration, error=type(exc).__name__)
+            raise
+        duration = (time.perf_counter() - started) * 1000
+        if duration >= threshold:
+            self.log(sql, params, many, duration)
+        return result
+
+    def log(self, sql, params, many, duration, error=None):
+        entry = {
+            "time": timezone.now().isoformat(),
+            "duration_ms": round(duration, 3),
+            "alias": self.connection.alias,
+            "sql": sql,
+            "many": many,
+            "view": current_view.get(),
+            "frame": project_frame(),
+            "error": error,
+            "explain": (
+                None if many or error else explain(self.connection, sql, params)
+            ),
+        }
+        logger.warning(json.dumps(entry, default=str))
+
+
+def install(sender, connection, **kwargs):
+    # connection_created fires on every reconnect of the same wrapper object. The
+    # wrapper goes first so that a connection opened inside an execute_wrapper()
+    # block does not break that block's pop() on exit.
+    if not any(isinstance(w, SlowQueryWrapper) for w in connection.execute_wrappers):
+        connection.execute_wrappers.insert(0, SlowQueryWrapper(connection))
+
+
+def connect_signals():
+    connection_created.connect(install, dispatch_uid="inventory_slow_query_log")
+
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|\?")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_SPACE = re.compile(r"\s+")
+
+
+def fingerprint(sql):
+    """
+    @Description: Normalises SQL so statements differing only in literals, placeholders or IN-list length group together.
+    @Param: sql (str): The statement.
+    @Return: str: The fingerprint.
+    """
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _PLACEHOLDER.sub("?", sql)
+    sql = _IN_LIST.sub("(...)", sql)
+    return _SPACE.sub(" ", sql).strip()
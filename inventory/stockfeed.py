@@ -0,0 +1,288 @@
+"""
+@Description: Live stock feed: per-warehouse stock changes, pushed to the browser as they are committed.
+post_save/post_delete of Inventory rows and of the stock ledgers (InventoryTransaction, StockAdjustment), and bulk writes that call publish_bulk() (the inventory importer), publish a change once the transaction commits: the new Inventory quantity of a product, or the signed change to its StockLevel. Rolled-back writes publish nothing. A broker (settings.INVENTORY_STOCK_FEED_BACKEND) keeps a short backlog of changes per warehouse and wakes the streams waiting on it. Streams wait for a change, let a burst settle for INVENTORY_STOCK_FEED_COALESCE seconds and send everything since their cursor as one merged delta, so a page that already shows the list only receives what changed and never queries the database while it waits.
+LocalBroker lives in the process that made the write, so it only serves every client when the site runs as a single process; with several worker processes, point INVENTORY_STOCK_FEED_BACKEND at a broker shared between them (Redis pub/sub, PostgreSQL LISTEN/NOTIFY) that implements the same four methods.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+import asyncio
+import functools
+import json
+import threading
+import uuid
+from collections import defaultdict, deque
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.utils.module_loading import import_string
+
+from .models import Inventory, InventoryTransaction, StockAdjustment
+
+DEFAULT_BACKEND = "inventory.stockfeed.LocalBroker"
+DEFAULT_BACKLOG = 1000
+DEFAULT_COALESCE = 0.25
+HEARTBEAT_SECONDS = 15
+# Streams end after this long and the browser reconnects with Last-Event-ID,
+# so no connection outlives a deploy or a lost disconnect by much.
+STREAM_SECONDS = 300
+RETRY_MS = 2000
+
+
+class LocalBroker:
+    """
+    @Description: In-process broker. Changes are numbered in one sequence and kept in a bounded backlog per warehouse; a cursor ("<epoch>-<number>") names a point in that sequence.
+    publish() may be called from any thread; waiters are woken on their own event loop.
+    @Param: backlog (int): Changes kept per warehouse. A cursor older than the backlog, or from another process, can no longer be resumed and since() returns None for it.
+    """
+
+    def __init__(self, backlog=DEFAULT_BACKLOG):
+        self.epoch = uuid.uuid4().hex[:8]
+        self.sequence = 0
+        self.lock = threading.Lock()
+        self.backlogs = defaultdict(lambda: deque(maxlen=backlog))
+        self.evicted = defaultdict(int)
+        self.waiters = defaultdict(set)
+
+    def publish(self, warehouse_id, change):
+        """
+        @Description: Records a committed change and wakes the streams of its warehouse.
+        @Param: warehouse_id (int): The warehouse.
+        @Param: change (dict): {"inventory": {product_id: quantity or None}} and/or {"stock": {product_id: delta}}.
+        """
+        with self.lock:
+            self.sequence += 1
+            backlog = self.backlogs[warehouse_id]
+            if len(backlog) == backlog.maxlen:
+                self.evicted[warehouse_id] = backlog[0][0]
+            backlog.append((self.sequence, change))
+            waiters = list(self.waiters[warehouse_id])
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # The waiter's loop has closed; it is removed when its wait ends.
+                pass
+
+    def cursor(self):
+        """
+        @Description: Returns the cursor of the latest change.
+        """
+        with self.lock:
+            return f"{self.epoch}-{self.sequence}"
+
+    def since(self, warehouse_id, cursor):
+        """
+        @Description: Returns a warehouse's changes after cursor.
+        @Return: tuple: (list of changes, or None if cursor cannot be resumed; the cursor to continue from).
+        """
+        with self.lock:
+            epoch, _, number = (cursor or "").partition("-")
+            current = f"{self.epoch}-{self.sequence}"
+            if epoch != self.epoch or not number.isdigit():
+                return None, current
+            after = int(number)
+            if after > self.sequence or after < self.evicted[warehouse_id]:
+                return None, current
+            changes = [
+                change
+                for sequence, change in self.backlogs[warehouse_id]
+                if sequence > after
+            ]
+            return changes, current
+
+    async def wait(self, warehouse_id, cursor, timeout=None):
+        """
+        @Description: Waits until since() has something for cursor, or timeout seconds pass.
+        @Return: bool: False on timeout.
+        """
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self.lock:
+            self.waiters[warehouse_id].add(waiter)
+        try:
+            # Checked after registering, so a change published in between is not missed.
+            changes, _ = self.since(warehouse_id, cursor)
+            if changes is None or changes:
+                return True
+            try:
+                await asyncio.wait_for(waiter[1].wait(), timeout)
+            except asyncio.TimeoutError:
+                return False
+            return True
+        finally:
+            with self.lock:
+                self.waiters[warehouse_id].discard(waiter)
+
+
+_brokers = {}
+
+
+def get_broker():
+    """
+    @Description: Returns the broker named by settings.INVENTORY_STOCK_FEED_BACKEND, shared by the process.
+    """
+    path = getattr(settings, "INVENTORY_STOCK_FEED_BACKEND", DEFAULT_BACKEND)
+    if path not in _brokers:
+        _brokers[path] = import_string(path)()
+    return _brokers[path]
+
+
+def coalesce_seconds():
+    return getattr(settings, "INVENTORY_STOCK_FEED_COALESCE", DEFAULT_COALESCE)
+
+
+def merge(changes):
+    """
+    @Description: Folds a run of changes into one delta: the latest Inventory quantity per product and the summed StockLevel change, leaving out products whose stock came back to where it was.
+    @Return: dict: {"inventory": {...}, "stock": {...}} with only the non-empty parts.
+    """
+    inventory = {}
+    stock = defaultdict(int)
+    for change in changes:
+        inventory.update(change.get("inventory", {}))
+        for product_id, delta in change.get("stock", {}).items():
+            stock[product_id] += delta
+    merged = {"inventory": inventory, "stock": {k: v for k, v in stock.items() if v}}
+    return {part: values for part, values in merged.items() if values}
+
+
+def publish_on_commit(warehouse_id, change, using=None):
+    transaction.on_commit(
+        functools.partial(_publish, warehouse_id, change), using=using
+    )
+
+
+def _publish(warehouse_id, change):
+    get_broker().publish(warehouse_id, change)
+
+
+def publish_bulk(model, rows, using=None):
+    """
+    @Description: Publishes Inventory rows written without signals (bulk_create/bulk_update), one merged change per warehouse, once the transaction commits.
+    @Param: model (Model): The model written; other models than Inventory are ignored.
+    @Param: rows (list): The created and updated instances.
+    @Param: using (str): The database alias whose transaction to wait for.
+    """
+    if model is not Inventory:
+        return
+    quantities = defaultdict(dict)
+    for row in rows:
+        quantities[row.warehouse_id][row.product_id] = row.quantity
+    for warehouse_id, inventory in quantities.items():
+        publish_on_commit(warehouse_id, {"inventory": inventory}, using)
+
+
+def inventory_saved(sender, instance, raw=False, using=None, **kwargs):
+    if not raw:
+        publish_on_commit(
+            instance.warehouse_id,
+            {"inventory": {instance.product_id: instance.quantity}},
+            using,
+        )
+
+
+def inventory_deleted(sender, instance, using=None, **kwargs):
+    publish_on_commit(
+        instance.warehouse_id, {"inventory": {instance.product_id: None}}, using
+    )
+
+
+def ledger_saved(sender, instance, created, raw=False, using=None, **kwargs):
+    if raw:
+        return
+    # Mirrors update_stock_level(): an edit first reverses the row's old effect.
+    previous = getattr(instance, "_previous_stock", None)
+    if not created and previous is not None:
+        product_id, warehouse_id, delta = previous
+        if delta:
+            publish_on_commit(warehouse_id, {"stock": {product_id: -delta}}, using)
+    delta = instance.stock_delta()
+    if delta:
+        publish_on_commit(
+            instance.warehouse_id, {"stock": {instance.product_id: delta}}, using
+        )
+
+
+def ledger_deleted(sender, instance, using=None, **kwargs):
+    delta = instance.stock_delta()
+    if delta:
+        publish_on_commit(
+            instance.warehouse_id, {"stock": {instance.product_id: -delta}}, using
+        )
+
+
+def connect_signals():
+    post_save.connect(
+        inventory_saved, sender=Inventory, dispatch_uid="stock_feed_inventory"
+    )
+    post_delete.connect(
+        inventory_deleted, sender=Inventory, dispatch_uid="stock_feed_inventory"
+    )
+    for model in (InventoryTransaction, StockAdjustment):
+        post_save.connect(
+            ledger_saved, sender=model, dispatch_uid=f"stock_feed_{model.__name__}"
+        )
+        post_delete.connect(
+            ledger_deleted, sender=model, dispatch_uid=f"stock_feed_{model.__name__}"
+        )
+
+
+def sse(event=None, event_id=None, data=None, retry=None):
+    """
+    @Description: Formats one Server-Sent Events message.
+    @Return: bytes: The message, ending in a blank line.
+    """
+    lines = []
+    if retry is not None:
+        lines.append(f"retry: {retry}")
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event is not None:
+        lines.append(f"event: {event}")
+    if data is not None:
+        lines.append(f"data: {json.dumps(data, separators=(',', ':'))}")
+    return ("\n".join(lines) + "\n\n").encode()
+
+
+def catch_up(broker, warehouse_id, cursor):
+    """
+    @Description: The messages that bring a client at cursor up to date.
+    A "stock" message carries the merged delta; a "reset" message means the changes since cursor are gone and the page must be reloaded.
+    @Return: tuple: (list of messages, the new cursor).
+    """
+    changes, cursor = broker.since(warehouse_id, cursor)
+    if changes is None:
+        return [sse("reset", cursor, {"warehouse": warehouse_id})], cursor
+    delta = merge(changes)
+    if not delta:
+        return [], cursor
+    return [sse("stock", cursor, {"warehouse": warehouse_id, **delta})], cursor
+
+
+async def stream(broker, warehouse_id, cursor, lifetime=STREAM_SECONDS):
+    """
+    @Description: The body of an event stream: catches up from cursor, then sends each burst of changes as one merged message and a comment every HEARTBEAT_SECONDS when there are none, until lifetime seconds have passed.
+    @Return: AsyncIterator[bytes]: The messages.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + lifetime
+    yield sse(event_id=cursor, retry=RETRY_MS)
+    messages, cursor = catch_up(broker, warehouse_id, cursor)
+    while True:
+        for message in messages:
+            yield message
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return
+        timeout = min(HEARTBEAT_SECONDS, remaining)
+        if await broker.wait(warehouse_id, cursor, timeout):
+            await asyncio.sleep(coalesce_seconds())
+            messages, cursor = catch_up(broker, warehouse_id, cursor)
+        else:
+            messages = []
+            yield b": keep-alive\n\n"
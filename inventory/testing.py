@@ -0,0 +1,134 @@
+"""
+@Description: Test runner that can run the suite against a throwaway PostgreSQL cluster.
+With DB_TEST_CLUSTER=1 the runner initialises a temporary cluster with the local initdb/pg_ctl binaries (no Docker), points the default database at it for the run and deletes it afterwards. Without the variable, or when the binaries are missing, the suite runs on the configured database as usual, SQLite by default.
+@Author: Jobet P. Casquejo
+@Last Date Modified: 2026-10-18
+@Last Modified By: Jobet P. Casquejo
+Modification Log
+Version     Author           Date                Logs
+1.0         Jobet Casquejo   2026-10-18          Initial Version
+"""
+
+import glob
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.runner import DiscoverRunner
+
+
+def find_binary(name):
+    """
+    @Description: Finds a PostgreSQL server binary on PATH or in the usual Debian/Homebrew install directories.
+    @Return: str: The binary's path, or None.
+    """
+    path = shutil.which(name)
+    if path:
+        return path
+    candidates = sorted(
+        glob.glob(f"/usr/lib/postgresql/*/bin/{name}")
+        + glob.glob(f"/usr/local/opt/postgresql*/bin/{name}")
+        + glob.glob(f"/opt/homebrew/opt/postgresql*/bin/{name}")
+    )
+    return candidates[-1] if candidates else None
+
+
+class PostgresCluster:
+    """
+    @Description: A temporary PostgreSQL cluster listening on a Unix socket, tuned for speed over durability.
+    """
+
+    def __init__(self):
+        self.initdb = find_binary("initdb")
+        self.pg_ctl = find_binary("pg_ctl")
+        self.directory = None
+        self.port = None
+
+    @property
+    def available(self):
+        return bool(self.initdb and self.pg_ctl)
+
+    def start(self):
+        self.directory = tempfile.mkdtemp(prefix="inventory-pg-")
+        data = os.path.join(self.directory, "data")
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            self.port = probe.getsockname()[1]
+        subprocess.run(
+            [self.initdb, "-D", data, "-U", "postgres", "-A", "trust", "--no-sync"],
+            check=True,
+            capture_output=True,
+        )
+        options = (
+            f"-p {self.port} -k {self.directory} -c listen_addresses='' "
+            "-c fsync=off -c synchronous_commit=off -c full_page_writes=off"
+        )
+        subprocess.run(
+            [
+                self.pg_ctl, "-D", data, "-o", options, "-w",
+                "-l", os.path.join(self.directory, "server.log"), "start",
+            ],
+            check=True,
+            capture_output=True,
+        )
+
+    def stop(self):
+        if self.directory is None:
+            return
+        data = os.path.join(self.directory, "data")
+        subprocess.run(
+            [self.pg_ctl, "-D", data, "-m", "immediate", "stop"], capture_output=True
+        )
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.directory = None
+
+    def settings(self):
+        return {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": "inventory",
+            "USER": "postgres",
+            "PASSWORD": "",
+            "HOST": self.directory,
+            "PORT": str(self.port),
+            "CONN_MAX_AGE": 0,
+            "OPTIONS": {},
+        }
+
+
+class TestRunner(DiscoverRunner):
+    """
+    @Description: DiscoverRunner that honours DB_TEST_CLUSTER=1 (see the module docstring).
+    """
+
+    cluster = None
+
+    def setup_databases(self, **kwargs):
+        if os.environ.get("DB_TEST_CLUSTER") == "1":
+            cluster = PostgresCluster()
+            if cluster.available:
+                cluster.start()
+                self.cluster = cluster
+                connections[DEFAULT_DB_ALIAS].close()
+                del connections[DEFAULT_DB_ALIAS]
+                connections.settings[DEFAULT_DB_ALIAS].update(cluster.settings())
+                if self.verbosity >= 1:
+                    sys.stderr.write(
+                        f"Using a throwaway PostgreSQL cluster on port {cluster.port}\n"
+                    )
+            else:
+                sys.stderr.write(
+                    "DB_TEST_CLUSTER=1 but initdb/pg_ctl were not found; "
+                    "running on the configured database instead.\n"
+                )
+        return super().setup_databases(**kwargs)
+
+    def teardown_databases(self, old_config, **kwargs):
+        try:
+            super().teardown_databases(old_config, **kwargs)
+        finally:
+            if self.cluster is not None:
+                self.cluster.stop()
@@ -8,10 +8,71 @@ Version     Author           Date                Logs
 1.0         Jobet Casquejo   2024-5-26           Initial Version
 """
 
-from django.test import TestCase
-from .models import Product, User
-from django.urls import reverse
-from datetime import datetime
+from django.test import RequestFactory, TestCase, override_settings
+from django.contrib.auth import get_user_model
+from django.db import DatabaseError, connection, connections, transaction
+from django.db.models import Count
+from django.utils import timezone
+from .models import (
+    Product,
+    User,
+    Supplier,
+    ProductSupplier,
+    Warehouse,
+    Inventory,
+    Order,
+    OrderDetail,
+    Customer,
+    CustomerOrder,
+    CustomerOrderDetail,
+    Shipment,
+    ShipmentDetail,
+    StockAdjustment,
+    InventoryTransaction,
+    StockLevel,
+    Event,
+    Task,
+    EmailAttachment,
+    SalesTransaction,
+    batched_order_tasks,
+    user_id_for_role,
+)
+from .pagination import KeysetPaginator
+from . import (
+    async_views,
+    benchmarks,
+    caching,
+    loadtest,
+    metrics,
+    profiling,
+    seeding,
+    stockfeed,
+)
+from .importers import import_rows
+from .relations import load_relations
+from .search import get_backend, search
+from .middleware import PIN_PRIMARY_COOKIE
+from django.core import mail
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+from django.core.exceptions import ValidationError
+from django.core.mail.backends import locmem
+from django.core.management import call_command
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.template.loader import render_to_string
+from django.http import HttpResponse
+from django.urls import path, reverse
+from asgiref.sync import async_to_sync, sync_to_async
+import asyncio
+from datetime import datetime, timedelta
+from io import StringIO
+import csv
+import json
+import os
+import re
+import shutil
+import tempfile
 
 
 class ProductViewsCRUDTest(TestCase):
@@ -50,7 +111,7 @@ class ProductViewsCRUDTest(TestCase):
         )
 
         response = self.client.put(
-            reverse("update_product", kwargs={"pk": 1}),
+            reverse("update_product", kwargs={"product_id": 1}),
             {
                 "product_name": "Test Product",
                 "description": "Updated description",
@@ -82,3 +143,1539 @@ class ProductViewsCRUDTest(TestCase):
         )
 
         self.assertEqual(response.status_code, 302)
+
+
+LIST_TEMPLATES = {
+    "inventory_transaction/inventory_transaction_list.html": (
+        "{% for row in inventory_transactions %}{{ row.id }},{% endfor %}"
+        "|{{ page.next_token|default:'' }}"
+    ),
+    "inventory/inventory_list.html": (
+        "{% for row in inventories %}"
+        "{{ row.product.product_name }} {{ row.warehouse.warehouse_name }}"
+        "{% endfor %}"
+    ),
+    "order_detail/order_detail_list.html": (
+        "{% for row in order_details %}"
+        "{{ row.order }} {{ row.product.product_name }}"
+        "{% endfor %}"
+    ),
+    "customer_order/customer_order_list.html": (
+        "{% for row in customer_orders %}"
+        "{{ row.customer.customer_name }}"
+        "{% endfor %}"
+    ),
+    "shipment_detail/shipment_detail_list.html": (
+        "{% for row in shipment_details %}"
+        "{{ row.shipment.carrier }} {{ row.order }}"
+        " {{ row.customer_order.customer.customer_name }}"
+        " {{ row.product.product_name }}"
+        "{% endfor %}"
+    ),
+    "product/product_list.html": (
+        "{% for row in products %}{{ row.product_name }},{% endfor %}"
+    ),
+    "product/search_product.html": (
+        "{% for row in products %}{{ row.product_name }},{% endfor %}"
+    ),
+    "product_supplier/product_supplier_list.html": (
+        "{% for row in product_suppliers %}"
+        "{{ row.product.product_name }} {{ row.supplier.supplier_name }}"
+        "{% endfor %}"
+    ),
+    "task/task_detail.html": "{{ task.title }} {{ task.assigned_to.username }}",
+    "inventory/search_inventory.html": (
+        "{% for row in inventories %}"
+        "{{ row.product.product_name }} {{ row.warehouse.warehouse_name }}"
+        "{% endfor %}"
+    ),
+    "order/search_order.html": (
+        "{% for row in orders %}{{ row }} {{ row.supplier.city }}{% endfor %}"
+    ),
+    "order_detail/search_order_detail.html": (
+        "{% for row in order_details %}"
+        "{{ row.order }} {{ row.product.product_name }}"
+        "{% endfor %}"
+    ),
+    "product_supplier/search_product_supplier.html": (
+        "{% for row in product_suppliers %}"
+        "{{ row.product.product_name }} {{ row.supplier.supplier_name }}"
+        "{% endfor %}"
+    ),
+    "customer_order/search_customer_order.html": (
+        "{% for row in customer_orders %}"
+        "{{ row.customer.customer_name }}"
+        "{% endfor %}"
+    ),
+    "shipment_detail/search_shipment_detail.html": (
+        "{% for row in shipment_details %}"
+        "{{ row.shipment.carrier }} {{ row.order }}"
+        " {{ row.customer_order.customer.customer_name }}"
+        " {{ row.product.product_name }}"
+        "{% endfor %}"
+    ),
+    "customer_order_detail/search_customer_order_detail.html": (
+        "{% for row in customer_order_details %}"
+        "{{ row.customer_order.customer.customer_name }}"
+        " {{ row.product.unit_price }}"
+        "{% endfor %}"
+    ),
+}
+
+LOCMEM_TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "OPTIONS": {
+            "loaders": [("django.template.loaders.locmem.Loader", LIST_TEMPLATES)],
+        },
+    }
+]
+
+
+class QueryBudgetMixin:
+    """
+    @Description: Test helper that fails when a block of code runs more SQL queries than its budget.
+    """
+
+    def assertQueryBudget(self, budget, func, *args, **kwargs):
+        executed = []
+
+        def record(execute, sql, params, many, context):
+            executed.append(sql)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(record):
+            result = func(*args, **kwargs)
+        if len(executed) > budget:
+            self.fail(
+                f"{len(executed)} queries executed, budget is {budget}:\n"
+                + "\n".join(executed[: budget + 10])
+            )
+        return result
+
+
+class KeysetPaginationTest(TestCase):
+    def setUp(self):
+        product = Product.objects.create(product_name="Widget", unit_price=1)
+        warehouse = Warehouse.objects.create(warehouse_name="Main", location="PH")
+        now = timezone.now()
+        # Pairs share a transaction_date so the id tie-breaker is exercised.
+        self.transactions = [
+            InventoryTransaction.objects.create(
+                product=product,
+                warehouse=warehouse,
+                quantity=index,
+                transaction_type="IN",
+                transaction_date=now - timedelta(minutes=index // 2),
+            )
+            for index in range(7)
+        ]
+        self.expected = [
+            row.id
+            for row in sorted(
+                self.transactions,
+                key=lambda row: (row.transaction_date, row.id),
+                reverse=True,
+            )
+        ]
+
+    def paginator(self):
+        return KeysetPaginator(
+            InventoryTransaction.objects.all(),
+            keys=("transaction_date", "id"),
+            page_size=3,
+        )
+
+    def test_walks_forward_and_back(self):
+        paginator = self.paginator()
+        pages = [paginator.page()]
+        while pages[-1].has_next():
+            pages.append(paginator.page(pages[-1].next_token))
+
+        seen = [row.id for page in pages for row in page]
+        self.assertEqual(seen, self.expected)
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertFalse(pages[0].has_previous())
+
+        previous = paginator.page(pages[-1].prev_token)
+        self.assertEqual([row.id for row in previous], self.expected[3:6])
+        self.assertTrue(previous.has_next())
+
+    def test_deep_page_is_a_single_query(self):
+        paginator = self.paginator()
+        token = paginator.page().next_token
+        with self.assertNumQueries(1):
+            paginator.page(token)
+
+    @override_settings(TEMPLATES=LOCMEM_TEMPLATES)
+    def test_list_view_uses_cursor(self):
+        user = get_user_model().objects.create_user(
+            username="pager", password="password123"
+        )
+        self.client.force_login(user)
+        url = reverse("inventory_transaction_list")
+
+        response = self.client.get(url, {"page_size": 4})
+        rows, token = response.content.decode().split("|")
+        self.assertEqual(rows, "".join(f"{pk}," for pk in self.expected[:4]))
+
+        response = self.client.get(url, {"page_size": 4, "cursor": token})
+        rows, token = response.content.decode().split("|")
+        self.assertEqual(rows, "".join(f"{pk}," for pk in self.expected[4:]))
+        self.assertEqual(token, "")
+
+        response = self.client.get(url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 400)
+
+
+@override_settings(TEMPLATES=LOCMEM_TEMPLATES, INVENTORY_MAX_PAGE_SIZE=1000)
+class ListQueryBudgetTest(QueryBudgetMixin, TestCase):
+    ROWS = 1000
+    # Session and user lookups plus the page query itself.
+    BUDGETS = {
+        "inventory_list": 3,
+        "order_detail_list": 3,
+        "customer_order_list": 3,
+        "shipment_detail_list": 3,
+        "product_supplier_list": 3,
+    }
+    # Session and user lookups, the id search and the page query.
+    SEARCH_BUDGETS = {
+        "search_inventory": ("Product", 4),
+        "search_order": ("Supplier", 4),
+        "search_order_detail": ("Product", 4),
+        "search_product_supplier": ("Product", 4),
+        "search_customer_order": ("Customer", 4),
+        "search_shipment_detail": ("LBC", 4),
+        "search_customer_order_detail": ("Product", 4),
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        today = timezone.now().date()
+        products = Product.objects.bulk_create(
+            Product(product_name=f"Product {index}", unit_price=1)
+            for index in range(40)
+        )
+        warehouses = Warehouse.objects.bulk_create(
+            Warehouse(warehouse_name=f"Warehouse {index}", location="PH")
+            for index in range(25)
+        )
+        suppliers = Supplier.objects.bulk_create(
+            Supplier(supplier_name=f"Supplier {index}") for index in range(25)
+        )
+        customer = Customer.objects.create(customer_name="Customer")
+        orders = Order.objects.bulk_create(
+            Order(order_date=today, supplier=suppliers[index % 25])
+            for index in range(cls.ROWS)
+        )
+        customer_orders = CustomerOrder.objects.bulk_create(
+            CustomerOrder(customer=customer, order_date=today)
+            for index in range(cls.ROWS)
+        )
+        shipment = Shipment.objects.create(shipment_date=today, carrier="LBC")
+        pairs = [(product, other) for product in products for other in range(25)]
+        Inventory.objects.bulk_create(
+            Inventory(product=product, warehouse=warehouses[index], quantity=1)
+            for product, index in pairs
+        )
+        ProductSupplier.objects.bulk_create(
+            ProductSupplier(product=product, supplier=suppliers[index])
+            for product, index in pairs
+        )
+        OrderDetail.objects.bulk_create(
+            OrderDetail(order=order, product=products[0], quantity=1, unit_price=1)
+            for order in orders
+        )
+        ShipmentDetail.objects.bulk_create(
+            ShipmentDetail(
+                shipment=shipment,
+                order=order,
+                customer_order=customer_order,
+                product=products[0],
+                quantity=1,
+            )
+            for order, customer_order in zip(orders, customer_orders)
+        )
+        CustomerOrderDetail.objects.bulk_create(
+            CustomerOrderDetail(
+                customer_order=customer_order,
+                product=products[index % 40],
+                quantity=1,
+                unit_price=1,
+            )
+            for index, customer_order in enumerate(customer_orders)
+        )
+        # bulk_create skips the signals that keep the search index in sync; the
+        # backend's one-off check for its tables is not part of any view's budget.
+        backend = get_backend()
+        for model in (Product, Supplier):
+            backend.rebuild(model)
+        backend.available()
+        cls.user = get_user_model().objects.create_user(
+            username="budget", password="password123"
+        )
+
+    def test_list_views_stay_within_budget(self):
+        self.client.force_login(self.user)
+        for name, budget in self.BUDGETS.items():
+            with self.subTest(view=name):
+                response = self.assertQueryBudget(
+                    budget, self.client.get, reverse(name), {"page_size": self.ROWS}
+                )
+                self.assertEqual(response.status_code, 200)
+
+    def test_search_views_stay_within_budget(self):
+        self.client.force_login(self.user)
+        for name, (query, budget) in self.SEARCH_BUDGETS.items():
+            with self.subTest(view=name):
+                response = self.assertQueryBudget(
+                    budget, self.client.get, reverse(name), {"query": query}
+                )
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(response.content.strip())
+
+    def test_joined_rows_leave_wide_columns_behind(self):
+        row = load_relations(Inventory.objects.all()).first()
+        self.assertIn("description", row.product.get_deferred_fields())
+        self.assertEqual(row.get_deferred_fields(), set())
+        row = load_relations(ProductSupplier.objects.all()).first()
+        self.assertIn("address", row.supplier.get_deferred_fields())
+
+
+class SearchIndexTest(TestCase):
+    def setUp(self):
+        # search_product is cached, and rolled-back writes never bump versions.
+        cache.clear()
+        self.bolt = Product.objects.create(
+            product_name="Hex Bolt", category="Fasteners", unit_price=1
+        )
+        self.nut = Product.objects.create(
+            product_name="Hex Nut", description="Pairs with a bolt", unit_price=1
+        )
+        self.washer = Product.objects.create(product_name="Washer", unit_price=1)
+
+    def names(self, rows):
+        return [row.product_name for row in rows]
+
+    def test_matches_substrings_and_ranks(self):
+        self.assertEqual(self.names(search(Product.objects.all(), "asher")), ["Washer"])
+        self.assertEqual(
+            self.names(search(Product.objects.all(), "bolt")), ["Hex Bolt", "Hex Nut"]
+        )
+        self.assertEqual(len(search(Product.objects.all(), "hex", limit=1)), 1)
+
+    def test_index_follows_saves_and_deletes(self):
+        self.washer.product_name = "Spring Washer"
+        self.washer.save()
+        self.assertEqual(
+            self.names(search(Product.objects.all(), "spring")), ["Spring Washer"]
+        )
+        self.nut.delete()
+        self.assertEqual(self.names(search(Product.objects.all(), "nut")), [])
+
+    def test_short_query_falls_back_to_icontains(self):
+        self.assertEqual(
+            self.names(search(Product.objects.all(), "nu")), ["Hex Nut"]
+        )
+
+    def test_search_through_relation(self):
+        warehouse = Warehouse.objects.create(warehouse_name="Main", location="PH")
+        stock = Inventory.objects.create(
+            product=self.washer, warehouse=warehouse, quantity=3
+        )
+        Inventory.objects.create(product=self.bolt, warehouse=warehouse, quantity=3)
+        self.assertEqual(
+            search(Inventory.objects.all(), "washer", via="product"), [stock]
+        )
+
+    @override_settings(TEMPLATES=LOCMEM_TEMPLATES)
+    def test_search_view(self):
+        user = get_user_model().objects.create_user(
+            username="searcher", password="password123"
+        )
+        self.client.force_login(user)
+        response = self.client.get(reverse("search_product"), {"query": "washer"})
+        self.assertEqual(response.content.decode(), "Washer,")
+
+
+class StockLevelTest(TestCase):
+    def setUp(self):
+        self.product = Product.objects.create(product_name="Widget", unit_price=1)
+        self.warehouse = Warehouse.objects.create(warehouse_name="Main", location="PH")
+
+    def level(self):
+        return StockLevel.objects.get(
+            product=self.product, warehouse=self.warehouse
+        ).quantity
+
+    def record(self, quantity, transaction_type="IN"):
+        return InventoryTransaction.objects.create(
+            product=self.product,
+            warehouse=self.warehouse,
+            quantity=quantity,
+            transaction_type=transaction_type,
+        )
+
+    def test_ledger_writes_update_stock_level(self):
+        self.record(10)
+        outbound = self.record(4, "OUT")
+        StockAdjustment.objects.create(
+            product=self.product,
+            warehouse=self.warehouse,
+            adjustment_date=timezone.now().date(),
+            quantity=-1,
+        )
+        self.assertEqual(self.level(), 5)
+
+        outbound.quantity = 6
+        outbound.save()
+        self.assertEqual(self.level(), 3)
+
+        outbound.delete()
+        self.assertEqual(self.level(), 9)
+
+    def test_product_delete_cascades(self):
+        self.record(10)
+        self.product.delete()
+        self.assertFalse(StockLevel.objects.exists())
+
+    def test_rebuild_matches_ledgers(self):
+        self.record(10)
+        # bulk_create skips signals, leaving the projection stale.
+        InventoryTransaction.objects.bulk_create(
+            [
+                InventoryTransaction(
+                    product=self.product,
+                    warehouse=self.warehouse,
+                    quantity=3,
+                    transaction_type="OUT",
+                )
+            ]
+        )
+        self.assertEqual(self.level(), 10)
+        level = StockLevel.objects.get()
+        other = Warehouse.objects.create(warehouse_name="Annex", location="PH")
+        StockLevel.objects.create(product=self.product, warehouse=other, quantity=4)
+        call_command("rebuild_stock_levels", chunk_size=1, stdout=StringIO())
+        self.assertEqual(self.level(), 7)
+        # Rows are updated in place, and rows without ledger entries are removed.
+        self.assertEqual(StockLevel.objects.get().pk, level.pk)
+
+
+class ImportDataTest(TestCase):
+    def setUp(self):
+        self.product = Product.objects.create(product_name="Widget", unit_price=1)
+        self.warehouse = Warehouse.objects.create(warehouse_name="Main", location="PH")
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w") as handle:
+            handle.write(content)
+        return path
+
+    def test_csv_import_creates_and_updates_products(self):
+        path = self.write(
+            "products.csv",
+            "id,product_name,category,unit_price,reorder_level\n"
+            f"{self.product.pk},Blue Widget,Parts,2.50,1\n"
+            ",Sprocket,Parts,1.25,0\n"
+            ",Gear,Parts,not-a-price,0\n",
+        )
+        errors = os.path.join(self.directory.name, "errors.jsonl")
+        out = StringIO()
+        call_command(
+            "import_data", "product", path, errors=errors, chunk_size=2, stdout=out
+        )
+        self.assertIn("1 created, 1 updated, 1 rejected", out.getvalue())
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.product_name, "Blue Widget")
+        self.assertEqual(
+            [row.product_name for row in search(Product.objects.all(), "sprocket")],
+            ["Sprocket"],
+        )
+        with open(errors) as handle:
+            rejected = [json.loads(line) for line in handle]
+        self.assertEqual(len(rejected), 1)
+        self.assertEqual(rejected[0]["line"], 4)
+        self.assertIn("unit_price", rejected[0]["errors"])
+
+    def test_jsonl_inventory_upserts_on_product_and_warehouse(self):
+        Inventory.objects.create(
+            product=self.product, warehouse=self.warehouse, quantity=1
+        )
+        rows = [
+            {"product": self.product.pk, "warehouse": self.warehouse.pk, "quantity": 7},
+            {"product": 999, "warehouse": self.warehouse.pk, "quantity": 1},
+        ]
+        path = self.write(
+            "inventory.jsonl", "\n".join(json.dumps(row) for row in rows) + "\n{oops\n"
+        )
+        call_command("import_data", "inventory", path, stdout=StringIO())
+        self.assertEqual(Inventory.objects.get().quantity, 7)
+
+    def test_upload_endpoint(self):
+        admin = get_user_model().objects.create_superuser(
+            username="importer", password="password123"
+        )
+        self.client.force_login(admin)
+        upload = SimpleUploadedFile(
+            "customers.csv",
+            b"customer_name,contact_name,address,city,post_code,country,phone\n"
+            b"Acme,Ann,1 Road,Manila,1000,PH,555\n"
+            b",Bob,2 Road,Cebu,6000,PH,555\n",
+        )
+        response = self.client.post(
+            reverse("import_data_upload"), {"model": "customer", "file": upload}
+        )
+        data = response.json()
+        self.assertEqual((data["created"], data["rejected"]), (1, 1))
+        self.assertIn("customer_name", data["errors"][0]["errors"])
+        self.assertTrue(Customer.objects.filter(customer_name="Acme").exists())
+
+
+class ExportTest(TestCase):
+    def setUp(self):
+        self.client.force_login(
+            get_user_model().objects.create_user(
+                username="finance", password="password123"
+            )
+        )
+        self.warehouse = Warehouse.objects.create(warehouse_name="Main", location="PH")
+        self.bolt = Product.objects.create(product_name="Hex Bolt", unit_price=1)
+        self.washer = Product.objects.create(product_name="Washer", unit_price=1)
+
+    def export(self, name, **params):
+        response = self.client.get(reverse("export_rows", args=[name]), params)
+        self.assertTrue(response.streaming)
+        content = b"".join(response.streaming_content).decode()
+        return list(csv.DictReader(StringIO(content)))
+
+    def test_inventory_transactions_newest_first(self):
+        for quantity in (1, 2):
+            InventoryTransaction.objects.create(
+                product=self.bolt,
+                warehouse=self.warehouse,
+                quantity=quantity,
+                transaction_type="IN",
+            )
+        rows = self.export("inventory_transaction")
+        self.assertEqual([row["quantity"] for row in rows], ["2", "1"])
+        self.assertEqual(rows[0]["product__product_name"], "Hex Bolt")
+        self.assertEqual(rows[0]["warehouse__warehouse_name"], "Main")
+
+    def test_query_matches_search_view(self):
+        for product in (self.bolt, self.washer):
+            Inventory.objects.create(
+                product=product, warehouse=self.warehouse, quantity=1
+            )
+        rows = self.export("inventory", query="washer")
+        self.assertEqual([row["product__product_name"] for row in rows], ["Washer"])
+        self.assertEqual(len(self.export("product", query="ex")), 1)
+
+    def test_unknown_export_and_format(self):
+        self.assertEqual(
+            self.client.get(reverse("export_rows", args=["nope"])).status_code, 404
+        )
+        response = self.client.get(
+            reverse("export_rows", args=["task"]), {"query": "x"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class RestApiTest(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="integration", password="password123"
+        )
+        self.client.force_login(self.user)
+        self.warehouse = Warehouse.objects.create(warehouse_name="Main", location="PH")
+
+    def test_list_is_cursor_paginated_and_sparse(self):
+        for index in range(3):
+            Product.objects.create(product_name=f"Part {index}", unit_price=1)
+        response = self.client.get(
+            "/api/products/", {"page_size": 2, "fields": "id,product_name"}
+        )
+        data = response.json()
+        self.assertEqual(
+            [row["product_name"] for row in data["results"]], ["Part 2", "Part 1"]
+        )
+        self.assertEqual(set(data["results"][0]), {"id", "product_name"})
+        data = self.client.get(data["next"]).json()
+        self.assertEqual([row["product_name"] for row in data["results"]], ["Part 0"])
+
+    def test_filters_and_query(self):
+        bolt = Product.objects.create(product_name="Hex Bolt", unit_price=1)
+        washer = Product.objects.create(product_name="Washer", unit_price=1)
+        for product in (bolt, washer):
+            Inventory.objects.create(
+                product=product, warehouse=self.warehouse, quantity=1
+            )
+        rows = self.client.get("/api/inventory/", {"query": "washer"}).json()
+        self.assertEqual([row["product"] for row in rows["results"]], [washer.pk])
+        rows = self.client.get("/api/inventory/", {"product": bolt.pk}).json()
+        self.assertEqual([row["product"] for row in rows["results"]], [bolt.pk])
+
+    def test_create(self):
+        response = self.client.post(
+            "/api/warehouses/",
+            {"warehouse_name": "Annex", "location": "Cebu"},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(Warehouse.objects.filter(warehouse_name="Annex").exists())
+
+    def test_list_queries_do_not_grow_with_rows(self):
+        def add_events(count):
+            for index in range(count):
+                event = Event.objects.create(
+                    name=f"Event {index}",
+                    start_time=timezone.now(),
+                    end_time=timezone.now(),
+                    location="PH",
+                )
+                event.participants.add(participant)
+
+        participant = User.objects.create_user(username="guest", password="x")
+        add_events(2)
+        executed = []
+        with connection.execute_wrapper(
+            lambda execute, sql, *args: executed.append(sql) or execute(sql, *args)
+        ):
+            self.client.get("/api/events/")
+        add_events(20)
+        response = self.assertQueryBudget(
+            len(executed), self.client.get, "/api/events/"
+        )
+        self.assertEqual(len(response.json()["results"]), 22)
+
+
+class BulkApiTest(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        self.client.force_login(
+            get_user_model().objects.create_user(
+                username="purchasing", password="password123"
+            )
+        )
+        self.order = Order.objects.create(order_date=timezone.now().date())
+        self.products = [
+            Product.objects.create(product_name=f"Part {index}", unit_price=1)
+            for index in range(3)
+        ]
+
+    def lines(self, count):
+        return [
+            {
+                "order": self.order.pk,
+                "product": self.products[index % 3].pk,
+                "quantity": index + 1,
+                "unit_price": "2.50",
+            }
+            for index in range(count)
+        ]
+
+    def send(self, method, data):
+        return getattr(self.client, method)(
+            "/api/order-details/bulk/", data, content_type="application/json"
+        )
+
+    def test_create_in_constant_queries(self):
+        response = self.assertQueryBudget(12, self.send, "post", self.lines(300))
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(OrderDetail.objects.filter(order=self.order).count(), 300)
+        self.assertTrue(all(row["id"] for row in response.json()))
+
+    def test_invalid_items_reject_the_whole_batch(self):
+        lines = self.lines(3)
+        lines[1]["product"] = 999
+        lines[2]["quantity"] = "many"
+        response = self.send("post", lines)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.json()), {"1", "2"})
+        self.assertIn("product", response.json()["1"])
+        self.assertFalse(OrderDetail.objects.exists())
+
+    def test_update_and_delete(self):
+        created = self.send("post", self.lines(2)).json()
+        response = self.send(
+            "patch",
+            [{"id": row["id"], "quantity": 10} for row in created] + [{"id": 999}],
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("id", response.json()["2"])
+        response = self.send(
+            "patch", [{"id": row["id"], "quantity": 10} for row in created]
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            list(OrderDetail.objects.values_list("quantity", flat=True)), [10, 10]
+        )
+        response = self.send("delete", {"ids": [created[0]["id"]]})
+        self.assertEqual(response.json(), {"deleted": 1})
+        self.assertEqual(OrderDetail.objects.count(), 1)
+
+
+class OrderConfirmationTest(TestCase):
+    def setUp(self):
+        self.product = Product.objects.create(product_name="Widget", unit_price=3)
+
+    def confirm(self, line_count):
+        order = Order.objects.create(order_date=timezone.now().date())
+        lines = [{"product": self.product.pk, "quantity": 1}] * line_count
+        executed = []
+        with connection.execute_wrapper(
+            lambda execute, sql, *args: executed.append(sql) or execute(sql, *args)
+        ):
+            order.confirm(lines)
+        return order, len(executed)
+
+    def test_query_count_does_not_grow_with_lines(self):
+        _, few = self.confirm(1)
+        order, many = self.confirm(200)
+        self.assertEqual(few, many)
+        self.assertEqual(order.status, "Confirmed")
+        self.assertEqual(order.orderdetail_set.count(), 200)
+        self.assertEqual(order.orderdetail_set.first().unit_price, 3)
+
+    def test_confirming_twice_does_not_duplicate_lines(self):
+        order, _ = self.confirm(2)
+        order.save()
+        details = Order.objects.get(pk=order.pk).confirm(
+            [{"product": self.product, "quantity": 5}]
+        )
+        self.assertEqual(len(details), 2)
+        self.assertEqual(OrderDetail.objects.filter(order=order).count(), 2)
+
+    def test_cancelled_order_cannot_be_confirmed(self):
+        order = Order.objects.create(
+            order_date=timezone.now().date(), status="Cancelled"
+        )
+        with self.assertRaises(ValidationError):
+            order.confirm([{"product": self.product, "quantity": 1}])
+        self.assertFalse(OrderDetail.objects.exists())
+
+    def test_unknown_product_is_reported_by_line(self):
+        order = Order.objects.create(order_date=timezone.now().date())
+        lines = [
+            {"product": self.product.pk, "quantity": 1},
+            {"product": 999999, "quantity": 1, "unit_price": 2},
+        ]
+        with self.assertRaises(ValidationError) as raised:
+            order.confirm(lines)
+        self.assertEqual(
+            raised.exception.messages, ["Line 2: product 999999 does not exist."]
+        )
+        order.refresh_from_db()
+        self.assertEqual(order.status, "Pending")
+        self.assertFalse(OrderDetail.objects.exists())
+
+
+class NewOrderTaskTest(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            username="boss", password="password123", role="Administrator"
+        )
+
+    def place_order(self):
+        return Order.objects.create(order_date=timezone.now().date())
+
+    def test_task_created_on_commit_with_cached_admin(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.place_order()
+        self.assertEqual(Task.objects.get().assigned_to, self.admin)
+        with self.captureOnCommitCallbacks() as callbacks:
+            # Only the order insert runs until the transaction commits.
+            order = self.assertQueryBudget(1, self.place_order)
+        self.assertEqual(Task.objects.count(), 1)
+        for callback in callbacks:
+            callback()
+        self.assertEqual(
+            Task.objects.latest("id").title, f"New Order #{order.id} placed"
+        )
+
+    def test_user_changes_clear_the_cache(self):
+        self.assertEqual(user_id_for_role("Auditor"), None)
+        auditor = User.objects.create_user(
+            username="auditor", password="password123", role="Auditor"
+        )
+        self.assertEqual(user_id_for_role("Auditor"), auditor.pk)
+        auditor.delete()
+        self.assertEqual(user_id_for_role("Auditor"), None)
+
+    def test_batched_mode_coalesces_tasks(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with batched_order_tasks():
+                orders = [self.place_order() for _ in range(3)]
+        task = Task.objects.get()
+        self.assertEqual(task.title, "3 new orders placed")
+        self.assertIn(f"#{orders[-1].id}", task.description)
+
+
+class FlakyEmailBackend(locmem.EmailBackend):
+    """
+    @Description: A locmem mail backend that fails the first `failures` sends, standing in for an unreliable SMTP relay.
+    """
+
+    failures = 0
+    opened = 0
+
+    def open(self):
+        FlakyEmailBackend.opened += 1
+        return super().open()
+
+    def send_messages(self, messages):
+        if FlakyEmailBackend.failures:
+            FlakyEmailBackend.failures -= 1
+            raise ConnectionError("relay unavailable")
+        return super().send_messages(messages)
+
+
+@override_settings(
+    EMAIL_BACKEND="inventory.tests.FlakyEmailBackend",
+    INVENTORY_EMAIL_RETRY_DELAY=0,
+    MEDIA_ROOT=tempfile.gettempdir(),
+)
+class EmailOutboxTest(TestCase):
+    def setUp(self):
+        FlakyEmailBackend.failures = 0
+        FlakyEmailBackend.opened = 0
+        admin = get_user_model().objects.create_superuser(
+            username="mailer", password="password123", email="ops@example.com"
+        )
+        self.client.force_login(admin)
+
+    def compose(self, **extra):
+        response = self.client.post(
+            reverse("admin_compose_email"),
+            {"customer_email": "buyer@example.com", "subject": "Invoice", "body": "Hi"}
+            | extra,
+        )
+        return EmailAttachment.objects.get(pk=response.json()["id"])
+
+    def test_compose_queues_and_worker_sends_batch(self):
+        attachment = SimpleUploadedFile("invoice.csv", b"a,b\n" * 5000)
+        queued = [self.compose(attachment=attachment), self.compose()]
+        self.addCleanup(queued[0].attachment.delete, save=False)
+        self.assertEqual(len(mail.outbox), 0)
+        call_command("send_queued_email", stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(FlakyEmailBackend.opened, 1)
+        self.assertEqual(mail.outbox[0].from_email, "ops@example.com")
+        part = mail.outbox[0].attachments[0]
+        self.assertEqual(part.get_payload(decode=True), b"a,b\n" * 5000)
+        for email in queued:
+            email.refresh_from_db()
+            self.assertEqual(email.status, "Sent")
+
+    @override_settings(INVENTORY_EMAIL_MAX_ATTEMPTS=3)
+    def test_failures_retry_then_give_up(self):
+        email = self.compose()
+        FlakyEmailBackend.failures = 1
+        with self.assertLogs("inventory.outbox", "WARNING"):
+            call_command("send_queued_email", stdout=StringIO())
+        email.refresh_from_db()
+        self.assertEqual((email.status, email.attempts), ("Sent", 1))
+
+        email = self.compose()
+        FlakyEmailBackend.failures = 5
+        with self.assertLogs("inventory.outbox", "WARNING"):
+            call_command("send_queued_email", stdout=StringIO())
+        email.refresh_from_db()
+        self.assertEqual((email.status, email.attempts), ("Failed", 3))
+        self.assertIn("relay unavailable", email.last_error)
+
+
+class IndexUsageTest(TestCase):
+    """
+    @Description: Checks with EXPLAIN QUERY PLAN that the hot list and report queries are served from an index rather than a table scan.
+    """
+
+    def assertUsesIndex(self, queryset, index):
+        if connection.vendor != "sqlite":
+            self.skipTest("Plans are checked against SQLite's EXPLAIN QUERY PLAN.")
+        plan = queryset.explain()
+        self.assertIn(index, plan)
+        # A bare "SCAN <table>" on any line of the plan is a full table scan.
+        self.assertNotRegex(plan, re.compile(r"SCAN \w+\s*$", re.MULTILINE))
+        self.assertNotIn("USE TEMP B-TREE FOR ORDER BY", plan)
+
+    def test_hot_queries_use_indexes(self):
+        today = timezone.now().date()
+        cases = [
+            (
+                InventoryTransaction.objects.order_by("-transaction_date", "-id")[:50],
+                "invtxn_date_idx",
+            ),
+            (
+                InventoryTransaction.objects.filter(
+                    product_id=1, warehouse_id=1, transaction_date__gte=timezone.now()
+                ).order_by("transaction_date"),
+                "invtxn_prod_wh_date_idx",
+            ),
+            (
+                StockAdjustment.objects.filter(product_id=1).order_by("adjustment_date"),
+                "stockadj_product_date_idx",
+            ),
+            (
+                Order.objects.filter(status="Pending").order_by("order_date"),
+                "order_status_date_idx",
+            ),
+            (
+                CustomerOrder.objects.filter(status="Pending", order_date__lte=today),
+                "custorder_status_date_idx",
+            ),
+            (
+                SalesTransaction.objects.filter(customer_id=1).order_by(
+                    "-transaction_date"
+                ),
+                "sale_customer_date_idx",
+            ),
+            (
+                Task.objects.filter(assigned_to_id=1, completed=False).order_by(
+                    "due_date"
+                ),
+                "task_assignee_open_due_idx",
+            ),
+            (User.objects.filter(role="Administrator"), "inventory_user_role"),
+            (Product.objects.order_by("-created_at", "-id")[:50], "product_created_idx"),
+        ]
+        for queryset, index in cases:
+            with self.subTest(index=index):
+                self.assertUsesIndex(queryset, index)
+
+
+class SQLiteBackendTest(TestCase):
+    def test_pragmas_applied_on_connect(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("Only the SQLite backend sets pragmas.")
+        with connection.cursor() as cursor:
+            values = {}
+            for pragma in ("synchronous", "busy_timeout", "temp_store"):
+                cursor.execute(f"PRAGMA {pragma}")
+                values[pragma] = cursor.fetchone()[0]
+        # NORMAL is 1 and MEMORY is 2.
+        self.assertEqual(values, {"synchronous": 1, "busy_timeout": 5000, "temp_store": 2})
+
+
+@override_settings(
+    TEMPLATES=LOCMEM_TEMPLATES, INVENTORY_REPLICA_DATABASE="test_replica"
+)
+class ReplicaRoutingTest(TestCase):
+    # "__all__" is resolved in setUpClass, after the replica alias is added.
+    databases = "__all__"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.replica_directory = tempfile.mkdtemp()
+        connections.settings["test_replica"] = connections.configure_settings(
+            {
+                **connections.settings,
+                "test_replica": {
+                    "ENGINE": connection.settings_dict["ENGINE"],
+                    "NAME": os.path.join(cls.replica_directory, "replica.sqlite3"),
+                },
+            }
+        )["test_replica"]
+        call_command("migrate", database="test_replica", verbosity=0)
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        connections["test_replica"].close()
+        del connections["test_replica"]
+        del connections.settings["test_replica"]
+        shutil.rmtree(cls.replica_directory, ignore_errors=True)
+
+    def setUp(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("The two-file replica setup needs SQLite.")
+        cache.clear()
+        Product.objects.using("test_replica").create(
+            product_name="Replica washer", unit_price=1
+        )
+        Product.objects.create(product_name="Primary washer", unit_price=1)
+        self.client.force_login(
+            get_user_model().objects.create_user(
+                username="reader", password="password123"
+            )
+        )
+
+    def test_search_reads_from_replica(self):
+        response = self.client.get(reverse("search_product"), {"query": "washer"})
+        self.assertEqual(response.content.decode(), "Replica washer,")
+
+    def test_pages_read_from_replica_are_not_cached(self):
+        caching.reset_stats()
+        for _ in range(2):
+            self.client.get(reverse("search_product"), {"query": "washer"})
+        self.assertEqual(caching.stats()["search_product"], {"hits": 0, "misses": 2})
+
+    def test_reads_stick_to_primary_after_write(self):
+        response = self.client.post(
+            reverse("add_product"),
+            {
+                "product_name": "New washer",
+                "unit_price": "2.00",
+                "reorder_level": 0,
+            },
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.cookies[PIN_PRIMARY_COOKIE]["max-age"], 5)
+        self.assertFalse(
+            Product.objects.using("test_replica")
+            .filter(product_name="New washer")
+            .exists()
+        )
+        response = self.client.get(reverse("search_product"), {"query": "washer"})
+        self.assertEqual(
+            sorted(response.content.decode().strip(",").split(",")),
+            ["New washer", "Primary washer"],
+        )
+
+
+@override_settings(TEMPLATES=LOCMEM_TEMPLATES)
+class VersionedPageCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        caching.reset_stats()
+        Product.objects.create(product_name="Bolt", unit_price=1)
+        self.client.force_login(
+            get_user_model().objects.create_user(
+                username="viewer", password="password123"
+            )
+        )
+
+    def get_list(self):
+        return self.client.get(reverse("product_list")).content.decode()
+
+    def test_hits_until_a_write_bumps_the_version(self):
+        self.assertEqual(self.get_list(), "Bolt,")
+        # Only the session and user lookups run on a hit.
+        with self.assertNumQueries(2):
+            self.assertEqual(self.get_list(), "Bolt,")
+        with self.captureOnCommitCallbacks(execute=True):
+            nut = Product.objects.create(product_name="Nut", unit_price=1)
+        self.assertEqual(self.get_list(), "Nut,Bolt,")
+        with self.captureOnCommitCallbacks(execute=True):
+            nut.delete()
+        self.assertEqual(self.get_list(), "Bolt,")
+        self.assertEqual(caching.stats()["product_list"], {"hits": 1, "misses": 3})
+
+    def test_file_backend(self):
+        with tempfile.TemporaryDirectory() as directory, self.settings(
+            CACHES={
+                "default": {
+                    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                    "LOCATION": directory,
+                }
+            }
+        ):
+            self.get_list()
+            with self.captureOnCommitCallbacks(execute=True):
+                Product.objects.create(product_name="Nut", unit_price=1)
+            self.assertEqual(self.get_list(), "Nut,Bolt,")
+            self.assertEqual(self.get_list(), "Nut,Bolt,")
+        self.assertEqual(caching.stats()["product_list"], {"hits": 1, "misses": 2})
+
+    def test_hit_keeps_the_headers_of_the_miss(self):
+        @caching.cache_page_versioned(Product)
+        def download(request):
+            response = HttpResponse("Bolt", content_type="text/csv")
+            response["Content-Disposition"] = 'attachment; filename="products.csv"'
+            response["Vary"] = "Accept-Language"
+            return response
+
+        request = RequestFactory().get("/download/")
+        request.user = get_user_model().objects.get(username="viewer")
+        miss, hit = download(request), download(request)
+        self.assertEqual(caching.stats()["download"], {"hits": 1, "misses": 1})
+        self.assertEqual(hit.content, miss.content)
+        self.assertEqual(list(hit.items()), list(miss.items()))
+
+
+class TemplateCachingTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_header_fragment_cached_per_role(self):
+        request = RequestFactory().get("/")
+        request.user = get_user_model()(username="boss", is_superuser=True)
+        render_to_string("base.html", request=request)
+        self.assertIsNotNone(cache.get(make_template_fragment_key("header", ["admin"])))
+        self.assertIsNone(cache.get(make_template_fragment_key("header", ["user"])))
+
+    def test_benchmark_command(self):
+        out = StringIO()
+        call_command(
+            "benchmark_templates", iterations=2, template=["base.html"], stdout=out
+        )
+        self.assertIn("base.html", out.getvalue())
+
+
+class RequestMetricsTest(TestCase):
+    def setUp(self):
+        metrics.registry.reset()
+
+    def test_report_restricted_to_superusers(self):
+        user = get_user_model().objects.create_user(
+            username="clerk", password="password123"
+        )
+        self.client.force_login(user)
+        self.assertEqual(self.client.get(reverse("metrics_report")).status_code, 302)
+
+    def test_records_views_and_duplicated_sql(self):
+        admin = get_user_model().objects.create_superuser(
+            username="boss", password="password123"
+        )
+        self.client.force_login(admin)
+        self.client.get(reverse("metrics_report"))
+        report = self.client.get(reverse("metrics_report")).json()["views"]
+        self.assertEqual(report["metrics_report"]["count"], 1)
+        self.assertGreater(report["metrics_report"]["queries_per_request"], 0)
+
+        product = Product.objects.create(product_name="Bolt", unit_price=1)
+        recorder = metrics.QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            for _ in range(5):
+                Product.objects.get(pk=product.pk)
+        metrics.registry.record("loop", 0.01, recorder)
+        loop = metrics.registry.report()["loop"]
+        self.assertEqual(loop["p99_ms"], 10.0)
+        self.assertEqual(loop["duplicated_sql"][0]["max"], 5)
+
+
+class ProfilingTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        settings = self.settings(INVENTORY_PROFILE_DIR=self.directory)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def test_superuser_profiles_with_either_profiler(self):
+        admin = get_user_model().objects.create_superuser(
+            username="boss", password="password123"
+        )
+        self.client.force_login(admin)
+        for value, extension in (("1", ".prof"), ("sample", ".collapsed")):
+            response = self.client.get(reverse("metrics_report"), {"__profile": value})
+            name = response["X-Profile"]
+            self.assertTrue(name.endswith(extension))
+            self.assertIn("metrics_report", name)
+            self.assertTrue(os.path.isfile(os.path.join(self.directory, name)))
+        listing = self.client.get(reverse("profile_list"))
+        self.assertEqual(len(listing.context["profiles"]), 2)
+        download = self.client.get(reverse("profile_download", args=[name]))
+        self.assertEqual(download.status_code, 200)
+        download.close()
+        missing = self.client.get(reverse("profile_download", args=["passwd"]))
+        self.assertEqual(missing.status_code, 404)
+
+    @override_settings(INVENTORY_PROFILE_SAMPLE_RATE=1)
+    def test_sampled_request_falls_back_while_cprofile_is_busy(self):
+        # As if another thread's request were being profiled with cProfile.
+        with profiling._cprofile_lock:
+            response = self.client.get(reverse("login"))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["X-Profile"].endswith(".collapsed"))
+        response = self.client.get(reverse("login"))
+        self.assertTrue(response["X-Profile"].endswith(".prof"))
+
+    def test_ignored_for_other_users(self):
+        user = get_user_model().objects.create_user(
+            username="clerk", password="password123"
+        )
+        self.client.force_login(user)
+        response = self.client.get(reverse("metrics_report"), {"__profile": "1"})
+        self.assertNotIn("X-Profile", response)
+        self.assertEqual(os.listdir(self.directory), [])
+
+
+class SlowQueryLogTest(TestCase):
+    def test_logs_view_frame_and_plan(self):
+        admin = get_user_model().objects.create_superuser(
+            username="boss", password="password123"
+        )
+        self.client.force_login(admin)
+        with self.settings(INVENTORY_SLOW_QUERY_MS=0), self.assertLogs(
+            "inventory.slow_queries", "WARNING"
+        ) as logs:
+            list(Product.objects.filter(product_name="Bolt"))
+            self.client.get(reverse("metrics_report"))
+        entries = [json.loads(record.getMessage()) for record in logs.records]
+        direct = entries[0]
+        self.assertIn("product_name", direct["sql"])
+        self.assertIsNone(direct["view"])
+        self.assertEqual(direct["frame"]["function"], "test_logs_view_frame_and_plan")
+        if connection.vendor == "sqlite":
+            self.assertTrue(direct["explain"][0])
+        self.assertIn("metrics_report", [entry["view"] for entry in entries])
+
+    def test_failed_statement_is_logged_without_a_plan(self):
+        with self.settings(INVENTORY_SLOW_QUERY_MS=0), self.assertLogs(
+            "inventory.slow_queries", "WARNING"
+        ) as logs:
+            with self.assertRaises(DatabaseError), transaction.atomic():
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT * FROM inventory_no_such_table")
+        entries = [json.loads(record.getMessage()) for record in logs.records]
+        [entry] = [entry for entry in entries if "no_such_table" in entry["sql"]]
+        self.assertIn(entry["error"], ("OperationalError", "ProgrammingError"))
+        self.assertIsNone(entry["explain"])
+
+    def test_report_groups_by_fingerprint(self):
+        lines = [
+            {"sql": "SELECT * FROM t WHERE id IN (1, 2)", "duration_ms": 300},
+            {"sql": "SELECT * FROM t WHERE id IN (%s)", "duration_ms": 500},
+            {"sql": "UPDATE t SET name = 'x'", "duration_ms": 250},
+        ]
+        with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False) as log:
+            log.write("\n".join(json.dumps(line) for line in lines) + "\n")
+        self.addCleanup(os.remove, log.name)
+        out = StringIO()
+        call_command("slow_query_report", log=log.name, json=True, stdout=out)
+        report = json.loads(out.getvalue())
+        self.assertEqual(report[0]["fingerprint"], "SELECT * FROM t WHERE id IN (...)")
+        self.assertEqual(report[0]["count"], 2)
+        self.assertEqual(report[0]["max_ms"], 500)
+        self.assertEqual(report[1]["fingerprint"], "UPDATE t SET name = ?")
+
+
+class SeedInventoryTest(TestCase):
+    COUNTS = {
+        "products": 40,
+        "suppliers": 5,
+        "warehouses": 2,
+        "customers": 30,
+        "orders": 20,
+        "customer_orders": 50,
+        "shipments": 10,
+        "inventory_transactions": 400,
+        "sales_transactions": 300,
+    }
+
+    def snapshot(self):
+        return (
+            list(
+                Product.objects.order_by("id").values_list("product_name", "unit_price")
+            ),
+            list(
+                SalesTransaction.objects.order_by("pk").values_list(
+                    "product__product_name", "quantity", "transaction_date"
+                )
+            ),
+        )
+
+    def test_deterministic_and_skewed(self):
+        written = seeding.seed("tiny", seed=7, counts=self.COUNTS, chunk_size=64)
+        self.assertEqual(written["inventory.InventoryTransaction"], 400)
+        self.assertEqual(OrderDetail.objects.count(), written["inventory.OrderDetail"])
+        first = self.snapshot()
+        # Zipf: the best seller accounts for far more than an even 1/40 share.
+        top = (
+            SalesTransaction.objects.values("product")
+            .annotate(count=Count("pk"))
+            .order_by("-count")[0]["count"]
+        )
+        self.assertGreater(top, 300 / 40 * 4)
+
+        for model in (SalesTransaction, InventoryTransaction, Product):
+            model.objects.all().delete()
+        seeding.seed("tiny", seed=7, counts=self.COUNTS, chunk_size=64)
+        self.assertEqual(self.snapshot(), first)
+
+    def test_command_rebuilds_projections(self):
+        out = StringIO()
+        call_command(
+            "seed_inventory",
+            "--scale=tiny",
+            "--products=30",
+            "--inventory-transactions=200",
+            "--sales-transactions=50",
+            stdout=out,
+        )
+        self.assertEqual(Product.objects.count(), 30)
+        self.assertTrue(StockLevel.objects.exists())
+        name = Product.objects.first().product_name
+        matches = search(Product.objects.all(), name)
+        self.assertIn(name, [product.product_name for product in matches])
+
+
+class BenchmarkSuiteTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        seeding.seed("tiny", counts=SeedInventoryTest.COUNTS)
+
+    def test_run_stores_json_results(self):
+        path = os.path.join(self.directory, "run.json")
+        models = (Order, Task, StockLevel, User, get_user_model(), Session)
+        before = {model: model.objects.count() for model in models}
+        call_command(
+            "run_benchmarks",
+            "--current",
+            "--bench=product_list|ProductForm|serializers.Product|order_save",
+            "--repeat=2",
+            "--min-time=0",
+            f"--output={path}",
+            stdout=StringIO(),
+        )
+        with open(path) as results:
+            run = json.load(results)
+        measured = run["datasets"]["current"]["results"]
+        self.assertEqual(
+            set(measured),
+            {
+                "views.product_list",
+                "forms.ProductForm",
+                "serializers.ProductSerializer",
+                "serializers.ProductSupplierSerializer",
+                "signals.order_save",
+            },
+        )
+        self.assertEqual(measured["serializers.ProductSerializer"]["unit"], 40)
+        self.assertGreater(measured["views.product_list"]["median"], 0)
+        self.assertIn("commit", run)
+        # The run's writes, accounts and sessions included, are rolled back.
+        self.assertEqual({model: model.objects.count() for model in models}, before)
+
+    def test_compare_flags_regressions(self):
+        def run(median):
+            return {"datasets": {"tiny": {"results": {"views.x": {"median": median}}}}}
+
+        self.assertEqual(
+            benchmarks.compare(run(1.0), run(1.5))[0][4:], (1.5, "slower")
+        )
+        self.assertEqual(benchmarks.compare(run(1.0), run(1.05))[0][5], "")
+
+
+class LoadTestTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        seeding.seed("tiny", counts=SeedInventoryTest.COUNTS)
+        self.state = loadtest.prepare()
+
+    def test_in_process_clients_serve_every_operation(self):
+        traffic = loadtest.Traffic(
+            loadtest.DEFAULT_MIX, self.state["paths"], self.state["product_ids"]
+        )
+        calls = [getattr(traffic, operation)() for operation in loadtest.DEFAULT_MIX]
+        with loadtest.in_process_settings():
+            client = loadtest.WSGIClient(loadtest.application("wsgi"), self.state)
+            self.assertEqual([client.send(call) for call in calls], [200] * 4)
+            client = loadtest.ASGIClient(loadtest.application("asgi"), self.state)
+            self.assertEqual(async_to_sync(client.send)(calls[0]), 200)
+        self.assertEqual(Product.objects.filter(description="Load test").count(), 2)
+
+    def test_cleanup_removes_the_session_and_account(self):
+        account = get_user_model().objects.get(pk=self.state["created_user"])
+        self.assertFalse(account.is_staff or account.is_superuser)
+        loadtest.cleanup(self.state)
+        self.assertFalse(Session.objects.exists())
+        self.assertFalse(get_user_model().objects.filter(pk=account.pk).exists())
+
+    def test_summary(self):
+        samples = [
+            loadtest.Sample("list", 200, 0.004),
+            loadtest.Sample("list", 200, 0.030),
+            loadtest.Sample("add", 500, 0.012),
+        ]
+        summary = loadtest.summarise(samples, duration=2)
+        self.assertEqual(summary["throughput"], 1.5)
+        self.assertEqual(summary["error_rate"], round(1 / 3, 4))
+        self.assertEqual(summary["histogram"]["<=5"], 1)
+        self.assertEqual(summary["histogram"]["<=50"], 1)
+        self.assertEqual(summary["operations"]["add"]["errors"], 1)
+        with self.assertRaises(ValueError):
+            loadtest.parse_mix("list=1,delete=2")
+
+
+# AsyncViewsTest routes to the async views whatever INVENTORY_ASYNC_VIEWS says.
+urlpatterns = [
+    path("login/", async_views.product_list, name="login"),
+    path("product/", async_views.product_list, name="product_list"),
+    path("product/search_product", async_views.search_product, name="search_product"),
+    path(
+        "inventory/search_inventory",
+        async_views.search_inventory,
+        name="search_inventory",
+    ),
+    path(
+        "inventory_transaction/",
+        async_views.inventory_transaction_list,
+        name="inventory_transaction_list",
+    ),
+    path(
+        "shipment_detail/",
+        async_views.shipment_detail_list,
+        name="shipment_detail_list",
+    ),
+    path("task/<int:pk>/", async_views.task_detail, name="task_detail"),
+]
+
+
+@override_settings(TEMPLATES=LOCMEM_TEMPLATES, ROOT_URLCONF=__name__)
+class AsyncViewsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        seeding.seed("tiny", counts=SeedInventoryTest.COUNTS)
+        self.user = get_user_model().objects.create_user(
+            username="async", password="password123"
+        )
+        self.client.force_login(self.user)
+        drill = Product.objects.create(product_name="Cordless Drill", unit_price=1)
+        Inventory.objects.create(
+            product=drill, warehouse=Warehouse.objects.first(), quantity=3
+        )
+
+    def sync_get(self, name, data=None):
+        with self.settings(ROOT_URLCONF="django_project.urls"):
+            return self.client.get(reverse(name), data).content.decode()
+
+    async def async_get(self, name, data=None, **kwargs):
+        response = await self.async_client.get(reverse(name, kwargs=kwargs), data)
+        return response.status_code, response.content.decode()
+
+    async def test_pages_match_the_sync_views(self):
+        await self.async_client.aforce_login(self.user)
+        pages = [
+            ("product_list", {"page_size": 5}),
+            ("inventory_transaction_list", {"page_size": 5}),
+            ("shipment_detail_list", {}),
+            ("search_product", {"query": "drill"}),
+            ("search_inventory", {"query": "drill"}),
+        ]
+        for name, data in pages:
+            with self.subTest(view=name):
+                expected = await sync_to_async(self.sync_get)(name, data)
+                self.assertTrue(expected.strip("|"))
+                self.assertEqual(await self.async_get(name, data), (200, expected))
+        # Walking on with the async view's cursor gives the sync view's next page.
+        status, content = await self.async_get(
+            "inventory_transaction_list", {"page_size": 5}
+        )
+        data = {"page_size": 5, "cursor": content.split("|")[1]}
+        name = "inventory_transaction_list"
+        expected = await sync_to_async(self.sync_get)(name, data)
+        self.assertEqual(await self.async_get(name, data), (200, expected))
+
+    async def test_detail_view(self):
+        await self.async_client.aforce_login(self.user)
+        assignee = await User.objects.acreate(username="assignee", role="Administrator")
+        task = await Task.objects.acreate(
+            title="Count bins",
+            description="",
+            due_date=timezone.now().date(),
+            assigned_to=assignee,
+        )
+        response = await self.async_get("task_detail", pk=task.pk)
+        self.assertEqual(response, (200, "Count bins assignee"))
+        status, _ = await self.async_get("task_detail", pk=task.pk + 1)
+        self.assertEqual(status, 404)
+
+    async def test_login_required(self):
+        response = await self.async_client.get(reverse("product_list"))
+        self.assertEqual(response.status_code, 302)
+        self.assertIn("next=/product/", response["Location"])
+
+
+@override_settings(INVENTORY_STOCK_FEED_COALESCE=0.05)
+class StockFeedTest(TestCase):
+    def setUp(self):
+        stockfeed._brokers.clear()
+        self.broker = stockfeed.get_broker()
+        self.product = Product.objects.create(product_name="Bolt", unit_price=1)
+        self.warehouse = Warehouse.objects.create(warehouse_name="Main", location="PH")
+        self.user = get_user_model().objects.create_user(
+            username="feed", password="password123"
+        )
+
+    def test_commits_publish_deltas(self):
+        cursor = self.broker.cursor()
+        rows = {"product": self.product, "warehouse": self.warehouse}
+        with self.captureOnCommitCallbacks(execute=True):
+            inventory = Inventory.objects.create(quantity=5, **rows)
+            InventoryTransaction.objects.create(
+                quantity=7, transaction_type="IN", **rows
+            )
+            StockAdjustment.objects.create(
+                quantity=-2, adjustment_date=timezone.now().date(), **rows
+            )
+        changes, cursor = self.broker.since(self.warehouse.pk, cursor)
+        self.assertEqual(len(changes), 3)
+        self.assertEqual(
+            stockfeed.merge(changes),
+            {"inventory": {self.product.pk: 5}, "stock": {self.product.pk: 5}},
+        )
+        # Writes whose transaction never commits publish nothing.
+        with self.captureOnCommitCallbacks(execute=False):
+            inventory.quantity = 1
+            inventory.save()
+        self.assertEqual(self.broker.since(self.warehouse.pk, cursor)[0], [])
+
+    def test_bulk_inventory_import_is_published(self):
+        other = Warehouse.objects.create(warehouse_name="Annex", location="PH")
+        Inventory.objects.create(
+            product=self.product, warehouse=self.warehouse, quantity=1
+        )
+        cursor = self.broker.cursor()
+        rows = [
+            {"product": self.product.pk, "warehouse": self.warehouse.pk, "quantity": 9},
+            {"product": self.product.pk, "warehouse": other.pk, "quantity": 4},
+        ]
+        with self.captureOnCommitCallbacks(execute=True):
+            import_rows("inventory", enumerate(rows, start=1))
+        changes, _ = self.broker.since(self.warehouse.pk, cursor)
+        self.assertEqual(changes, [{"inventory": {self.product.pk: 9}}])
+        changes, _ = self.broker.since(other.pk, cursor)
+        self.assertEqual(changes, [{"inventory": {self.product.pk: 4}}])
+
+    def test_cursor_outside_the_backlog_resets(self):
+        broker = stockfeed.LocalBroker(backlog=2)
+        start = broker.cursor()
+        for quantity in range(3):
+            broker.publish(1, {"stock": {1: quantity}})
+        self.assertIsNone(broker.since(1, start)[0])
+        self.assertIsNone(broker.since(1, "elsewhere-1")[0])
+        self.assertEqual(broker.since(2, start), ([], broker.cursor()))
+
+    async def test_stream_coalesces_a_burst(self):
+        gen = stockfeed.stream(self.broker, 1, self.broker.cursor(), lifetime=5)
+        self.assertIn(b"retry: ", await anext(gen))
+
+        def burst():
+            for delta in (3, 2, -1):
+                self.broker.publish(1, {"stock": {9: delta}})
+
+        loop = asyncio.get_running_loop()
+        message, _ = await asyncio.gather(
+            anext(gen), loop.run_in_executor(None, burst)
+        )
+        await gen.aclose()
+        self.assertIn(b"event: stock\n", message)
+        self.assertIn(b'data: {"warehouse":1,"stock":{"9":4}}', message)
+
+    def test_poll_and_wsgi_event_views(self):
+        self.client.force_login(self.user)
+        cursor = self.broker.cursor()
+        self.broker.publish(self.warehouse.pk, {"inventory": {self.product.pk: 8}})
+        url = reverse("stock_poll", args=[self.warehouse.pk])
+        body = self.client.get(url, {"cursor": cursor, "timeout": 1}).json()
+        self.assertEqual(body["changes"], {"inventory": {str(self.product.pk): 8}})
+        self.assertFalse(body["reset"])
+        body = self.client.get(url, {"cursor": body["cursor"], "timeout": 0}).json()
+        self.assertEqual(body["changes"], {})
+        body = self.client.get(url, {"cursor": "x-1", "timeout": 0}).json()
+        self.assertTrue(body["reset"])
+
+        url = reverse("stock_events", args=[self.warehouse.pk])
+        response = self.client.get(url, headers={"last-event-id": cursor})
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        self.assertIn(b"event: stock\n", response.content)
+        self.assertEqual(
+            self.client.get(reverse("stock_poll", args=[0])).status_code, 404
+        )
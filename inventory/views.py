@@ -13,8 +13,9 @@ from django.contrib.auth.decorators import login_required
 from django.contrib.auth import authenticate, login
 from django.http import JsonResponse
 from django.contrib.auth.decorators import user_passes_test
-from django.core.mail import EmailMessage
-from django.http import HttpResponse
+from django.http import HttpResponse, FileResponse, Http404, StreamingHttpResponse
+from django.views.decorators.http import require_GET, require_POST
+from django.db import router
 from .forms import (
     ProductForm,
     SupplierForm,
@@ -55,6 +56,14 @@ from .models import (
     Event,
     EmailAttachment
 )
+from .pagination import paginate
+from .relations import load_relations
+from .caching import cache_page_versioned, stats as page_cache_stats
+from .metrics import registry as metrics_registry
+from .profiling import list_profiles, profile_path
+from .search import search
+from .importers import DEFAULT_CHUNK_SIZE, IMPORTERS, import_rows, read_rows
+from .exports import EXPORT_CHUNK_SIZE, EXPORTS, iter_csv, write_xlsx
 
 
 def register(request):
@@ -93,25 +102,35 @@ def user_login(request):
 
 
 @login_required
+@cache_page_versioned(Product)
 def product_list(request):
     """
     @Description: This function retrieves a list of products from the database and renders them in the product list template.
     @Param: request (HttpRequest): The HTTP request object.
     @Return: HttpResponse: The rendered product list page containing the products.
     """
-    products = Product.objects.all()
-    return render(request, "product/product_list.html", {"products": products})
+    page = paginate(request, Product.objects.all())
+    return render(
+        request,
+        "product/product_list.html",
+        {"products": page.object_list, "page": page},
+    )
 
 
 @login_required
+@cache_page_versioned(Supplier)
 def supplier_list(request):
     """
     @Description: This function retrieves a list of suppliers from the database and renders them in the supplier list template.
     @Param: request (HttpRequest): The HTTP request object.
     @Return: HttpResponse: The rendered supplier list page containing the suppliers.
     """
-    suppliers = Supplier.objects.all()
-    return render(request, "supplier/supplier_list.html", {"suppliers": suppliers})
+    page = paginate(request, Supplier.objects.all())
+    return render(
+        request,
+        "supplier/supplier_list.html",
+        {"suppliers": page.object_list, "page": page},
+    )
 
 
 @login_required
@@ -121,23 +140,30 @@ def product_supplier_list(request):
     @Param: request (HttpRequest): The HTTP request object.
     @Return: HttpResponse: The rendered product supplier list page containing the product suppliers.
     """
-    product_suppliers = ProductSupplier.objects.all()
+    page = paginate(
+        request, load_relations(ProductSupplier.objects.all()), keys=("id",)
+    )
     return render(
         request,
         "product_supplier/product_supplier_list.html",
-        {"product_suppliers": product_suppliers},
+        {"product_suppliers": page.object_list, "page": page},
     )
 
 
 @login_required
+@cache_page_versioned(Warehouse)
 def warehouse_list(request):
     """
     @Description: This function retrieves a list of warehouses from the database and renders them in the warehouse list template.
     @Param: request (HttpRequest): The HTTP request object.
     @Return: HttpResponse: The rendered warehouse list page containing the warehouses.
     """
-    warehouses = Warehouse.objects.all()
-    return render(request, "warehouse/warehouse_list.html", {"warehouses": warehouses})
+    page = paginate(request, Warehouse.objects.all())
+    return render(
+        request,
+        "warehouse/warehouse_list.html",
+        {"warehouses": page.object_list, "page": page},
+    )
 
 
 @login_required
@@ -147,9 +173,11 @@ def inventory_list(request):
     @Param: request (HttpRequest): The HTTP request object.
     @Return: HttpResponse: The rendered inventory list page containing the inventories.
     """
-    inventories = Inventory.objects.all()
+    page = paginate(request, load_relations(Inventory.objects.all()), keys=("id",))
     return render(
-        request, "inventory/inventory_list.html", {"inventories": inventories}
+        request,
+        "inventory/inventory_list.html",
+        {"inventories": page.object_list, "page": page},
     )
 
 
@@ -160,8 +188,10 @@ def order_list(request):
     @Param: request (HttpRequest): The HTTP request object.
     @Return: HttpResponse: The rendered order list page containing the orders.
     """
-    orders = Order.objects.all()
-    return render(request, "order/order_list.html", {"orders": orders})
+    page = paginate(request, load_relations(Order.objects.all()))
+    return render(
+        request, "order/order_list.html", {"orders": page.object_list, "page": page}
+    )
 
 
 @login_required
@@ -171,10 +201,13 @@ def order_detail_list(request):
     @Param: request (HttpRequest): The HTTP request object.
     @Return: HttpResponse: The rendered order detail list page containing the order details.
     """
-    order_details = OrderDetail.objects.all()
+    page = paginate(
+        request, load_relations(OrderDetail.objects.all()), keys=("id",)
+    )
     return render(
-        request, "order_detail/order_detail_list.html", {
-            "order_details": order_details}
+        request,
+        "order_detail/order_detail_list.html",
+        {"order_details": page.object_list, "page": page},
     )
 
 
@@ -185,8 +218,12 @@ def customer_list(request):
     @Param: request (HttpRequest): The HTTP request object.
     @Return: HttpResponse: The rendered customer list page containing the customers.
     """
-    customers = Customer.objects.all()
-    return render(request, "customer/customer_list.html", {"customers": customers})
+    page = paginate(request, Customer.objects.all())
+    return render(
+        request,
+        "customer/customer_list.html",
+        {"customers": page.object_list, "page": page},
+    )
 
 
 @login_required
@@ -196,11 +233,11 @@ def customer_order_list(request):
     @Param: request (HttpRequest): The HTTP request object.
     @Return: HttpResponse: The rendered customer order list page containing the customer orders.
     """
-    customer_orders = CustomerOrder.objects.all()
+    page = paginate(request, load_relations(CustomerOrder.objects.all()))
     return render(
         request,
         "customer_order/customer_order_list.html",
-        {"customer_orders": customer_orders},
+        {"customer_orders": page.object_list, "page": page},
     )
 
 
@@ -211,8 +248,12 @@ def shipment_list(request):
     @Param: request (HttpRequest): The HTTP request object.
     @Return: HttpResponse: The rendered shipment list page containing the shipments.
     """
-    shipments = Shipment.objects.all()
-    return render(request, "shipment/shipment_list.html", {"shipments": shipments})
+    page = paginate(request, Shipment.objects.all())
+    return render(
+        request,
+        "shipment/shipment_list.html",
+        {"shipments": page.object_list, "page": page},
+    )
 
 
 @login_required
@@ -222,11 +263,13 @@ def shipment_detail_list(request):
     @Param: request (HttpRequest): The HTTP request object.
     @Return: HttpResponse: The rendered shipment detail list page containing the shipment details.
     """
-    shipment_details = ShipmentDetail.objects.all()
+    page = paginate(
+        request, load_relations(ShipmentDetail.objects.all()), keys=("id",)
+    )
     return render(
         request,
         "shipment_detail/shipment_detail_list.html",
-        {"shipment_details": shipment_details},
+        {"shipment_details": page.object_list, "page": page},
     )
 
 
@@ -237,11 +280,15 @@ def stock_adjustment_list(request):
     @Param: request (HttpRequest): The HTTP request object.
     @Return: HttpResponse: The rendered stock adjustment list page containing the stock adjustments.
     """
-    stock_adjustments = StockAdjustment.objects.all()
+    page = paginate(
+        request,
+        load_relations(StockAdjustment.objects.all()),
+        keys=("adjustment_date", "id"),
+    )
     return render(
         request,
         "stock_adjustment/stock_adjustment_list.html",
-        {"stock_adjustments": stock_adjustments},
+        {"stock_adjustments": page.object_list, "page": page},
     )
 
 
@@ -252,11 +299,15 @@ def inventory_transaction_list(request):
     @Param: request (HttpRequest): The HTTP request object.
     @Return: HttpResponse: The rendered inventory transaction list page containing the inventory transactions.
     """
-    inventory_transactions = InventoryTransaction.objects.all()
+    page = paginate(
+        request,
+        load_relations(InventoryTransaction.objects.all()),
+        keys=("transaction_date", "id"),
+    )
     return render(
         request,
         "inventory_transaction/inventory_transaction_list.html",
-        {"inventory_transactions": inventory_transactions},
+        {"inventory_transactions": page.object_list, "page": page},
     )
 
 
@@ -329,6 +380,7 @@ def delete_product(request, product_id):
 
 
 @login_required
+@cache_page_versioned(Product)
 def search_product(request):
     """
     @Description: This function handles the product search and renders the search_product.html template.
@@ -337,7 +389,7 @@ def search_product(request):
     """
     if request.method == "GET" and "query" in request.GET:
         query = request.GET.get("query")
-        products = Product.objects.filter(product_name__icontains=query)
+        products = search(Product.objects.all(), query)
         return render(
             request,
             "product/search_product.html",
@@ -406,6 +458,7 @@ def delete_supplier(request, supplier_id):
 
 
 @login_required
+@cache_page_versioned(Supplier)
 def search_supplier(request):
     """
     @Description: This function handles the supplier search and renders the search_supplier.html template.
@@ -414,7 +467,7 @@ def search_supplier(request):
     """
     if request.method == "GET" and "query" in request.GET:
         query = request.GET.get("query")
-        suppliers = Supplier.objects.filter(supplier_name__icontains=query)
+        suppliers = search(Supplier.objects.all(), query)
         return render(
             request,
             "supplier/search_supplier.html",
@@ -484,6 +537,7 @@ def delete_warehouse(request, warehouse_id):
 
 
 @login_required
+@cache_page_versioned(Warehouse)
 def search_warehouse(request):
     """
     @Description: This function handles the warehouse search and renders the search_warehouse.html template.
@@ -492,7 +546,7 @@ def search_warehouse(request):
     """
     if request.method == "GET" and "query" in request.GET:
         query = request.GET.get("query")
-        warehouses = Warehouse.objects.filter(warehouse_name__icontains=query)
+        warehouses = search(Warehouse.objects.all(), query)
         return render(
             request,
             "warehouse/search_warehouse.html",
@@ -570,8 +624,9 @@ def search_inventory(request):
     """
     if request.method == "GET" and "query" in request.GET:
         query = request.GET.get("query")
-        inventories = Inventory.objects.filter(
-            product__product_name__icontains=query)
+        inventories = search(
+            load_relations(Inventory.objects.all()), query, via="product"
+        )
         return render(
             request,
             "inventory/search_inventory.html",
@@ -645,7 +700,7 @@ def search_order(request):
     """
     if request.method == "GET" and "query" in request.GET:
         query = request.GET.get("query")
-        orders = Order.objects.filter(order_number__icontains=query)
+        orders = search(load_relations(Order.objects.all()), query, via="supplier")
         return render(
             request, "order/search_order.html", {
                 "orders": orders, "query": query}
@@ -722,8 +777,9 @@ def search_order_detail(request):
     """
     if request.method == "GET" and "query" in request.GET:
         query = request.GET.get("query")
-        order_details = OrderDetail.objects.filter(
-            order__order_number__icontains=query)
+        order_details = search(
+            load_relations(OrderDetail.objects.all()), query, via="product"
+        )
         return render(
             request,
             "order_detail/search_order_detail.html",
@@ -803,8 +859,8 @@ def search_product_supplier(request):
     """
     if request.method == "GET" and "query" in request.GET:
         query = request.GET.get("query")
-        product_suppliers = ProductSupplier.objects.filter(
-            product__product_name__icontains=query
+        product_suppliers = search(
+            load_relations(ProductSupplier.objects.all()), query, via="product"
         )
         return render(
             request,
@@ -882,7 +938,7 @@ def search_customer(request):
     """
     if request.method == "GET" and "query" in request.GET:
         query = request.GET.get("query")
-        customers = Customer.objects.filter(name__icontains=query)
+        customers = search(Customer.objects.all(), query)
         return render(
             request,
             "customer/search_customer.html",
@@ -960,8 +1016,9 @@ def search_customer_order(request):
     """
     if request.method == "GET" and "query" in request.GET:
         query = request.GET.get("query")
-        customer_orders = CustomerOrder.objects.filter(
-            order_number__icontains=query)
+        customer_orders = search(
+            load_relations(CustomerOrder.objects.all()), query, via="customer"
+        )
         return render(
             request,
             "customer_order/search_customer_order.html",
@@ -1038,7 +1095,7 @@ def search_shipment(request):
     """
     if request.method == "GET" and "query" in request.GET:
         query = request.GET.get("query")
-        shipments = Shipment.objects.filter(shipment_number__icontains=query)
+        shipments = search(Shipment.objects.all(), query)
         return render(
             request,
             "shipment/search_shipment.html",
@@ -1116,8 +1173,8 @@ def search_shipment_detail(request):
     """
     if request.method == "GET" and "query" in request.GET:
         query = request.GET.get("query")
-        shipment_details = ShipmentDetail.objects.filter(
-            shipment__shipment_number__icontains=query
+        shipment_details = search(
+            load_relations(ShipmentDetail.objects.all()), query, via="shipment"
         )
         return render(
             request,
@@ -1247,8 +1304,8 @@ def search_customer_order_detail(request):
     """
     if request.method == "GET" and "query" in request.GET:
         query = request.GET.get("query")
-        customer_order_details = CustomerOrderDetail.objects.filter(
-            order__order_number__icontains=query
+        customer_order_details = search(
+            load_relations(CustomerOrderDetail.objects.all()), query, via="product"
         )
         return render(
             request,
@@ -1270,8 +1327,10 @@ def task_list(request):
     @Returns:
     A rendered HTML page displaying a list of tasks.
     """
-    task = Task.objects.all()
-    return render(request, "task/task_list.html", {"tasks": task})
+    page = paginate(request, load_relations(Task.objects.all()), keys=("id",))
+    return render(
+        request, "task/task_list.html", {"tasks": page.object_list, "page": page}
+    )
 
 
 @login_required
@@ -1334,8 +1393,12 @@ def event_list(request):
     @Return:
     A rendered HTML page to display the event
     """
-    event = Event.objects.all()
-    return render(request, "event/event_list.html", {"event": event})
+    page = paginate(
+        request, load_relations(Event.objects.all()), keys=("start_time", "id")
+    )
+    return render(
+        request, "event/event_list.html", {"event": page.object_list, "page": page}
+    )
 
 
 @login_required
@@ -1395,29 +1458,131 @@ def is_admin(user):
 
 @user_passes_test(is_admin)
 def admin_compose_email(request):
+    """
+    @Description: This function queues an email composed by an administrator; the send_queued_email worker delivers it.
+    @Param: request (HttpRequest): The HTTP request object.
+    @Return: JsonResponse | HttpResponse: The id of the queued message on POST, otherwise the rendered admin_compose_email.html template.
+    """
     if request.method == 'POST':
         form = EmailAttachmentForm(request.POST, request.FILES)
         if form.is_valid():
             email_instance = form.save(commit=False)
-            email_instance.sender = request.user
+            email_instance.from_email = request.user.email
             email_instance.save()
-
-            email = EmailMessage(
-                subject=email_instance.subject,
-                body=email_instance.message,
-                from_email=request.user.email,
-                to=[email_instance.recipient],
-            )
-
-            if email_instance.attachment:
-                email.attach(email_instance.attachment.name, email_instance.attachment.read(
-                ), email_instance.attachment.content_type)
-
-            email.send()
-            # Redirect to a success page or wherever you want
-            return redirect('success')
+            return JsonResponse({"success": True, "id": email_instance.pk})
+        else:
+            errors = form.errors.as_json()
+            return JsonResponse({"success": False, "errors": errors}, status=400)
 
     else:
         form = EmailAttachmentForm()
 
     return render(request, 'admin_compose_email.html', {'form': form})
+
+
+@user_passes_test(is_admin)
+@require_POST
+def import_data_upload(request):
+    """
+    @Description: This function bulk imports an uploaded CSV or JSON Lines file of products, suppliers, customers or inventory.
+    @Param: request (HttpRequest): The HTTP request object with "model", an optional "format" and "chunk_size", and the upload in "file".
+    @Return: JsonResponse: Counts of created, updated and rejected rows, plus the errors of the first 100 rejected rows.
+    """
+    model = request.POST.get("model")
+    upload = request.FILES.get("file")
+    if model not in IMPORTERS or upload is None:
+        return JsonResponse(
+            {"success": False, "errors": "A model and a file are required."},
+            status=400,
+        )
+    fmt = request.POST.get("format") or upload.name.rsplit(".", 1)[-1].lower()
+    if fmt not in ("csv", "jsonl"):
+        return JsonResponse(
+            {"success": False, "errors": "Unsupported file format."}, status=400
+        )
+    try:
+        chunk_size = int(request.POST.get("chunk_size", DEFAULT_CHUNK_SIZE))
+    except ValueError:
+        chunk_size = DEFAULT_CHUNK_SIZE
+
+    errors = []
+
+    def on_error(line, row, row_errors):
+        if len(errors) < 100:
+            errors.append({"line": line, "errors": row_errors})
+
+    result = import_rows(
+        model, read_rows(upload, fmt), chunk_size=max(1, chunk_size), on_error=on_error
+    )
+    return JsonResponse({"success": True, **result.as_dict(), "errors": errors})
+
+
+@login_required
+@require_GET
+def export_rows(request, name):
+    """
+    @Description: This function streams every row of one model as a CSV or XLSX download.
+    @Param: request (HttpRequest): The HTTP request object, with an optional "query" filtering rows like the matching search view and "format" ("csv" or "xlsx").
+    @Param: name (str): The export name, matching the list view's URL prefix (e.g. "inventory_transaction").
+    @Return: StreamingHttpResponse | FileResponse: The exported rows, newest first.
+    """
+    export = EXPORTS.get(name)
+    if export is None:
+        raise Http404("Unknown export.")
+    fmt = request.GET.get("format", "csv")
+    # The rows stream after the view returns, so pin the database now.
+    rows = export.queryset(
+        query=request.GET.get("query"), using=router.db_for_read(export.model)
+    ).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    if fmt == "xlsx":
+        return FileResponse(
+            write_xlsx(export, rows), as_attachment=True, filename=f"{name}.xlsx"
+        )
+    if fmt != "csv":
+        return HttpResponse("Unsupported export format.", status=400)
+    response = StreamingHttpResponse(
+        iter_csv(export, rows), content_type="text/csv; charset=utf-8"
+    )
+    response["Content-Disposition"] = f'attachment; filename="{name}.csv"'
+    return response
+
+
+@user_passes_test(is_admin)
+@require_GET
+def metrics_report(request):
+    """
+    @Description: This function reports the request metrics collected by RequestMetricsMiddleware in this process.
+    @Param: request (HttpRequest): The HTTP request object.
+    @Return: JsonResponse: Per-view request count, p50/p95/p99 latency, queries and database time per request and duplicated SQL, plus the page cache hit/miss counts.
+    """
+    return JsonResponse(
+        {"views": metrics_registry.report(), "page_cache": page_cache_stats()}
+    )
+
+
+@user_passes_test(is_admin)
+@require_GET
+def profile_list(request):
+    """
+    @Description: This function lists the request profiles saved by ProfilingMiddleware, newest first.
+    @Param: request (HttpRequest): The HTTP request object.
+    @Return: HttpResponse: The rendered profile_list.html template.
+    """
+    return render(
+        request, "profiling/profile_list.html", {"profiles": list_profiles()[:100]}
+    )
+
+
+@user_passes_test(is_admin)
+@require_GET
+def profile_download(request, name):
+    """
+    @Description: This function downloads one saved request profile.
+    @Param: request (HttpRequest): The HTTP request object.
+    @Param: name (str): The profile's file name, as listed by profile_list.
+    @Return: FileResponse: The .prof or .collapsed file.
+    """
+    path = profile_path(name)
+    if path is None:
+        raise Http404("Unknown profile.")
+    return FileResponse(open(path, "rb"), as_attachment=True, filename=name)